@@ -0,0 +1,158 @@
+# api/monitoring/health.py
+# Node.js 서비스/DB 상태를 주기적으로 확인해 캐시하는 백그라운드 모니터
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import text
+from config.db import engine
+from config.http_clients import PLATFORM, http_clients
+from config.logging_config import logger
+from config.metrics import registry
+from config.settings import settings
+
+NODE_APP_DIR = "node_app_dir"
+NODE_SERVICE = "node_service"
+DATABASE = "database"
+
+HEALTH_CHECK_UP = registry.gauge(
+    "health_check_up",
+    "Result of the last background health check (1 ok, 0 failed)",
+    ["check"],
+)
+
+
+class HealthMonitor:
+    """HEALTH_CHECK_INTERVAL 마다 검사를 실행하고 결과를 보관
+
+    /health, /ready 와 Node.js 호출 경로는 보관된 결과만 읽으므로 요청 처리 중에는
+    파일시스템/네트워크 I/O 가 발생하지 않습니다.
+    """
+
+    def __init__(self):
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._started_at = time.monotonic()
+        self._last_run: Optional[float] = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        # 첫 요청부터 상태를 제공할 수 있도록 시작 시 한 번 실행
+        await self.run_checks()
+        self._task = asyncio.create_task(self._run(), name="health-monitor")
+        logger.info(f"Health monitor started (interval {settings.HEALTH_CHECK_INTERVAL}s)")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL)
+            try:
+                await self.run_checks()
+            except Exception as e:
+                logger.error(f"Health check run failed: {str(e)}")
+
+    async def run_checks(self) -> None:
+        checks = {
+            NODE_APP_DIR: self._check_node_app_dir,
+            NODE_SERVICE: self._check_node_service,
+            DATABASE: self._check_database,
+        }
+        results = await asyncio.gather(
+            *(self._timed(name, check) for name, check in checks.items())
+        )
+        for name, result in zip(checks, results):
+            previous = self._results.get(name)
+            if previous is not None and previous["ok"] != result["ok"]:
+                log = logger.info if result["ok"] else logger.warning
+                log(f"Health check '{name}' is now {'ok' if result['ok'] else 'failing'}")
+            self._results[name] = result
+            HEALTH_CHECK_UP.set(int(result["ok"]), check=name)
+        self._last_run = time.monotonic()
+
+    async def _timed(self, name: str, check) -> Dict[str, Any]:
+        started = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(check(), settings.HEALTH_CHECK_TIMEOUT)
+        except asyncio.TimeoutError:
+            error = f"Timed out after {settings.HEALTH_CHECK_TIMEOUT}s"
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        return {
+            "ok": error is None,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "error": error,
+            "checked_at": datetime.utcnow(),
+        }
+
+    async def _check_node_app_dir(self) -> None:
+        if not await asyncio.to_thread(os.path.isdir, settings.NODE_APP_DIR):
+            raise FileNotFoundError(
+                f"Node.js application directory not found: {settings.NODE_APP_DIR}"
+            )
+
+    async def _check_node_service(self) -> None:
+        if settings.HEALTH_NODE_HTTP_PATH:
+            response = await http_clients.get(PLATFORM).get(settings.HEALTH_NODE_HTTP_PATH)
+            if response.status_code >= 500:
+                raise RuntimeError(f"HTTP {response.status_code}")
+            return
+
+        # 기본은 TCP 연결 가능 여부만 확인
+        _, writer = await asyncio.open_connection("localhost", settings.NODE_APP_PORT)
+        writer.close()
+        await writer.wait_closed()
+
+    async def _check_database(self) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    def is_ok(self, name: str) -> bool:
+        """마지막 검사 결과 (아직 검사 전이면 True)"""
+        result = self._results.get(name)
+        return result is None or result["ok"]
+
+    def node_app_available(self) -> bool:
+        return self.is_ok(NODE_APP_DIR)
+
+    def _ready_checks(self) -> List[str]:
+        return [
+            name.strip()
+            for name in settings.HEALTH_READY_CHECKS.split(",")
+            if name.strip()
+        ]
+
+    def liveness(self) -> Dict[str, Any]:
+        """모니터 루프가 멈추지 않았는지 (이벤트 루프가 응답하는지) 확인"""
+        stale = (
+            self._task is not None
+            and self._last_run is not None
+            and time.monotonic() - self._last_run > settings.HEALTH_CHECK_INTERVAL * 3
+        )
+        return {
+            "status": "error" if stale else "ok",
+            "uptime_seconds": round(time.monotonic() - self._started_at, 1),
+        }
+
+    def readiness(self) -> Dict[str, Any]:
+        required = self._ready_checks()
+        ready = bool(self._results) and all(self.is_ok(name) for name in required)
+        return {
+            "status": "ready" if ready else "not_ready",
+            "checks": {
+                name: {**result, "required": name in required}
+                for name, result in self._results.items()
+            },
+        }
+
+
+# 글로벌 모니터 인스턴스
+health_monitor = HealthMonitor()
@@ -0,0 +1,35 @@
+# api/monitoring/routers.py
+# 메트릭/헬스체크 엔드포인트
+
+from fastapi import APIRouter
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, PlainTextResponse
+from . import services
+from .health import health_monitor
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 텍스트 포맷 메트릭"""
+    return PlainTextResponse(
+        services.render_metrics(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.get("/health")
+async def health():
+    """liveness: 프로세스와 백그라운드 모니터가 동작 중인지 (I/O 없음)"""
+    result = health_monitor.liveness()
+    return JSONResponse(result, status_code=200 if result["status"] == "ok" else 503)
+
+
+@router.get("/ready")
+async def ready():
+    """readiness: 마지막 백그라운드 검사 결과 기준 (I/O 없음)"""
+    result = health_monitor.readiness()
+    return JSONResponse(
+        jsonable_encoder(result),
+        status_code=200 if result["status"] == "ready" else 503,
+    )
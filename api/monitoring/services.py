@@ -0,0 +1,38 @@
+# api/monitoring/services.py
+# 메트릭 수집 대상 등록 및 출력
+
+from config.db import engine
+from config.logging_config import get_dropped_log_count
+from config.metrics import registry
+from scheduler.leader import leader_elector
+
+# === 수집 시점에 계산되는 게이지 ===
+registry.gauge(
+    "db_pool_size",
+    "Configured SQLAlchemy pool size",
+    callback=lambda: engine.pool.size(),
+)
+registry.gauge(
+    "db_pool_checked_out",
+    "SQLAlchemy connections currently checked out",
+    callback=lambda: engine.pool.checkedout(),
+)
+registry.gauge(
+    "db_pool_overflow",
+    "SQLAlchemy connections opened beyond pool_size",
+    callback=lambda: engine.pool.overflow(),
+)
+registry.gauge(
+    "log_records_dropped",
+    "Log records dropped because the logging queue was full",
+    callback=get_dropped_log_count,
+)
+registry.gauge(
+    "scheduler_is_leader",
+    "1 if this process holds the scheduler leader lock",
+    callback=lambda: int(leader_elector.is_leader),
+)
+
+
+def render_metrics() -> str:
+    return registry.render()
@@ -0,0 +1,152 @@
+# api/platform/circuit_breaker.py
+# Node.js Platform Service 호출 서킷 브레이커
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from config.logging_config import logger
+from config.metrics import registry
+from config.settings import settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 메트릭 값 (0: closed, 1: half_open, 2: open)
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않고 즉시 거절됨"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Circuit is open, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """closed → (연속 실패 또는 실패율 초과) → open → (probe 간격 경과) → half_open
+
+    half_open 에서는 probe 호출 하나만 통과시키고, 성공하면 closed, 실패하면 다시 open 으로
+    전환합니다. open 동안의 호출은 네트워크 대기 없이 CircuitOpenError 로 즉시 거절됩니다.
+    이벤트 루프 스레드에서만 사용하므로 락을 사용하지 않습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=settings.PLATFORM_CB_WINDOW_SIZE)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.PLATFORM_CB_ENABLED
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        logger.warning(f"Circuit breaker '{self.name}' {self.state} -> {state}")
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._outcomes.clear()
+            self._consecutive_failures = 0
+        self._probe_started = None
+
+    def before_call(self) -> None:
+        """호출 가능 여부 확인 (거절 시 CircuitOpenError)"""
+        if not self.enabled or self.state == CLOSED:
+            return
+
+        now = time.monotonic()
+        if self.state == OPEN:
+            remaining = self._opened_at + settings.PLATFORM_CB_OPEN_SECONDS - now
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(remaining)
+            self._transition(HALF_OPEN)
+
+        # half_open: probe 하나만 통과 (취소 등으로 결과가 기록되지 않은 probe 는 간격 후 교체)
+        if (
+            self._probe_started is not None
+            and now - self._probe_started < settings.PLATFORM_CB_OPEN_SECONDS
+        ):
+            self.rejected += 1
+            raise CircuitOpenError(
+                self._probe_started + settings.PLATFORM_CB_OPEN_SECONDS - now
+            )
+        self._probe_started = now
+
+    def record_success(self) -> None:
+        if not self.enabled:
+            return
+        if self.state == HALF_OPEN:
+            self._transition(CLOSED)
+            return
+        self._outcomes.append(True)
+        self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        if not self.enabled:
+            return
+        if self.state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        if self.state == OPEN:
+            return
+
+        self._outcomes.append(False)
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= settings.PLATFORM_CB_CONSECUTIVE_FAILURES:
+            self._transition(OPEN)
+        elif (
+            len(self._outcomes) >= settings.PLATFORM_CB_MIN_CALLS
+            and self.failure_rate() >= settings.PLATFORM_CB_FAILURE_RATE
+        ):
+            self._transition(OPEN)
+
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok in self._outcomes if not ok) / len(self._outcomes)
+
+    def reset(self) -> None:
+        """수동으로 closed 상태로 되돌림"""
+        self._transition(CLOSED)
+
+    def stats(self) -> Dict[str, Any]:
+        retry_after = None
+        if self.state == OPEN:
+            retry_after = max(
+                0.0,
+                self._opened_at + settings.PLATFORM_CB_OPEN_SECONDS - time.monotonic(),
+            )
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "state": self.state,
+            "failure_rate": self.failure_rate(),
+            "window_calls": len(self._outcomes),
+            "consecutive_failures": self._consecutive_failures,
+            "rejected": self.rejected,
+            "retry_after": retry_after,
+        }
+
+
+# Node.js Platform Service 용 글로벌 서킷 브레이커
+platform_circuit = CircuitBreaker("platform")
+
+registry.gauge(
+    "platform_circuit_state",
+    "Node platform circuit breaker state (0 closed, 1 half-open, 2 open)",
+    callback=lambda: _STATE_VALUES[platform_circuit.state],
+)
+registry.gauge(
+    "platform_circuit_rejected",
+    "Node platform calls rejected while the circuit was open",
+    callback=lambda: platform_circuit.rejected,
+)
@@ -0,0 +1,169 @@
+# api/platform/jobs.py
+# 비동기 모드 /run 작업 큐 및 백그라운드 워커
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import List, Optional, Tuple
+from fastapi import HTTPException
+from . import repositories, services
+from config.db import AsyncSessionLocal
+from config.logging_config import logger
+from config.settings import settings
+
+
+class RunJobWorker:
+    """접수된 run_job 을 큐에서 꺼내 디스패처로 실행하고 상태를 DB에 기록하는 워커
+
+    작업은 접수한 프로세스(owner)가 주기적으로 heartbeat 를 갱신합니다. heartbeat 가
+    RUN_JOB_STALE_SECONDS 이상 끊긴 작업만 종료된 프로세스의 작업으로 보고 복구하므로,
+    다른 프로세스가 실행 중인 작업을 실패 처리하거나 중복 실행하지 않습니다.
+    """
+
+    def __init__(self):
+        # 컨테이너 재시작 시 hostname/pid 가 같을 수 있으므로 임의 값을 덧붙임
+        self.identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def is_full(self) -> bool:
+        return self._queue is not None and self._queue.full()
+
+    async def start(self) -> None:
+        """워커 시작 및 종료된 프로세스에서 남은 작업 복구"""
+        if self.running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=settings.RUN_JOB_QUEUE_SIZE)
+        await self._recover_jobs()
+
+        for i in range(settings.RUN_JOB_WORKERS):
+            self._workers.append(
+                asyncio.create_task(self._worker(), name=f"run-job-worker-{i}")
+            )
+        self._heartbeat = asyncio.create_task(
+            self._heartbeat_loop(), name="run-job-heartbeat"
+        )
+        logger.info(f"Run job worker started with {settings.RUN_JOB_WORKERS} workers")
+
+    async def stop(self) -> None:
+        """워커 중지 (실행 중인 작업은 취소됨)"""
+        workers, self._workers = self._workers, []
+        if self._heartbeat is not None:
+            workers.append(self._heartbeat)
+            self._heartbeat = None
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        logger.info("Run job worker stopped")
+
+    def submit(self, job_id: uuid.UUID, operation: str) -> None:
+        """작업을 큐에 등록 (큐가 가득 차면 asyncio.QueueFull)"""
+        if self._queue is None:
+            raise RuntimeError("Run job worker is not started")
+        self._queue.put_nowait((job_id, operation))
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.RUN_JOB_HEARTBEAT_INTERVAL)
+            try:
+                async with AsyncSessionLocal() as db:
+                    await repositories.heartbeat_run_jobs(db, self.identity)
+            except Exception as e:
+                logger.error(f"Failed to update run job heartbeat: {str(e)}")
+            # 실행 중에 종료된 다른 프로세스의 작업도 이어받음
+            await self._recover_jobs()
+
+    async def _recover_jobs(self) -> None:
+        """heartbeat 가 끊긴 작업을 가져와 대기 중이던 작업은 다시 큐에 넣고,
+        실행 중이던 작업은 실패 처리"""
+        try:
+            async with AsyncSessionLocal() as db:
+                jobs = await repositories.claim_stale_run_jobs(
+                    db, self.identity, settings.RUN_JOB_STALE_SECONDS
+                )
+                for job in jobs:
+                    if job.status == "running" or self._queue.full():
+                        await repositories.finish_run_job(
+                            db,
+                            job.id,
+                            status="failed",
+                            duration_ms=0,
+                            error="Interrupted by application restart",
+                        )
+                    else:
+                        self._queue.put_nowait((job.id, job.operation))
+                if jobs:
+                    logger.warning(f"Recovered {len(jobs)} run jobs from stopped processes")
+        except Exception as e:
+            logger.error(f"Failed to recover run jobs: {str(e)}")
+
+    async def _worker(self) -> None:
+        while True:
+            job_id, operation = await self._queue.get()
+            try:
+                await self._execute(job_id, operation)
+            except Exception as e:
+                logger.error(f"Run job {job_id} could not be recorded: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, job_id: uuid.UUID, operation: str) -> None:
+        async with AsyncSessionLocal() as db:
+            await repositories.mark_run_job_running(db, job_id)
+
+        started = time.perf_counter()
+        status, status_code, result, error = await self._run(operation)
+        duration_ms = int((time.perf_counter() - started) * 1000)
+
+        async with AsyncSessionLocal() as db:
+            await repositories.finish_run_job(
+                db,
+                job_id,
+                status=status,
+                duration_ms=duration_ms,
+                status_code=status_code,
+                result=result,
+                error=error,
+            )
+        logger.info(f"Run job {job_id} ({operation}) {status} in {duration_ms}ms")
+
+    async def _run(self, operation: str) -> Tuple[str, int, Optional[dict], Optional[str]]:
+        try:
+            result = await services.dispatch_platform_operation(operation, trigger="async")
+            return "succeeded", 200, result, None
+        except HTTPException as e:
+            return "failed", e.status_code, None, str(e.detail)
+        except Exception as e:
+            return "failed", 500, None, str(e)
+
+
+# 글로벌 워커 인스턴스
+run_job_worker = RunJobWorker()
+
+
+async def submit_run_job(db, operation_type: str):
+    """작업을 run_job 으로 저장하고 백그라운드 워커에 등록"""
+    if operation_type not in services.OPERATION_TYPES:
+        logger.error(f"Invalid parameter received: {operation_type}")
+        raise HTTPException(status_code=400, detail="Invalid parameter")
+
+    if not run_job_worker.running or run_job_worker.is_full():
+        raise HTTPException(status_code=503, detail="Run job queue is unavailable")
+
+    job = await repositories.create_run_job(db, operation_type, run_job_worker.identity)
+    try:
+        run_job_worker.submit(job.id, operation_type)
+    except asyncio.QueueFull:
+        await repositories.finish_run_job(
+            db, job.id, status="failed", duration_ms=0, error="Run job queue is full"
+        )
+        raise HTTPException(status_code=503, detail="Run job queue is full")
+    return job
@@ -1,5 +1,16 @@
 # api/platform/models.py
-from sqlalchemy import Boolean, Column, Integer, String, DateTime
+import uuid
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Index,
+    JSON,
+    Text,
+    Uuid,
+)
 from sqlalchemy.sql import func
 
 from config.db import Base
@@ -14,3 +25,33 @@ class Platform(Base):
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     status = Column(String(50), nullable=False)
+
+    __table_args__ = (
+        # active 필터 + id 순 keyset 페이지네이션용
+        Index("platform_active_id_idx", "active", "id"),
+    )
+
+
+class RunJob(Base):
+    """비동기 모드(/run/{param}?async_mode=true)로 접수된 작업의 실행 상태"""
+
+    __tablename__ = "run_job"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    operation = Column(String(50), nullable=False)  # 'valid' 또는 'sync'
+    status = Column(String(20), nullable=False, default="queued")
+    status_code = Column(Integer)
+    result = Column(JSON)
+    error = Column(Text)
+    created_at = Column(DateTime, default=func.now())
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    duration_ms = Column(Integer)
+    # 작업을 큐에 보관/실행 중인 프로세스 식별자와 마지막 heartbeat 시각
+    owner = Column(String(100))
+    heartbeat_at = Column(DateTime)
+
+    __table_args__ = (
+        # 복구 대상(queued/running) 조회용
+        Index("run_job_status_heartbeat_idx", "status", "heartbeat_at"),
+    )
@@ -1,30 +1,64 @@
-from sqlalchemy import select
+import uuid
+from datetime import timedelta
+from typing import Any, List, Optional
+from sqlalchemy import String, any_, bindparam, delete, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from . import models
 
 
 async def create_platform(db: AsyncSession, platform):
-    db_platform = models.Platform(**platform.model_dump())
-    db.add(db_platform)
+    query = (
+        insert(models.Platform)
+        .values(**platform.model_dump())
+        .returning(models.Platform)
+    )
+    result = await db.execute(query)
+    db_platform = result.scalar_one()
     await db.commit()
-    await db.refresh(db_platform)
     return db_platform
 
 
-async def get_platforms(db: AsyncSession, skip: int = 0, limit: int = 100):
-    query = select(models.Platform).offset(skip).limit(limit)
+async def get_platforms(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+):
+    """after_id 가 주어지면 keyset(커서) 방식, 아니면 기존 offset 방식으로 조회"""
+    query = select(models.Platform).order_by(models.Platform.id).limit(limit)
+    if after_id is not None:
+        query = query.where(models.Platform.id > after_id)
+    else:
+        query = query.offset(skip)
     result = await db.execute(query)
     return result.scalars().all()
 
 
-async def get_platforms_active(db: AsyncSession, skip: int = 0, limit: int = 100):
+async def get_platforms_active(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+):
     query = (
         select(models.Platform)
         .where(models.Platform.active == True)
-        .offset(skip)
+        .order_by(models.Platform.id)
         .limit(limit)
     )
+    if after_id is not None:
+        query = query.where(models.Platform.id > after_id)
+    else:
+        query = query.offset(skip)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def get_run_targets(db: AsyncSession, names: Optional[List[str]] = None):
+    """names 가 있으면 해당 플랫폼을 한 번의 WHERE name = ANY(...) 로, 없으면 활성 플랫폼 전체 조회"""
+    query = select(models.Platform).order_by(models.Platform.id)
+    if names:
+        query = query.where(
+            models.Platform.name == any_(bindparam("names", names, type_=ARRAY(String)))
+        )
+    else:
+        query = query.where(models.Platform.active == True)
     result = await db.execute(query)
     return result.scalars().all()
 
@@ -36,24 +70,132 @@ async def get_platform(db: AsyncSession, platform_id: int):
 
 
 async def update_platform(db: AsyncSession, platform_id: int, platform):
-    query = select(models.Platform).where(models.Platform.id == platform_id)
+    query = (
+        update(models.Platform)
+        .where(models.Platform.id == platform_id)
+        .values(**platform.model_dump())
+        .returning(models.Platform)
+    )
     result = await db.execute(query)
     db_platform = result.scalar_one_or_none()
-
-    if db_platform:
-        for key, value in platform.model_dump().items():
-            setattr(db_platform, key, value)
-        await db.commit()
-        await db.refresh(db_platform)
+    await db.commit()
     return db_platform
 
 
 async def delete_platform(db: AsyncSession, platform_id: int):
-    query = select(models.Platform).where(models.Platform.id == platform_id)
+    query = (
+        delete(models.Platform)
+        .where(models.Platform.id == platform_id)
+        .returning(models.Platform)
+    )
     result = await db.execute(query)
     db_platform = result.scalar_one_or_none()
-
-    if db_platform:
-        await db.delete(db_platform)
-        await db.commit()
+    await db.commit()
     return db_platform
+
+
+async def create_run_job(db: AsyncSession, operation: str, owner: Optional[str] = None):
+    db_job = models.RunJob(
+        operation=operation, status="queued", owner=owner, heartbeat_at=func.now()
+    )
+    db.add(db_job)
+    await db.commit()
+    await db.refresh(db_job)
+    return db_job
+
+
+async def get_run_job(db: AsyncSession, job_id: uuid.UUID):
+    query = select(models.RunJob).where(models.RunJob.id == job_id)
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def get_run_jobs(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    operation: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+):
+    query = select(models.RunJob)
+    if status:
+        query = query.where(models.RunJob.status == status)
+    if operation:
+        query = query.where(models.RunJob.operation == operation)
+    query = query.order_by(models.RunJob.created_at.desc()).offset(skip).limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def heartbeat_run_jobs(db: AsyncSession, owner: str) -> int:
+    """owner 가 보유한 queued/running 작업의 heartbeat 갱신"""
+    query = (
+        update(models.RunJob)
+        .where(
+            models.RunJob.owner == owner,
+            models.RunJob.status.in_(["queued", "running"]),
+        )
+        .values(heartbeat_at=func.now())
+    )
+    result = await db.execute(query)
+    await db.commit()
+    return result.rowcount
+
+
+async def claim_stale_run_jobs(db: AsyncSession, owner: str, stale_seconds: int):
+    """heartbeat 가 stale_seconds 이상 끊긴 queued/running 작업을 owner 로 가져옴
+
+    단일 UPDATE ... RETURNING 이므로 여러 프로세스가 동시에 복구해도 한 곳만 가져갑니다.
+    """
+    query = (
+        update(models.RunJob)
+        .where(
+            models.RunJob.status.in_(["queued", "running"]),
+            or_(
+                models.RunJob.heartbeat_at.is_(None),
+                models.RunJob.heartbeat_at
+                < func.now() - timedelta(seconds=stale_seconds),
+            ),
+        )
+        .values(owner=owner, heartbeat_at=func.now())
+        .returning(models.RunJob)
+    )
+    result = await db.execute(query)
+    jobs = sorted(result.scalars().all(), key=lambda job: job.created_at)
+    await db.commit()
+    return jobs
+
+
+async def mark_run_job_running(db: AsyncSession, job_id: uuid.UUID):
+    query = (
+        update(models.RunJob)
+        .where(models.RunJob.id == job_id)
+        .values(status="running", started_at=func.now())
+    )
+    await db.execute(query)
+    await db.commit()
+
+
+async def finish_run_job(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+    status: str,
+    duration_ms: int,
+    status_code: Optional[int] = None,
+    result: Optional[Any] = None,
+    error: Optional[str] = None,
+):
+    query = (
+        update(models.RunJob)
+        .where(models.RunJob.id == job_id)
+        .values(
+            status=status,
+            status_code=status_code,
+            result=result,
+            error=error,
+            finished_at=func.now(),
+            duration_ms=duration_ms,
+        )
+    )
+    await db.execute(query)
+    await db.commit()
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from . import services, schemas
+from typing import Optional
+from uuid import UUID
+from . import jobs, services, schemas
 from config.db import get_db
-from config.logging_config import logger
 
 router = APIRouter()
 
@@ -16,15 +17,34 @@ async def create_platform(
 
 @router.get("/platforms/", response_model=list[schemas.Platform])
 async def read_platforms(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
 ):
-    platforms = await services.get_platforms_list(db=db, skip=skip, limit=limit)
+    """after_id 를 주면 keyset 페이지네이션, 다음 커서는 X-Next-Cursor 헤더로 반환"""
+    platforms = await services.get_platforms_list(
+        db=db, skip=skip, limit=limit, after_id=after_id
+    )
+    if len(platforms) == limit:
+        response.headers["X-Next-Cursor"] = str(platforms[-1].id)
     return platforms
 
 
 @router.get("/platforms/active", response_model=list[schemas.Platform])
-async def get_active_platforms_list(db: AsyncSession = Depends(get_db)):
-    active_platforms = await services.get_active_platforms(db)
+async def get_active_platforms_list(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    active_platforms = await services.get_active_platforms(
+        db, skip=skip, limit=limit, after_id=after_id
+    )
+    if len(active_platforms) == limit:
+        response.headers["X-Next-Cursor"] = str(active_platforms[-1].id)
     return active_platforms
 
 
@@ -58,15 +78,60 @@ async def delete_platform(platform_id: int, db: AsyncSession = Depends(get_db)):
     return {"message": "Platform deleted"}
 
 
-@router.post("/run/{param}")
-async def run_platforms(param: str):
-    if param not in ["valid", "sync"]:
-        logger.error(f"Invalid parameter received: {param}")
-        raise HTTPException(status_code=400, detail="Invalid parameter")
+@router.post("/run", response_model=schemas.RunResponse)
+async def run_platforms_fanout(
+    run_request: schemas.RunRequest, db: AsyncSession = Depends(get_db)
+):
+    """플랫폼별로 작업을 병렬 실행하고 플랫폼별 상태/소요 시간/에러 반환"""
+    return await services.dispatch_platform_fanout(db, run_request)
+
+
+@router.get("/run/circuit", response_model=schemas.CircuitState)
+async def read_circuit_state():
+    """Node.js Platform Service 서킷 브레이커 상태를 조회합니다."""
+    return services.get_circuit_state()
+
+
+@router.post("/run/circuit/reset", response_model=schemas.CircuitState)
+async def reset_circuit():
+    """서킷 브레이커를 closed 상태로 되돌립니다."""
+    return services.reset_circuit()
 
-    result = await services.execute_platform_operation(param)
 
-    return {
-        "message": f"Task {param} executed successfully",
-        "result": result,
-    }
+@router.get("/run/jobs", response_model=list[schemas.RunJob])
+async def read_run_jobs(
+    status: Optional[schemas.RunJobStatus] = None,
+    operation: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db),
+):
+    return await services.get_run_job_list(
+        db=db, status=status, operation=operation, skip=skip, limit=limit
+    )
+
+
+@router.get("/run/jobs/{job_id}", response_model=schemas.RunJob)
+async def read_run_job(job_id: UUID, db: AsyncSession = Depends(get_db)):
+    db_job = await services.get_run_job_by_id(db=db, job_id=job_id)
+    if db_job is None:
+        raise HTTPException(status_code=404, detail="Run job not found")
+    return db_job
+
+
+@router.post("/run/{param}")
+async def run_platforms(
+    param: str,
+    response: Response,
+    async_mode: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    # 비동기 모드: 작업을 큐에 등록하고 즉시 202 반환
+    if async_mode:
+        job = await jobs.submit_run_job(db, param)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return schemas.RunJobAccepted(
+            message=f"Task {param} accepted", job_id=job.id, status=job.status
+        )
+
+    return await services.dispatch_platform_operation(param)
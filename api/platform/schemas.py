@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import List, Literal
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Any, List, Literal, Optional
+from uuid import UUID
 
 
 class PlatformBase(BaseModel):
@@ -24,5 +26,59 @@ class Platform(PlatformBase):
 
 
 class RunRequest(BaseModel):
-    names: List[str]
+    names: List[str] = Field(default_factory=list)  # 비어 있으면 활성 플랫폼 전체
     type: Literal["valid", "sync"]
+
+
+class PlatformRunResult(BaseModel):
+    name: str
+    status: Literal["success", "error", "skipped"]
+    status_code: Optional[int] = None
+    duration_ms: int = 0
+    response_size: Optional[int] = None
+    error: Optional[str] = None
+    result: Optional[Any] = None
+
+
+class RunResponse(BaseModel):
+    type: str
+    total: int
+    succeeded: int
+    failed: int
+    results: List[PlatformRunResult]
+
+
+RunJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class RunJob(BaseModel):
+    id: UUID
+    operation: str
+    status: RunJobStatus
+    status_code: Optional[int] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
+class RunJobAccepted(BaseModel):
+    message: str
+    job_id: UUID
+    status: RunJobStatus
+
+
+class CircuitState(BaseModel):
+    name: str
+    enabled: bool
+    state: Literal["closed", "open", "half_open"]
+    failure_rate: float
+    window_calls: int
+    consecutive_failures: int
+    rejected: int
+    retry_after: Optional[float] = None
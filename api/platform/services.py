@@ -1,6 +1,11 @@
+import asyncio
+import math
+import time
 import httpx
+from datetime import datetime
 from fastapi import HTTPException
 from . import schemas
+from .circuit_breaker import CircuitOpenError, platform_circuit
 from .repositories import (
     create_platform,
     get_platforms,
@@ -8,22 +13,49 @@ from .repositories import (
     get_platform,
     update_platform,
     delete_platform,
+    get_run_job,
+    get_run_jobs,
+    get_run_targets,
 )
+from api.monitoring.health import health_monitor
+from api.run_history.services import record_run
+from config.http_clients import PLATFORM, http_clients
 from config.logging_config import logger
+from config.metrics import PLATFORM_REQUEST_DURATION, PLATFORM_REQUESTS
 from config.settings import settings
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+
+# /run 으로 실행 가능한 작업 종류
+OPERATION_TYPES = ("valid", "sync")
+
+
+class PlatformCircuitOpenError(HTTPException):
+    """서킷이 열려 있어 Node.js 호출 없이 거절된 경우의 503"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            status_code=503,
+            detail="Platform service circuit is open",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
 
 
 async def create_new_platform(db, platform: schemas.PlatformCreate):
     return await create_platform(db=db, platform=platform)
 
 
-async def get_platforms_list(db, skip: int = 0, limit: int = 100):
-    return await get_platforms(db=db, skip=skip, limit=limit)
+async def get_platforms_list(
+    db, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+):
+    return await get_platforms(db=db, skip=skip, limit=limit, after_id=after_id)
 
 
-async def get_active_platforms(db):
-    platforms = await get_platforms_active(db=db)
+async def get_active_platforms(
+    db, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+):
+    platforms = await get_platforms_active(
+        db=db, skip=skip, limit=limit, after_id=after_id
+    )
     return [platform for platform in platforms if platform.active]
 
 
@@ -39,13 +71,52 @@ async def remove_platform(db, platform_id: int):
     return await delete_platform(db=db, platform_id=platform_id)
 
 
+def get_circuit_state() -> Dict[str, Any]:
+    return platform_circuit.stats()
+
+
+def reset_circuit() -> Dict[str, Any]:
+    platform_circuit.reset()
+    return platform_circuit.stats()
+
+
+async def get_run_job_by_id(db, job_id):
+    return await get_run_job(db=db, job_id=job_id)
+
+
+async def get_run_job_list(
+    db, status: str = None, operation: str = None, skip: int = 0, limit: int = 100
+):
+    return await get_run_jobs(
+        db=db, status=status, operation=operation, skip=skip, limit=limit
+    )
+
+
+def _record_platform_call(operation_type: str, status_code, started: float) -> None:
+    PLATFORM_REQUEST_DURATION.observe(
+        time.perf_counter() - started, operation=operation_type
+    )
+    PLATFORM_REQUESTS.inc(operation=operation_type, status_code=status_code)
+
+
 # 비상용 platfrom service 호출
-async def execute_platform_operation(operation_type: str):
+async def execute_platform_operation(
+    operation_type: str, platform_name: Optional[str] = None
+):
+    """Node.js Platform Service 작업 호출 (platform_name 이 있으면 해당 플랫폼만 대상)"""
+    result, _ = await _execute_platform_operation(operation_type, platform_name)
+    return result
+
+
+async def _execute_platform_operation(
+    operation_type: str, platform_name: Optional[str] = None
+) -> Tuple[Dict[str, Any], int]:
+    """execute_platform_operation 과 같고 응답 본문 크기(byte)를 함께 반환"""
     logger.info(f"Starting {operation_type} operation")
 
     try:
-        # Node.js Platform Service 앱 경로 검증
-        if not settings.verify_node_app_path():
+        # Node.js Platform Service 앱 경로 검증 (백그라운드 모니터의 캐시된 결과)
+        if not health_monitor.node_app_available():
             logger.error(
                 f"Node.js application directory not found: {settings.NODE_APP_DIR}"
             )
@@ -55,39 +126,61 @@ async def execute_platform_operation(operation_type: str):
 
         #  Node.js Platform Service 앱 URL 구성
         node_app_url = f"http://localhost:{settings.NODE_APP_PORT}/{operation_type}"
-        logger.info(f"Sending request to platform service: {node_app_url}")
-
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(node_app_url, timeout=60.0)
-
-                if response.status_code == 200:
-                    result_data = response.json()
-                    logger.info(f"Successfully completed {operation_type} operation")
-                    return {
-                        "message": f"Task {operation_type} executed successfully",
-                        "result": result_data,
-                    }
-                else:
-                    error_message = response.text
-                    logger.error(f"Platform service error: {error_message}")
-                    raise HTTPException(
-                        status_code=response.status_code,
-                        detail=f"Platform service error: {error_message}",
-                    )
-
-            except httpx.ReadTimeout:
-                logger.error(f"Request to platform service timed out after 60 seconds")
-                raise HTTPException(
-                    status_code=504, detail="Platform service request timed out"
-                )
+        params = {}
+        if platform_name:
+            params[settings.NODE_PLATFORM_PARAM] = platform_name
+        logger.info(f"Sending request to platform service: {node_app_url} {params}")
+
+        # 서킷이 열려 있으면 Node.js 호출 없이 즉시 503
+        try:
+            platform_circuit.before_call()
+        except CircuitOpenError as e:
+            PLATFORM_REQUESTS.inc(operation=operation_type, status_code="circuit_open")
+            raise PlatformCircuitOpenError(e.retry_after)
+
+        client = http_clients.get(PLATFORM)
+        started = time.perf_counter()
+        try:
+            response = await client.get(f"/{operation_type}", params=params)
+            _record_platform_call(operation_type, response.status_code, started)
+            if response.status_code >= 500:
+                platform_circuit.record_failure()
+            else:
+                platform_circuit.record_success()
 
-            except httpx.RequestError as e:
-                logger.error(f"Failed to connect to platform service: {str(e)}")
+            if response.status_code == 200:
+                result_data = response.json()
+                logger.info(f"Successfully completed {operation_type} operation")
+                return {
+                    "message": f"Task {operation_type} executed successfully",
+                    "result": result_data,
+                }, len(response.content)
+            else:
+                error_message = response.text
+                logger.error(f"Platform service error: {error_message}")
                 raise HTTPException(
-                    status_code=503, detail=f"Platform service unavailable: {str(e)}"
+                    status_code=response.status_code,
+                    detail=f"Platform service error: {error_message}",
                 )
 
+        except httpx.ReadTimeout:
+            _record_platform_call(operation_type, "timeout", started)
+            platform_circuit.record_failure()
+            logger.error(
+                f"Request to platform service timed out after {settings.NODE_HTTP_TIMEOUT} seconds"
+            )
+            raise HTTPException(
+                status_code=504, detail="Platform service request timed out"
+            )
+
+        except httpx.RequestError as e:
+            _record_platform_call(operation_type, "unavailable", started)
+            platform_circuit.record_failure()
+            logger.error(f"Failed to connect to platform service: {str(e)}")
+            raise HTTPException(
+                status_code=503, detail=f"Platform service unavailable: {str(e)}"
+            )
+
     except HTTPException:
         raise
 
@@ -97,3 +190,149 @@ async def execute_platform_operation(operation_type: str):
             status_code=500,
             detail=f"Failed to execute {operation_type} operation: {str(e)}",
         )
+
+
+# /run 라우터와 스케줄러가 공유하는 in-process 디스패처
+async def dispatch_platform_operation(
+    operation_type: str, trigger: str = "manual"
+) -> Dict[str, Any]:
+    """작업 종류를 검증한 뒤 Node.js Platform Service 작업을 직접 실행합니다.
+
+    HTTP loopback 없이 라우터와 스케줄러가 동일한 결과/에러 형태(HTTPException)를 공유하며,
+    실행 결과는 trigger(scheduled/manual/async)와 함께 run_history 에 기록됩니다.
+    서킷이 열려 즉시 거절된 호출은 장애 중 DB 쓰기가 몰리지 않도록 기록하지 않습니다
+    (거절 수는 platform_requests_total{status_code="circuit_open"} 로 집계).
+    """
+    if operation_type not in OPERATION_TYPES:
+        logger.error(f"Invalid parameter received: {operation_type}")
+        raise HTTPException(status_code=400, detail="Invalid parameter")
+
+    started_at = datetime.utcnow()
+    started = time.perf_counter()
+    status, status_code, error, response_size = "cancelled", None, "Cancelled", None
+    record = True
+    try:
+        result, response_size = await _execute_platform_operation(operation_type)
+        status, status_code, error = "success", 200, None
+    except PlatformCircuitOpenError:
+        record = False
+        raise
+    except HTTPException as e:
+        status, status_code, error = "error", e.status_code, str(e.detail)
+        raise
+    finally:
+        if record:
+            await record_run(
+                operation_type,
+                trigger,
+                started_at,
+                int((time.perf_counter() - started) * 1000),
+                status,
+                status_code=status_code,
+                error=error,
+                response_size=response_size,
+            )
+
+    return {
+        "message": f"Task {operation_type} executed successfully",
+        "result": result,
+    }
+
+
+async def _run_platform_operation(
+    semaphore: asyncio.Semaphore, operation_type: str, platform_name: str
+) -> schemas.PlatformRunResult:
+    """동시 실행 상한 내에서 플랫폼 하나의 작업을 실행하고 결과/소요 시간 반환"""
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            result, response_size = await _execute_platform_operation(
+                operation_type, platform_name
+            )
+            return schemas.PlatformRunResult(
+                name=platform_name,
+                status="success",
+                status_code=200,
+                duration_ms=int((time.perf_counter() - started) * 1000),
+                response_size=response_size,
+                result=result.get("result"),
+            )
+        except HTTPException as e:
+            return schemas.PlatformRunResult(
+                name=platform_name,
+                status="error",
+                status_code=e.status_code,
+                duration_ms=int((time.perf_counter() - started) * 1000),
+                error=str(e.detail),
+            )
+
+
+# 플랫폼별 병렬 실행 (RunRequest)
+async def dispatch_platform_fanout(
+    db, run_request: schemas.RunRequest, trigger: str = "manual"
+) -> schemas.RunResponse:
+    """요청한 플랫폼(없으면 활성 플랫폼 전체)에 작업을 동시에 실행하고 플랫폼별 결과 반환
+
+    느린 플랫폼 하나가 다른 플랫폼의 실행을 지연시키지 않도록 PLATFORM_RUN_CONCURRENCY
+    상한 안에서 병렬로 호출합니다.
+    """
+    operation_type = run_request.type
+    platforms = await get_run_targets(db=db, names=run_request.names or None)
+    # 조회 트랜잭션을 끝내 팬아웃 동안 커넥션을 idle in transaction 으로 잡고 있지 않도록 함
+    await db.commit()
+
+    results: List[schemas.PlatformRunResult] = []
+    found = {platform.name for platform in platforms}
+    for name in run_request.names:
+        if name not in found:
+            results.append(
+                schemas.PlatformRunResult(
+                    name=name, status="error", status_code=404, error="Platform not found"
+                )
+            )
+
+    targets = []
+    for platform in platforms:
+        if platform.active:
+            targets.append(platform.name)
+        else:
+            results.append(
+                schemas.PlatformRunResult(
+                    name=platform.name, status="skipped", error="Platform is inactive"
+                )
+            )
+
+    started_at = datetime.utcnow()
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(max(1, settings.PLATFORM_RUN_CONCURRENCY))
+    results.extend(
+        await asyncio.gather(
+            *(_run_platform_operation(semaphore, operation_type, name) for name in targets)
+        )
+    )
+
+    succeeded = sum(1 for result in results if result.status == "success")
+    failed = sum(1 for result in results if result.status == "error")
+    logger.info(
+        f"{operation_type} fan-out finished: {succeeded} succeeded, {failed} failed "
+        f"of {len(results)} platforms"
+    )
+    # 팬아웃 전체를 실행 1회로 기록 (플랫폼별 결과는 응답에 포함)
+    error_codes = [result.status_code for result in results if result.status == "error"]
+    await record_run(
+        operation_type,
+        trigger,
+        started_at,
+        int((time.perf_counter() - started) * 1000),
+        "error" if failed else "success",
+        status_code=error_codes[0] if error_codes else 200,
+        error=f"{failed} of {len(results)} platforms failed" if failed else None,
+        response_size=sum(result.response_size or 0 for result in results),
+    )
+    return schemas.RunResponse(
+        type=operation_type,
+        total=len(results),
+        succeeded=succeeded,
+        failed=failed,
+        results=results,
+    )
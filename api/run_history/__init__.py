@@ -0,0 +1 @@
+# api/run_history/__init__.py
@@ -0,0 +1,31 @@
+# api/run_history/models.py
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Text
+
+from config.db import Base
+
+
+class RunHistory(Base):
+    """스케줄러/수동 실행 1회당 1행 (소요 시간, 결과, 응답 크기)
+
+    trigger: scheduled(스케줄러), manual(/run 동기 호출), async(/run 비동기 작업)
+    status: success, error, cancelled
+    """
+
+    __tablename__ = "run_history"
+
+    id = Column(BigInteger, primary_key=True)
+    task_type = Column(String(50), nullable=False)  # 'valid' 또는 'sync'
+    trigger = Column(String(20), nullable=False)
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    duration_ms = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False)
+    status_code = Column(Integer)
+    error = Column(Text)
+    response_size = Column(Integer)
+
+    __table_args__ = (
+        # task_type 별 기간 조회/백분위 집계용
+        Index("run_history_task_type_started_at_idx", "task_type", "started_at"),
+    )
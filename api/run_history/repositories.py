@@ -0,0 +1,80 @@
+# api/run_history/repositories.py
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from . import models
+
+
+async def create_run_history(db: AsyncSession, **values) -> None:
+    await db.execute(insert(models.RunHistory).values(**values))
+    await db.commit()
+
+
+async def get_run_histories(
+    db: AsyncSession,
+    task_type: Optional[str] = None,
+    trigger: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    skip: int = 0,
+    limit: int = 100,
+):
+    query = select(models.RunHistory)
+    if task_type:
+        query = query.where(models.RunHistory.task_type == task_type)
+    if trigger:
+        query = query.where(models.RunHistory.trigger == trigger)
+    if status:
+        query = query.where(models.RunHistory.status == status)
+    if since:
+        query = query.where(models.RunHistory.started_at >= since)
+    query = query.order_by(models.RunHistory.started_at.desc()).offset(skip).limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def get_run_stats(
+    db: AsyncSession, since: datetime, task_type: Optional[str] = None
+):
+    """task_type 별 실행 수, 실패율, 소요 시간 백분위를 한 번의 집계 쿼리로 계산"""
+    duration = models.RunHistory.duration_ms
+    failed = models.RunHistory.status != "success"
+    query = (
+        select(
+            models.RunHistory.task_type,
+            func.count().label("total"),
+            func.count().filter(failed).label("failed"),
+            func.avg(case((failed, 1.0), else_=0.0)).label("failure_rate"),
+            func.avg(duration).label("avg_ms"),
+            func.percentile_cont(0.5).within_group(duration).label("p50_ms"),
+            func.percentile_cont(0.95).within_group(duration).label("p95_ms"),
+            func.percentile_cont(0.99).within_group(duration).label("p99_ms"),
+            func.max(duration).label("max_ms"),
+        )
+        .where(models.RunHistory.started_at >= since)
+        .group_by(models.RunHistory.task_type)
+        .order_by(models.RunHistory.task_type)
+    )
+    if task_type:
+        query = query.where(models.RunHistory.task_type == task_type)
+    result = await db.execute(query)
+    return result.mappings().all()
+
+
+async def delete_run_histories_before(
+    db: AsyncSession, cutoff: datetime, batch_size: int
+) -> int:
+    """cutoff 이전 행을 최대 batch_size 개 삭제 (짧은 트랜잭션으로 나눠 삭제하기 위함)"""
+    batch = (
+        select(models.RunHistory.id)
+        .where(models.RunHistory.started_at < cutoff)
+        .order_by(models.RunHistory.id)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(models.RunHistory).where(models.RunHistory.id.in_(batch))
+    )
+    await db.commit()
+    return result.rowcount
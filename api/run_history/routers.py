@@ -0,0 +1,40 @@
+# api/run_history/routers.py
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from . import schemas, services
+from config.db import get_db
+
+router = APIRouter(prefix="/run-history", tags=["run-history"])
+
+
+@router.get("", response_model=List[schemas.RunHistory])
+async def read_run_history(
+    task_type: Optional[str] = None,
+    trigger: Optional[schemas.RunTrigger] = None,
+    status: Optional[schemas.RunStatus] = None,
+    window_minutes: Optional[int] = Query(default=None, ge=1),
+    skip: int = 0,
+    limit: int = Query(default=100, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """최근 실행 기록을 최신순으로 조회합니다."""
+    return await services.get_run_history_list(
+        db,
+        task_type=task_type,
+        trigger=trigger,
+        status=status,
+        window_minutes=window_minutes,
+        skip=skip,
+        limit=limit,
+    )
+
+
+@router.get("/stats", response_model=schemas.RunStatsResponse)
+async def read_run_stats(
+    window_minutes: int = Query(default=60, ge=1, le=60 * 24 * 90),
+    task_type: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """기간 내 task_type 별 p50/p95/p99 소요 시간과 실패율을 조회합니다."""
+    return await services.get_run_stats(db, window_minutes, task_type)
@@ -0,0 +1,43 @@
+# api/run_history/schemas.py
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Literal, Optional
+
+RunTrigger = Literal["scheduled", "manual", "async"]
+RunStatus = Literal["success", "error", "cancelled"]
+
+
+class RunHistory(BaseModel):
+    id: int
+    task_type: str
+    trigger: RunTrigger
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: int
+    status: RunStatus
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    response_size: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
+class RunStats(BaseModel):
+    """기간 내 task_type 별 실행 통계 (소요 시간은 ms)"""
+
+    task_type: str
+    total: int
+    failed: int
+    failure_rate: float
+    avg_ms: Optional[float] = None
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    max_ms: Optional[int] = None
+
+
+class RunStatsResponse(BaseModel):
+    since: datetime
+    window_minutes: int
+    stats: List[RunStats]
@@ -0,0 +1,103 @@
+# api/run_history/services.py
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from . import repositories, schemas
+from config.db import AsyncSessionLocal
+from config.logging_config import logger
+from config.settings import settings
+
+# 저장할 에러 메시지 최대 길이
+MAX_ERROR_LENGTH = 2000
+
+
+async def record_run(
+    task_type: str,
+    trigger: str,
+    started_at: datetime,
+    duration_ms: int,
+    status: str,
+    status_code: Optional[int] = None,
+    error: Optional[str] = None,
+    response_size: Optional[int] = None,
+) -> None:
+    """실행 1회를 기록 (호출자 트랜잭션과 분리, 기록 실패는 실행 결과에 영향을 주지 않음)"""
+    if not settings.RUN_HISTORY_ENABLED:
+        return
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await repositories.create_run_history(
+                db,
+                task_type=task_type,
+                trigger=trigger,
+                started_at=started_at,
+                finished_at=datetime.utcnow(),
+                duration_ms=duration_ms,
+                status=status,
+                status_code=status_code,
+                error=error[:MAX_ERROR_LENGTH] if error else None,
+                response_size=response_size,
+            )
+    except Exception as e:
+        logger.error(f"Failed to record {task_type} run history: {str(e)}")
+
+
+async def get_run_history_list(
+    db: AsyncSession,
+    task_type: Optional[str] = None,
+    trigger: Optional[str] = None,
+    status: Optional[str] = None,
+    window_minutes: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 100,
+):
+    since = (
+        datetime.utcnow() - timedelta(minutes=window_minutes) if window_minutes else None
+    )
+    return await repositories.get_run_histories(
+        db,
+        task_type=task_type,
+        trigger=trigger,
+        status=status,
+        since=since,
+        skip=skip,
+        limit=limit,
+    )
+
+
+async def get_run_stats(
+    db: AsyncSession, window_minutes: int, task_type: Optional[str] = None
+) -> schemas.RunStatsResponse:
+    since = datetime.utcnow() - timedelta(minutes=window_minutes)
+    rows = await repositories.get_run_stats(db, since, task_type)
+    return schemas.RunStatsResponse(
+        since=since,
+        window_minutes=window_minutes,
+        stats=[schemas.RunStats(**row) for row in rows],
+    )
+
+
+async def prune_run_history() -> int:
+    """보관 기간이 지난 실행 기록을 배치 단위로 삭제 (스케줄러 유지보수 작업)"""
+    cutoff = datetime.utcnow() - timedelta(days=settings.RUN_HISTORY_RETENTION_DAYS)
+    batch_size = settings.RUN_HISTORY_PRUNE_BATCH_SIZE
+    deleted = 0
+    try:
+        async with AsyncSessionLocal() as db:
+            while True:
+                count = await repositories.delete_run_histories_before(
+                    db, cutoff, batch_size
+                )
+                deleted += count
+                if count < batch_size:
+                    break
+                # 배치 사이에 다른 작업이 DB/이벤트 루프를 사용할 수 있도록 양보
+                await asyncio.sleep(0.1)
+    except Exception as e:
+        logger.error(f"Failed to prune run history: {str(e)}")
+
+    if deleted:
+        logger.info(f"Pruned {deleted} run history rows older than {cutoff}")
+    return deleted
@@ -0,0 +1,61 @@
+# api/scheduler_config/cache.py
+# scheduler_config 프로세스 내 캐시 (쓰기 시 갱신)
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from . import repositories, schemas
+from config.settings import settings
+
+
+class SchedulerConfigCache:
+    """모든 scheduler_config 를 한 번의 쿼리로 읽어 보관하는 캐시
+
+    이 프로세스의 쓰기(services)는 즉시 캐시에 반영되고, 다른 프로세스의 쓰기는
+    SCHEDULER_CONFIG_CACHE_TTL 이 지나 다시 읽을 때 반영됩니다.
+    """
+
+    def __init__(self):
+        self._configs: Optional[Dict[str, schemas.SchedulerConfig]] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._configs is not None
+            and time.monotonic() - self._loaded_at < settings.SCHEDULER_CONFIG_CACHE_TTL
+        )
+
+    async def get_all(self, db: AsyncSession) -> Dict[str, schemas.SchedulerConfig]:
+        if self._is_fresh():
+            return self._configs
+
+        async with self._lock:
+            # 대기 중 다른 코루틴이 이미 로드했으면 재사용
+            if not self._is_fresh():
+                self.replace(await repositories.get_scheduler_configs(db))
+        return self._configs
+
+    async def get_enabled_task_types(self, db: AsyncSession) -> List[str]:
+        configs = await self.get_all(db)
+        return [task_type for task_type, config in configs.items() if config.is_active]
+
+    def update(self, config) -> None:
+        """쓰기 결과를 캐시에 반영 (로드 전이면 다음 조회 시 전체 로드)"""
+        if self._configs is not None:
+            self._configs[config.task_type] = schemas.SchedulerConfig.model_validate(
+                config
+            )
+
+    def replace(self, configs) -> None:
+        """이미 읽어 온 전체 설정으로 캐시를 교체 (TTL 도 새로 시작)"""
+        self._configs = {
+            config.task_type: schemas.SchedulerConfig.model_validate(config)
+            for config in configs
+        }
+        self._loaded_at = time.monotonic()
+
+
+# 글로벌 캐시 인스턴스
+scheduler_config_cache = SchedulerConfigCache()
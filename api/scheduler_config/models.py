@@ -10,6 +10,9 @@ class SchedulerConfig(Base):
     id = Column(Integer, primary_key=True, index=True)
     task_type = Column(String(50), unique=True, nullable=False)  # 'valid' 또는 'sync'
     is_active = Column(Boolean, default=True)
+    interval_seconds = Column(Integer, nullable=False, default=60, server_default="60")
+    cron_expression = Column(String(100))  # 설정 시 interval 대신 crontab 형식으로 실행
+    timeout_seconds = Column(Integer)  # 초과 시 작업 취소 (없으면 제한 없음)
     last_run = Column(DateTime)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -1,7 +1,7 @@
 # api/scheduler_config/repositories.py
-from sqlalchemy import func
+from typing import Sequence, Union
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from . import models
 
 
@@ -20,26 +20,47 @@ async def get_scheduler_configs(db: AsyncSession):
 
 
 async def create_scheduler_config(db: AsyncSession, config):
-    db_config = models.SchedulerConfig(**config.dict())
-    db.add(db_config)
+    query = (
+        insert(models.SchedulerConfig)
+        .values(**config.model_dump())
+        .returning(models.SchedulerConfig)
+    )
+    result = await db.execute(query)
+    db_config = result.scalar_one()
     await db.commit()
-    await db.refresh(db_config)
     return db_config
 
 
-async def update_scheduler_config(db: AsyncSession, task_type: str, is_active: bool):
-    config = await get_scheduler_config(db, task_type)
-    if config:
-        config.is_active = is_active
-        await db.commit()
-        await db.refresh(config)
+async def update_scheduler_config(db: AsyncSession, task_type: str, values: dict):
+    if not values:
+        return await get_scheduler_config(db, task_type)
+
+    query = (
+        update(models.SchedulerConfig)
+        .where(models.SchedulerConfig.task_type == task_type)
+        .values(**values)
+        .returning(models.SchedulerConfig)
+    )
+    result = await db.execute(query)
+    config = result.scalar_one_or_none()
+    await db.commit()
     return config
 
 
-async def update_last_run(db: AsyncSession, task_type: str):
-    config = await get_scheduler_config(db, task_type)
-    if config:
-        config.last_run = func.now()
-        await db.commit()
-        await db.refresh(config)
-    return config
+async def update_last_run(db: AsyncSession, task_types: Union[str, Sequence[str]]):
+    """하나 이상의 task_type 의 last_run 을 단일 UPDATE 문으로 갱신"""
+    if isinstance(task_types, str):
+        task_types = [task_types]
+    if not task_types:
+        return []
+
+    query = (
+        update(models.SchedulerConfig)
+        .where(models.SchedulerConfig.task_type.in_(task_types))
+        .values(last_run=func.now())
+        .returning(models.SchedulerConfig)
+    )
+    result = await db.execute(query)
+    configs = result.scalars().all()
+    await db.commit()
+    return configs
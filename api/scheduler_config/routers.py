@@ -11,18 +11,32 @@ router = APIRouter(prefix="/scheduler", tags=["scheduler"])
 
 @router.post("/pause")
 async def pause_scheduler():
-    """스케줄러를 일시 중지합니다."""
+    """스케줄러의 모든 작업을 일시 중지합니다."""
     await tasks.pause_scheduler()
     return {"message": "Scheduler paused successfully"}
 
 
 @router.post("/resume")
 async def resume_scheduler():
-    """스케줄러를 재개합니다."""
+    """스케줄러의 모든 작업을 재개합니다."""
     await tasks.resume_scheduler()
     return {"message": "Scheduler resumed successfully"}
 
 
+@router.post("/pause/{task_type}")
+async def pause_task(task_type: str):
+    """task_type 작업만 일시 중지합니다."""
+    await tasks.pause_scheduler(task_type)
+    return {"message": f"{task_type} task paused successfully"}
+
+
+@router.post("/resume/{task_type}")
+async def resume_task(task_type: str):
+    """task_type 작업만 재개합니다."""
+    await tasks.resume_scheduler(task_type)
+    return {"message": f"{task_type} task resumed successfully"}
+
+
 @router.post("/stop")
 async def stop_scheduler():
     """스케줄러를 완전히 중지합니다."""
@@ -30,6 +44,18 @@ async def stop_scheduler():
     return {"message": "Scheduler stopped successfully"}
 
 
+@router.get("/leader", response_model=schemas.SchedulerLeaderStatus)
+async def read_leader():
+    """이 프로세스의 리더 여부와 현재 스케줄러 리더를 조회합니다."""
+    return await tasks.get_leader_status()
+
+
+@router.get("/jobs", response_model=List[schemas.SchedulerJob])
+async def read_jobs():
+    """task_type 별 스케줄러 작업과 다음 실행 시각을 조회합니다."""
+    return await tasks.get_jobs()
+
+
 @router.get("/config", response_model=List[schemas.SchedulerConfig])
 async def read_configs(db: AsyncSession = Depends(get_db)):
     return await services.get_configs(db)
@@ -44,7 +70,9 @@ async def read_config(task_type: str, db: AsyncSession = Depends(get_db)):
 async def create_config(
     config: schemas.SchedulerConfigCreate, db: AsyncSession = Depends(get_db)
 ):
-    return await services.create_config(db, config)
+    db_config = await services.create_config(db, config)
+    await tasks.sync_task_job(db_config)
+    return db_config
 
 
 @router.put("/config/{task_type}", response_model=schemas.SchedulerConfig)
@@ -53,4 +81,7 @@ async def update_config(
     config: schemas.SchedulerConfigUpdate,
     db: AsyncSession = Depends(get_db),
 ):
-    return await services.update_config(db, task_type, config)
+    db_config = await services.update_config(db, task_type, config)
+    # 변경된 주기를 실행 중인 스케줄러 작업에 즉시 반영
+    await tasks.sync_task_job(db_config)
+    return db_config
@@ -1,5 +1,5 @@
 # api/scheduler_config/schemas.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
 
@@ -7,6 +7,9 @@ from typing import Optional
 class SchedulerConfigBase(BaseModel):
     task_type: str
     is_active: bool
+    interval_seconds: int = Field(default=60, ge=1)
+    cron_expression: Optional[str] = None
+    timeout_seconds: Optional[int] = Field(default=None, ge=1)
 
 
 class SchedulerConfigCreate(SchedulerConfigBase):
@@ -14,7 +17,12 @@ class SchedulerConfigCreate(SchedulerConfigBase):
 
 
 class SchedulerConfigUpdate(BaseModel):
-    is_active: bool
+    """전달된 필드만 변경"""
+
+    is_active: Optional[bool] = None
+    interval_seconds: Optional[int] = Field(default=None, ge=1)
+    cron_expression: Optional[str] = None
+    timeout_seconds: Optional[int] = Field(default=None, ge=1)
 
 
 class SchedulerConfig(SchedulerConfigBase):
@@ -25,3 +33,27 @@ class SchedulerConfig(SchedulerConfigBase):
 
     class Config:
         from_attributes = True
+
+
+class SchedulerLeaderInfo(BaseModel):
+    application_name: Optional[str] = None
+    client_addr: Optional[str] = None
+    since: Optional[datetime] = None
+
+
+class SchedulerLeaderStatus(BaseModel):
+    identity: str
+    is_leader: bool
+    election_enabled: bool
+    leader: Optional[SchedulerLeaderInfo] = None
+
+
+class SchedulerJob(BaseModel):
+    id: str
+    task_type: str
+    trigger: str
+    next_run_time: Optional[datetime] = None
+    paused: bool
+    running: bool = False
+    running_seconds: Optional[float] = None
+    interval_multiplier: int = 1
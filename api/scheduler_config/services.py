@@ -1,7 +1,17 @@
 # api/scheduler_config/services.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from . import repositories, schemas
+from .cache import scheduler_config_cache
 from fastapi import HTTPException
+from typing import List, Optional
+from scheduler.triggers import build_trigger
+
+
+def _validate_schedule(cron_expression: Optional[str], interval_seconds: int) -> None:
+    try:
+        build_trigger(cron_expression, interval_seconds)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid schedule: {str(e)}")
 
 
 async def get_config(db: AsyncSession, task_type: str):
@@ -16,20 +26,51 @@ async def get_configs(db: AsyncSession):
 
 
 async def create_config(db: AsyncSession, config: schemas.SchedulerConfigCreate):
-    return await repositories.create_scheduler_config(db, config)
+    _validate_schedule(config.cron_expression, config.interval_seconds)
+    db_config = await repositories.create_scheduler_config(db, config)
+    scheduler_config_cache.update(db_config)
+    return db_config
 
 
 async def update_config(
     db: AsyncSession, task_type: str, config: schemas.SchedulerConfigUpdate
 ):
-    db_config = await repositories.update_scheduler_config(
-        db, task_type, config.is_active
-    )
+    values = config.model_dump(exclude_unset=True)
+    if values.get("is_active", True) is None or values.get("interval_seconds", 1) is None:
+        raise HTTPException(
+            status_code=400, detail="is_active and interval_seconds cannot be null"
+        )
+    if "cron_expression" in values:
+        # 빈 문자열은 cron 해제(interval 사용)로 처리
+        values["cron_expression"] = values["cron_expression"] or None
+    if "cron_expression" in values or "interval_seconds" in values:
+        current = await get_config(db, task_type)
+        _validate_schedule(
+            values.get("cron_expression", current.cron_expression),
+            values.get("interval_seconds", current.interval_seconds),
+        )
+
+    db_config = await repositories.update_scheduler_config(db, task_type, values)
     if not db_config:
         raise HTTPException(status_code=404, detail=f"Config for {task_type} not found")
+    scheduler_config_cache.update(db_config)
     return db_config
 
 
+async def get_cached_config(
+    db: AsyncSession, task_type: str
+) -> Optional[schemas.SchedulerConfig]:
+    """캐시된 task_type 설정 (없으면 None)"""
+    configs = await scheduler_config_cache.get_all(db)
+    return configs.get(task_type)
+
+
 async def is_task_enabled(db: AsyncSession, task_type: str) -> bool:
-    config = await repositories.get_scheduler_config(db, task_type)
+    configs = await scheduler_config_cache.get_all(db)
+    config = configs.get(task_type)
     return bool(config and config.is_active)
+
+
+async def get_enabled_task_types(db: AsyncSession) -> List[str]:
+    """활성화된 task_type 목록 (캐시가 유효하면 쿼리 없음)"""
+    return await scheduler_config_cache.get_enabled_task_types(db)
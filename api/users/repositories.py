@@ -1,16 +1,27 @@
 # /api/users/repositories.py
 # 사용자 crud 동작 정의
 
+from typing import Optional
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from . import models
 
 
 async def create_user(db: AsyncSession, user_data: dict):
-    db_user = models.User(**user_data)
-    db.add(db_user)
+    """단일 INSERT 로 사용자 생성, 이메일이 이미 존재하면 None 반환
+
+    email unique 제약에 의존하므로 동시 가입 요청에도 중복 행이 생기지 않습니다.
+    """
+    query = (
+        pg_insert(models.User)
+        .values(**user_data)
+        .on_conflict_do_nothing(index_elements=[models.User.email])
+        .returning(models.User)
+    )
+    result = await db.execute(query)
+    db_user = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(db_user)
     return db_user
 
 
@@ -26,7 +37,12 @@ async def get_user(db, user_id: int):
     return result.scalar_one_or_none()
 
 
-async def get_users(db, skip: int = 0, limit: int = 10):
-    query = select(models.User).offset(skip).limit(limit)
+async def get_users(db, skip: int = 0, limit: int = 10, after_id: Optional[int] = None):
+    """after_id 가 주어지면 keyset(커서) 방식, 아니면 기존 offset 방식으로 조회"""
+    query = select(models.User).order_by(models.User.id).limit(limit)
+    if after_id is not None:
+        query = query.where(models.User.id > after_id)
+    else:
+        query = query.offset(skip)
     result = await db.execute(query)
     return result.scalars().all()
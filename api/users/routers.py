@@ -1,11 +1,11 @@
 # /api/users/routers.py
 # FastAPI 사용자 라우터 정의
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from .security import verify_password
+from .security import PasswordHashingBusyError, verify_password
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from . import schemas, services
 from config.db import get_db
 
@@ -33,20 +33,32 @@ router = APIRouter()
 async def create_user(user: schemas.UserCreate, db: AsyncSession = Depends(get_db)):
     try:
         return await services.create_new_user(db, user)
+    except PasswordHashingBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/users/", response_model=List[schemas.User])
 async def read_users(
-    skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)
+    response: Response,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
 ):
-    return await services.get_users(db, skip, limit)
+    """after_id 를 주면 keyset 페이지네이션, 다음 커서는 X-Next-Cursor 헤더로 반환"""
+    users = await services.get_user_list(db, skip, limit, after_id)
+    if len(users) == limit:
+        response.headers["X-Next-Cursor"] = str(users[-1].id)
+    return users
 
 
 @router.get("/users/{user_id}", response_model=schemas.User)
 async def read_user(user_id: int, db: AsyncSession = Depends(get_db)):
-    db_user = await services.get_user(db, user_id=user_id)
+    db_user = await services.get_user_by_id(db, user_id=user_id)
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
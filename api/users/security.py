@@ -1,8 +1,23 @@
 # /api/users/security.py
 # 사용자 패스워드 검증
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import bcrypt
+from config.settings import settings
+
+# bcrypt 전용 스레드 풀 (이벤트 루프를 막지 않도록 해시/검증을 위임)
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+# 스레드 풀에 위임되어 실행/대기 중인 작업 수
+_pending_hash_jobs = 0
+
+
+class PasswordHashingBusyError(Exception):
+    """해시 대기 작업이 상한을 넘었을 때 발생"""
+
 
 def get_password_hash(password: str) -> str:
     """비밀번호를 해시화합니다."""
@@ -15,3 +30,27 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         plain_password.encode('utf-8'),
         hashed_password.encode('utf-8')
     )
+
+
+async def _run_in_hash_pool(func, *args):
+    """전용 스레드 풀에서 실행, 대기 작업이 상한을 넘으면 즉시 거절"""
+    global _pending_hash_jobs
+    if _pending_hash_jobs >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHashingBusyError("Password hashing queue is full")
+
+    _pending_hash_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        _pending_hash_jobs -= 1
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호를 이벤트 루프 밖에서 해시화합니다."""
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증을 이벤트 루프 밖에서 수행합니다."""
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
@@ -1,9 +1,10 @@
 # /api/users/services.py
 # 비즈니스 로직 정의
 
+from typing import Optional
 from . import schemas
-from .repositories import get_user_by_email, create_user, get_user, get_users
-from .security import get_password_hash
+from .repositories import create_user, get_user, get_users
+from .security import get_password_hash_async
 
 # async def authenticate_user(db, email: str, password: str):
 #     user = await get_user_by_email(db, email)
@@ -15,21 +16,24 @@ from .security import get_password_hash
 
 
 async def create_new_user(db, user_in: schemas.UserCreate):
-    db_user = await get_user_by_email(db, email=user_in.email)
-    if db_user:
-        raise ValueError("Email already registered")
-
     user_data = user_in.model_dump()
-    hashed_password = get_password_hash(user_data["password"])
+    # bcrypt 는 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+    hashed_password = await get_password_hash_async(user_data["password"])
     del user_data["password"]
     user_data["hashed_password"] = hashed_password
 
-    return await create_user(db, user_data)
+    # 중복 이메일은 unique 제약 충돌로 판단 (조회 후 삽입 경쟁 조건 제거)
+    db_user = await create_user(db, user_data)
+    if db_user is None:
+        raise ValueError("Email already registered")
+    return db_user
 
 
 async def get_user_by_id(db, user_id: int):
     return await get_user(db, user_id)
 
 
-async def get_user_list(db, skip: int = 0, limit: int = 10):
-    return await get_users(db, skip, limit)
+async def get_user_list(
+    db, skip: int = 0, limit: int = 10, after_id: Optional[int] = None
+):
+    return await get_users(db, skip, limit, after_id)
@@ -0,0 +1,139 @@
+# /api/webhooks/dedup.py
+# fingerprint 기반 알림 중복 억제
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from .repositories import (
+    claim_alert_keys,
+    delete_alert_keys_before,
+    get_alert_keys_last_seen,
+)
+from .schemas import Alert
+from config.db import AsyncSessionLocal
+from config.logging_config import logger
+from config.metrics import ALERTS_FORWARDED, ALERTS_SUPPRESSED
+from config.settings import settings
+
+AlertKey = Tuple[str, str]
+
+
+class AlertDeduplicator:
+    """fingerprint+status 키로 억제 구간 내 중복 알림을 걸러내는 필터
+
+    1차로 프로세스 내 LRU(TTL) 캐시를 확인하고, 캐시에 없는 키만 alert_dedup 테이블에서
+    원자적으로 선점하므로 여러 레플리카가 있어도 같은 알림은 한 번만 전달됩니다.
+    """
+
+    def __init__(self):
+        self._seen: "OrderedDict[AlertKey, float]" = OrderedDict()
+        self.suppressed = 0
+        self.forwarded = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.ALERT_DEDUP_WINDOW > 0
+
+    def _seen_recently(self, key: AlertKey, now: float) -> bool:
+        expires_at = self._seen.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= now:
+            del self._seen[key]
+            return False
+        self._seen.move_to_end(key)
+        return True
+
+    def _cache(self, key: AlertKey, expires_at: float) -> None:
+        self._seen[key] = expires_at
+        self._seen.move_to_end(key)
+        while len(self._seen) > settings.ALERT_DEDUP_CACHE_SIZE:
+            self._seen.popitem(last=False)
+
+    def remember(self, keys: List[AlertKey], forwarded: int, suppressed: int) -> None:
+        """전달이 확정된 키를 캐시에 기록하고 전달/억제 건수 집계 (commit 이후 호출)"""
+        self.forwarded += forwarded
+        self.suppressed += suppressed
+        ALERTS_FORWARDED.inc(forwarded)
+        ALERTS_SUPPRESSED.inc(suppressed)
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + settings.ALERT_DEDUP_WINDOW
+        for key in keys:
+            self._cache(key, expires_at)
+
+    async def filter_new(self, db, alerts: List[Alert]) -> Tuple[List[Alert], List[AlertKey]]:
+        """억제 대상이 아닌 alert 목록과 새로 선점한 키 목록을 반환
+
+        DB 선점은 호출자의 트랜잭션 안에서 수행되므로, 호출자가 commit 한 뒤
+        remember() 로 키를 캐시에 기록해야 합니다. 다른 레플리카가 이미 선점한 키는
+        해당 억제 구간이 끝날 때까지 바로 캐시에 기록합니다.
+        """
+        if not self.enabled:
+            return alerts, []
+
+        now = time.monotonic()
+        candidates: Dict[AlertKey, Alert] = {}
+        for alert in alerts:
+            key = (alert.fingerprint, alert.status)
+            # 동일 payload 내 중복과 캐시 적중은 DB 조회 없이 억제
+            if key in candidates or self._seen_recently(key, now):
+                continue
+            candidates[key] = alert
+
+        utcnow = datetime.utcnow()
+        claimed = await claim_alert_keys(
+            db,
+            list(candidates),
+            now=utcnow,
+            cutoff=utcnow - timedelta(seconds=settings.ALERT_DEDUP_WINDOW),
+        )
+
+        # 선점에 실패한 키는 남은 억제 구간 동안 DB 조회 없이 억제
+        lost = [key for key in candidates if key not in claimed]
+        last_seen = await get_alert_keys_last_seen(db, lost)
+        for key, seen_at in last_seen.items():
+            remaining = (
+                seen_at + timedelta(seconds=settings.ALERT_DEDUP_WINDOW) - utcnow
+            ).total_seconds()
+            if remaining > 0:
+                self._cache(key, now + remaining)
+
+        new_alerts = [alert for key, alert in candidates.items() if key in claimed]
+        return new_alerts, list(claimed)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "forwarded": self.forwarded,
+            "suppressed": self.suppressed,
+            "cached_keys": len(self._seen),
+            "window_seconds": settings.ALERT_DEDUP_WINDOW,
+        }
+
+
+async def prune_alert_dedup() -> int:
+    """억제 구간이 지난 alert_dedup 키를 배치 단위로 삭제 (스케줄러 유지보수 작업)"""
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.ALERT_DEDUP_WINDOW)
+    batch_size = settings.ALERT_DEDUP_PRUNE_BATCH_SIZE
+    deleted = 0
+    try:
+        async with AsyncSessionLocal() as db:
+            while True:
+                count = await delete_alert_keys_before(db, cutoff, batch_size)
+                deleted += count
+                if count < batch_size:
+                    break
+                # 배치 사이에 다른 작업이 DB/이벤트 루프를 사용할 수 있도록 양보
+                await asyncio.sleep(0.1)
+    except Exception as e:
+        logger.error(f"Failed to prune alert dedup keys: {str(e)}")
+
+    if deleted:
+        logger.info(f"Pruned {deleted} alert dedup keys last seen before {cutoff}")
+    return deleted
+
+
+# 글로벌 중복 억제 인스턴스
+alert_deduplicator = AlertDeduplicator()
@@ -0,0 +1,134 @@
+# /api/webhooks/grafana_cache.py
+# Grafana contact points 캐시 (TTL, stale-while-revalidate, ETag 재검증, single-flight)
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from .grafana_client import GrafanaClient
+from config.logging_config import logger
+from config.settings import settings
+
+
+class ContactPointCache:
+    """contact points 를 TTL 동안 보관하고 만료 후에는 조건부 요청으로 재검증
+
+    - TTL 이내: 캐시 반환
+    - TTL 경과 ~ STALE_TTL 이내: 캐시를 즉시 반환하고 백그라운드에서 재검증
+    - 캐시가 없거나 STALE_TTL 경과: 재검증 완료까지 대기 (실패 시 남은 캐시라도 반환)
+    동시에 여러 요청이 들어와도 Grafana 요청은 하나만 진행됩니다(single-flight).
+    갱신이 실패하면 연속 실패 횟수에 따라 지수적으로 늘어나는 대기 시간 동안 Grafana 를
+    다시 호출하지 않고 남은 캐시(없으면 마지막 에러)를 반환합니다.
+    """
+
+    def __init__(self):
+        self._data: Optional[Any] = None
+        self._etag: Optional[str] = None
+        self._fetched_at = 0.0
+        self._failed_at: Optional[float] = None
+        self._failures = 0
+        self._last_error: Optional[str] = None
+        self._refresh: Optional[asyncio.Task] = None
+        self._client: Optional[GrafanaClient] = None
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def _age(self) -> float:
+        return time.monotonic() - self._fetched_at
+
+    def _retry_after(self) -> float:
+        """마지막 실패 후 다음 갱신 시도까지 남은 시간(초), 대기 중이 아니면 0"""
+        if self._failed_at is None:
+            return 0.0
+        delay = min(
+            settings.GRAFANA_CONTACT_POINTS_RETRY_MAX,
+            settings.GRAFANA_CONTACT_POINTS_RETRY_BASE * (2 ** (self._failures - 1)),
+        )
+        return max(0.0, self._failed_at + delay - time.monotonic())
+
+    def _start_refresh(self) -> asyncio.Task:
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self._fetch(), name="grafana-contact-points")
+            self._refresh.add_done_callback(self._log_refresh_error)
+        return self._refresh
+
+    async def _fetch(self) -> None:
+        try:
+            if self._client is None:
+                self._client = GrafanaClient()
+            data, etag = await self._client.get_contact_points_if_changed(
+                self._etag if self._data is not None else None
+            )
+        except Exception as e:
+            self._failed_at = time.monotonic()
+            self._failures += 1
+            self._last_error = str(e) or e.__class__.__name__
+            raise
+        self._failed_at = None
+        self._failures = 0
+        self._last_error = None
+        if data is None:
+            # 304: 변경 없음, 보관 중인 데이터의 유효 시간만 연장
+            self.revalidated += 1
+        else:
+            self._data = data
+            self._etag = etag
+        self._fetched_at = time.monotonic()
+
+    async def get(self) -> Any:
+        age = self._age()
+        if self._data is not None and age < settings.GRAFANA_CONTACT_POINTS_TTL:
+            self.hits += 1
+            return self._data
+
+        if self._retry_after() > 0:
+            # 최근 갱신 실패 후 대기 중: Grafana 를 호출하지 않음
+            if self._data is None:
+                raise RuntimeError(
+                    f"Grafana contact points unavailable: {self._last_error}"
+                )
+            self.hits += 1
+            return self._data
+
+        refresh = self._start_refresh()
+        if self._data is not None and age < settings.GRAFANA_CONTACT_POINTS_STALE_TTL:
+            self.hits += 1
+            return self._data
+
+        self.misses += 1
+        try:
+            # 대기 중인 요청이 취소되어도 공유 중인 갱신 작업은 유지
+            await asyncio.shield(refresh)
+        except Exception as e:
+            if self._data is None:
+                raise
+            logger.warning(f"Serving stale Grafana contact points: {str(e)}")
+        return self._data
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                f"Grafana contact points refresh failed: {task.exception()}"
+            )
+
+    def invalidate(self) -> None:
+        self._fetched_at = 0.0
+        self._failed_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cached": self._data is not None,
+            "age_seconds": round(self._age(), 1) if self._data is not None else None,
+            "etag": self._etag,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self._retry_after(), 1) or None,
+            "last_error": self._last_error,
+        }
+
+
+# 글로벌 캐시 인스턴스
+contact_point_cache = ContactPointCache()
@@ -1,22 +1,37 @@
-import httpx
+import time
+from typing import Optional
+from config.http_clients import GRAFANA, http_clients
+from config.metrics import OUTBOUND_REQUEST_DURATION, OUTBOUND_REQUESTS
 from config.settings import settings
 
 class GrafanaClient:
     def __init__(self):
-        self.base_url = settings.GRAFANA_BASE_URL
-        self.api_key = settings.GRAFANA_API_KEY
-        
-        if not self.base_url or not self.api_key:
+        # base_url 과 인증 헤더는 레지스트리의 GRAFANA 클라이언트에만 설정됨
+        if not settings.GRAFANA_BASE_URL or not settings.GRAFANA_API_KEY:
             raise ValueError("GRAFANA_BASE_URL and GRAFANA_API_KEY must be set")
-        
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
 
-    async def get_contact_points(self):
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.base_url}/contact-points", headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+    async def _get_contact_points(self, headers):
+        # 레지스트리의 장수명 클라이언트 재사용 (base_url 기준 상대 경로로 요청)
+        client = http_clients.get(GRAFANA)
+        started = time.perf_counter()
+        status_code = "error"
+        try:
+            response = await client.get("/contact-points", headers=headers)
+            status_code = response.status_code
+        finally:
+            OUTBOUND_REQUEST_DURATION.observe(
+                time.perf_counter() - started, destination=GRAFANA
+            )
+            OUTBOUND_REQUESTS.inc(destination=GRAFANA, status_code=status_code)
+        return response
+
+    async def get_contact_points_if_changed(self, etag: Optional[str] = None):
+        """ETag 로 조건부 조회, 변경이 없으면(304) (None, etag) 반환"""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        response = await self._get_contact_points(headers)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        return response.json(), response.headers.get("ETag")
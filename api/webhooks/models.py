@@ -1,14 +1,82 @@
 # /api/webhooks/models.py
 # 웹훅 모델 정의
 
-from sqlalchemy import Column, Integer, JSON, DateTime
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from config.db import Base
 
 
 class Webhooks(Base):
+    """수신한 알림 payload 저장 및 Bot 전송 outbox
+
+    delivery_status: pending(전송 대기/재시도 대기), delivered(전송 완료), failed(최종 실패)
+    status: alert 상태(firing/resolved)
+
+    created_at 기준 월별 RANGE 파티션 테이블이며 (id, created_at) 이 기본 키입니다.
+    월 파티션은 api/webhooks/partitions.py 에서 생성/삭제합니다.
+    """
+
     __tablename__ = "webhooks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    payload = Column(JSON, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    created_at = Column(
+        DateTime, primary_key=True, nullable=False, default=datetime.utcnow
+    )
+    payload = Column(JSONB, nullable=False)
+    # 조회/필터용으로 alert 에서 추출한 값
+    alertname = Column(String(200))
+    severity = Column(String(50))
+    status = Column(String(20))
+    fingerprint = Column(String(64))
+    delivery_status = Column(
+        String(20), nullable=False, default="pending", server_default="pending"
+    )
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime, default=datetime.utcnow)
+    last_error = Column(Text)
+    delivered_at = Column(DateTime)
+
+    __table_args__ = (
+        # 전송 대기 행만 대상으로 하는 부분 인덱스 (outbox 배치 조회용)
+        Index(
+            "webhooks_outbox_pending_idx",
+            "next_attempt_at",
+            postgresql_where=text("delivery_status = 'pending'"),
+        ),
+        Index("webhooks_alertname_created_at_idx", "alertname", "created_at"),
+        Index("webhooks_severity_created_at_idx", "severity", "created_at"),
+        Index("webhooks_fingerprint_idx", "fingerprint"),
+        # 삽입 순서와 created_at 이 거의 일치하므로 작은 BRIN 으로 기간 조회
+        Index("webhooks_created_at_brin_idx", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+# create_all 로 새로 만든 경우 월 파티션이 없는 기간의 행을 받을 기본 파티션 생성
+event.listen(
+    Webhooks.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS webhooks_default PARTITION OF webhooks DEFAULT"),
+)
+
+
+class AlertDedup(Base):
+    """fingerprint+status 별 마지막 전송 시각 (레플리카 간 알림 중복 억제용)"""
+
+    __tablename__ = "alert_dedup"
+
+    fingerprint = Column(String(64), primary_key=True)
+    status = Column(String(20), primary_key=True)
+    last_seen_at = Column(DateTime, nullable=False, default=datetime.utcnow)
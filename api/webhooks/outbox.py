@@ -0,0 +1,203 @@
+# /api/webhooks/outbox.py
+# 알림 outbox 백그라운드 전송 워커
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import httpx
+from .models import Webhooks
+from .repositories import claim_pending_webhooks, update_webhook_deliveries
+from .schemas import AlertDeliveryResult
+from config.db import AsyncSessionLocal
+from config.http_clients import BOT, http_clients
+from config.logging_config import logger
+from config.metrics import OUTBOUND_REQUEST_DURATION, OUTBOUND_REQUESTS
+from config.settings import settings
+
+
+def compute_backoff(attempts: int) -> float:
+    """지수 백오프 + jitter 로 다음 재시도까지의 지연(초) 계산
+
+    지연의 절반은 고정, 나머지 절반은 무작위로 두어 재시도가 한 시점에 몰리지 않게 합니다.
+    """
+    delay = min(
+        settings.OUTBOX_BACKOFF_MAX,
+        settings.OUTBOX_BACKOFF_BASE * (2 ** max(attempts - 1, 0)),
+    )
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+async def deliver_bot_payload(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    webhook_id: int,
+    payload: Dict[str, Any],
+) -> AlertDeliveryResult:
+    """동시 전송 상한(semaphore) 내에서 outbox 행 하나를 Bot API 로 전송하고 결과 반환
+
+    5xx/429/연결 오류는 재시도(retry), 그 외 4xx 는 재시도해도 소용없으므로 failed 로 분류합니다.
+    """
+    async with semaphore:
+        started = time.perf_counter()
+        status_code = "error"
+        try:
+            response = await client.post(settings.BOT_TARGET_URL, json=payload)
+            status_code = response.status_code
+            response.raise_for_status()
+            logger.info(f"Successfully sent webhook. Status code: {response.status_code}")
+            return AlertDeliveryResult(
+                webhook_id=webhook_id,
+                status="delivered",
+                status_code=response.status_code,
+            )
+
+        except httpx.HTTPStatusError as exc:
+            status_code = exc.response.status_code
+            logger.error(f"HTTP error occurred: {status_code} - {exc.response.text}")
+            retryable = status_code >= 500 or status_code == 429
+            return AlertDeliveryResult(
+                webhook_id=webhook_id,
+                status="retry" if retryable else "failed",
+                status_code=status_code,
+                error=exc.response.text,
+            )
+
+        except httpx.RequestError as exc:
+            logger.error(f"Connection error occurred: {exc}")
+            return AlertDeliveryResult(
+                webhook_id=webhook_id,
+                status="retry",
+                error=f"Failed to connect to the external server: {exc}",
+            )
+
+        except Exception as exc:
+            logger.error(f"An unexpected error occurred: {exc}")
+            return AlertDeliveryResult(
+                webhook_id=webhook_id, status="retry", error=str(exc)
+            )
+
+        finally:
+            OUTBOUND_REQUEST_DURATION.observe(
+                time.perf_counter() - started, destination=BOT
+            )
+            OUTBOUND_REQUESTS.inc(destination=BOT, status_code=status_code)
+
+
+class OutboxWorker:
+    """webhooks outbox 의 pending 행을 배치 단위로 꺼내 Bot API 로 전송하는 워커"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def notify(self) -> None:
+        """새 행이 저장되었음을 알려 poll 주기를 기다리지 않고 전송하도록 함"""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        if not settings.BOT_TARGET_URL:
+            logger.warning("BOT_TARGET_URL is not set; outbox delivery worker disabled")
+            return
+        self._task = asyncio.create_task(self._run(), name="webhook-outbox-worker")
+        logger.info("Webhook outbox worker started")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        logger.info("Webhook outbox worker stopped")
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                processed = await self.drain_batch()
+            except Exception as e:
+                logger.error(f"Outbox delivery batch failed: {str(e)}")
+                processed = 0
+
+            # 배치가 가득 찼다면 backlog 가 남아 있으므로 바로 다음 배치 처리
+            if processed >= settings.OUTBOX_BATCH_SIZE:
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=settings.OUTBOX_POLL_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain_batch(self) -> int:
+        """전송 시각이 도래한 행 한 배치를 전송하고 결과를 반영, 처리한 행 수 반환
+
+        lease 를 잡는 트랜잭션과 결과를 반영하는 트랜잭션을 짧게 나누어, Bot API 호출 동안
+        DB 커넥션이나 행 잠금을 잡고 있지 않습니다 (파티션 DETACH 도 막지 않음).
+        """
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            rows = await claim_pending_webhooks(
+                db,
+                now,
+                now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS),
+                settings.OUTBOX_BATCH_SIZE,
+            )
+            await db.commit()
+        if not rows:
+            return 0
+
+        client = http_clients.get(BOT)
+        semaphore = asyncio.Semaphore(max(1, settings.BOT_DELIVERY_CONCURRENCY))
+        results = await asyncio.gather(
+            *(deliver_bot_payload(client, semaphore, row.id, row.payload) for row in rows)
+        )
+
+        rows_by_id = {row.id: row for row in rows}
+        now = datetime.utcnow()
+        updates = [
+            self._delivery_update(result, rows_by_id[result.webhook_id], now)
+            for result in results
+        ]
+        async with AsyncSessionLocal() as db:
+            await update_webhook_deliveries(db, updates)
+            await db.commit()
+
+        delivered = sum(1 for result in results if result.status == "delivered")
+        logger.info(
+            f"Outbox batch processed: {len(rows)} rows, {delivered} delivered"
+        )
+        return len(rows)
+
+    def _delivery_update(
+        self, result: AlertDeliveryResult, row: Webhooks, now: datetime
+    ) -> Dict[str, Any]:
+        attempts = row.attempts + 1
+        # 파티션 키(created_at)를 포함한 기본 키로 갱신
+        update = {"id": row.id, "created_at": row.created_at, "attempts": attempts}
+
+        if result.status == "delivered":
+            update.update(
+                delivery_status="delivered", delivered_at=now, last_error=None
+            )
+        elif result.status == "retry" and attempts < settings.OUTBOX_MAX_ATTEMPTS:
+            update.update(
+                next_attempt_at=now + timedelta(seconds=compute_backoff(attempts)),
+                last_error=result.error,
+            )
+        else:
+            update.update(delivery_status="failed", last_error=result.error)
+
+        return update
+
+
+# 글로벌 워커 인스턴스
+outbox_worker = OutboxWorker()
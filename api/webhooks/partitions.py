@@ -0,0 +1,202 @@
+# /api/webhooks/partitions.py
+# webhooks 월별 파티션 생성 및 보관 기간이 지난 파티션 삭제
+
+import re
+from datetime import date, datetime
+from typing import List, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from config.db import maintenance_connection
+from config.logging_config import logger
+from config.metrics import registry
+from config.settings import settings
+
+PARENT_TABLE = "webhooks"
+DEFAULT_PARTITION = "webhooks_default"
+_PARTITION_NAME = re.compile(r"^webhooks_(\d{4})_(\d{2})$")
+
+WEBHOOK_DEFAULT_PARTITION_ROWS = registry.gauge(
+    "webhook_default_partition_rows",
+    "Rows found in the webhooks default partition at the last maintenance run",
+)
+
+
+def month_start(value: date, offset: int = 0) -> date:
+    """value 가 속한 달에서 offset 개월 이동한 달의 1일"""
+    index = value.year * 12 + value.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_{month.year:04d}_{month.month:02d}"
+
+
+async def _is_partitioned(conn: AsyncConnection) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = :name"
+        ),
+        {"name": PARENT_TABLE},
+    )
+    return result.scalar() is not None
+
+
+async def _list_partitions(conn: AsyncConnection) -> List[str]:
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = :name"
+        ),
+        {"name": PARENT_TABLE},
+    )
+    return [row[0] for row in result]
+
+
+async def create_month_partition(conn: AsyncConnection, month: date) -> None:
+    """[month, 다음 달) 범위 파티션 생성 (이미 있으면 무시)"""
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+            f"PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{month_start(month, 1).isoformat()}')"
+        )
+    )
+
+
+async def _default_partition_months(conn: AsyncConnection) -> List[Tuple[date, int]]:
+    """default 파티션에 행이 있는 달과 행 수"""
+    result = await conn.execute(
+        text(
+            f"SELECT date_trunc('month', created_at)::date AS month, count(*) "
+            f"FROM {DEFAULT_PARTITION} GROUP BY 1 ORDER BY 1"
+        )
+    )
+    return [(row[0], row[1]) for row in result]
+
+
+async def move_default_partition_rows(conn: AsyncConnection, month: date) -> None:
+    """default 파티션에 쌓인 month 의 행을 새 월 파티션으로 옮겨 붙임
+
+    default 파티션에 해당 범위의 행이 있으면 CREATE TABLE ... PARTITION OF 가 실패하므로,
+    같은 구조의 테이블을 만들어 행을 옮긴 뒤 ATTACH PARTITION 합니다 (인덱스는 ATTACH 시 생성).
+    """
+    name = partition_name(month)
+    start, end = month.isoformat(), month_start(month, 1).isoformat()
+    await conn.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    await conn.execute(
+        text(
+            f"WITH moved AS ("
+            f"DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE created_at >= '{start}' AND created_at < '{end}' RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        )
+    )
+    await conn.execute(
+        text(
+            f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    )
+
+
+async def _rescue_default_partition_rows(conn: AsyncConnection) -> None:
+    """월 파티션이 없어 default 파티션에 들어간 행을 월 파티션으로 옮김
+
+    옮긴 파티션은 이후 보관 기간 정리 대상이 되며, 행이 발견되면 파티션 생성이 누락되었다는
+    뜻이므로 경고 로그와 webhook_default_partition_rows 메트릭으로 알립니다.
+    """
+    if DEFAULT_PARTITION not in await _list_partitions(conn):
+        return
+    months = await _default_partition_months(conn)
+    await conn.commit()
+    WEBHOOK_DEFAULT_PARTITION_ROWS.set(sum(count for _, count in months))
+
+    for month, count in months:
+        logger.warning(
+            f"{count} webhooks rows for {month:%Y-%m} landed in {DEFAULT_PARTITION}; "
+            f"moving them to {partition_name(month)}"
+        )
+        try:
+            await move_default_partition_rows(conn, month)
+            await conn.commit()
+        except Exception as e:
+            await conn.rollback()
+            logger.error(
+                f"Failed to move {DEFAULT_PARTITION} rows to {partition_name(month)}: {str(e)}"
+            )
+
+
+async def ensure_webhook_partitions() -> None:
+    """default 파티션에 쌓인 행을 월 파티션으로 옮기고,
+    이번 달부터 WEBHOOK_PARTITION_MONTHS_AHEAD 개월 뒤까지의 파티션을 미리 생성"""
+    this_month = month_start(datetime.utcnow().date())
+    try:
+        async with maintenance_connection() as conn:
+            if not await _is_partitioned(conn):
+                logger.warning(
+                    "webhooks table is not partitioned; run the database migrations"
+                )
+                return
+            await _rescue_default_partition_rows(conn)
+            for offset in range(settings.WEBHOOK_PARTITION_MONTHS_AHEAD + 1):
+                # 파티션별로 commit 하여 한 파티션의 실패가 나머지에 영향을 주지 않도록 함
+                try:
+                    await create_month_partition(conn, month_start(this_month, offset))
+                    await conn.commit()
+                except Exception as e:
+                    await conn.rollback()
+                    logger.error(f"Failed to create webhooks partition: {str(e)}")
+    except Exception as e:
+        logger.error(f"Failed to ensure webhooks partitions: {str(e)}")
+
+
+async def drop_expired_webhook_partitions() -> List[str]:
+    """보관 기간(WEBHOOK_RETENTION_MONTHS)이 지난 월 파티션을 DETACH 후 DROP
+
+    대량 DELETE 대신 파티션 단위로 삭제하므로 테이블 bloat/긴 잠금이 발생하지 않습니다.
+    """
+    if settings.WEBHOOK_RETENTION_MONTHS <= 0:
+        return []
+
+    cutoff = month_start(datetime.utcnow().date(), -settings.WEBHOOK_RETENTION_MONTHS)
+    dropped = []
+    async with maintenance_connection() as conn:
+        if not await _is_partitioned(conn):
+            return []
+        for name in await _list_partitions(conn):
+            match = _PARTITION_NAME.match(name)
+            if not match:
+                continue
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            # 파티션의 상한(다음 달 1일)이 cutoff 이전이면 모든 행이 보관 기간을 지남
+            if month_start(month, 1) > cutoff:
+                continue
+            try:
+                await conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+                await conn.execute(text(f"DROP TABLE {name}"))
+                await conn.commit()
+                dropped.append(name)
+            except Exception as e:
+                await conn.rollback()
+                logger.error(f"Failed to drop webhooks partition {name}: {str(e)}")
+
+    if dropped:
+        logger.info(f"Dropped expired webhooks partitions: {', '.join(dropped)}")
+    return dropped
+
+
+async def maintain_webhook_partitions() -> None:
+    """스케줄러 유지보수 작업: default 파티션 행 이동, 다음 달 파티션 생성 및 만료 파티션 삭제"""
+    await ensure_webhook_partitions()
+    try:
+        await drop_expired_webhook_partitions()
+    except Exception as e:
+        logger.error(f"Failed to drop expired webhooks partitions: {str(e)}")
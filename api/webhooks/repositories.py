@@ -1,31 +1,178 @@
 # /api/webhooks/repositories.py
 # 웹훅 CRUD 동작 정의
 
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from .models import Webhooks
-from .schemas import WebhookPayload
+from .models import AlertDedup, Webhooks
+from .schemas import WebhookFilter
 
 
-async def save_webhook_data(db: AsyncSession, payload: WebhookPayload):
-    # payload가 이미 딕셔너리일 경우, 변환하지 않도록 합니다
-    if isinstance(payload, WebhookPayload):
-        payload_dict = payload.dict()
-    elif isinstance(payload, dict):
-        payload_dict = payload
-    else:
-        raise ValueError(f"Unsupported payload type: {type(payload)}")
+async def claim_alert_keys(
+    db: AsyncSession, keys: List[Tuple[str, str]], now: datetime, cutoff: datetime
+) -> Set[Tuple[str, str]]:
+    """(fingerprint, status) 키 중 억제 구간(cutoff 이후)에 전송 이력이 없는 키를 선점
 
-    print(payload_dict)  # payload 내용을 출력하여 확인합니다.
+    단일 INSERT ... ON CONFLICT DO UPDATE ... WHERE 문으로 처리하므로 여러 레플리카가
+    동시에 같은 알림을 받아도 한 곳만 키를 반환받습니다. commit 은 호출자가 수행합니다.
+    """
+    if not keys:
+        return set()
 
-    webhook_dict = {"payload": payload_dict}  # payload 데이터를 JSON 형식으로 저장
+    query = pg_insert(AlertDedup).values(
+        [
+            {"fingerprint": fingerprint, "status": status, "last_seen_at": now}
+            for fingerprint, status in keys
+        ]
+    )
+    query = query.on_conflict_do_update(
+        index_elements=[AlertDedup.fingerprint, AlertDedup.status],
+        set_={"last_seen_at": query.excluded.last_seen_at},
+        where=AlertDedup.last_seen_at < cutoff,
+    ).returning(AlertDedup.fingerprint, AlertDedup.status)
+    result = await db.execute(query)
+    return {(row.fingerprint, row.status) for row in result}
 
-    db_webhook = Webhooks(**webhook_dict)
-    db.add(db_webhook)
+
+async def get_alert_keys_last_seen(
+    db: AsyncSession, keys: List[Tuple[str, str]]
+) -> Dict[Tuple[str, str], datetime]:
+    """선점에 실패한 키들의 마지막 전송 시각 (억제 구간이 끝나는 시각 계산용)"""
+    if not keys:
+        return {}
+
+    query = select(
+        AlertDedup.fingerprint, AlertDedup.status, AlertDedup.last_seen_at
+    ).where(tuple_(AlertDedup.fingerprint, AlertDedup.status).in_(keys))
+    result = await db.execute(query)
+    return {(row.fingerprint, row.status): row.last_seen_at for row in result}
+
+
+async def delete_alert_keys_before(
+    db: AsyncSession, cutoff: datetime, batch_size: int
+) -> int:
+    """억제 구간이 지난(cutoff 이전) 키를 최대 batch_size 개 삭제"""
+    batch = (
+        select(AlertDedup.fingerprint, AlertDedup.status)
+        .where(AlertDedup.last_seen_at < cutoff)
+        .limit(batch_size)
+    )
+    result = await db.execute(
+        delete(AlertDedup).where(
+            tuple_(AlertDedup.fingerprint, AlertDedup.status).in_(batch)
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def save_webhook_batch(db: AsyncSession, rows: List[Dict[str, Any]]):
+    """하나의 Alertmanager 요청에 포함된 행(payload 및 추출 컬럼)들을 단일 multi-row INSERT 로 저장"""
+    if not rows:
+        return 0
+
+    query = insert(Webhooks).values(rows)
+    await db.execute(query)
     await db.commit()
-    await db.refresh(db_webhook)
+    return len(rows)
+
+
+async def claim_pending_webhooks(
+    db: AsyncSession, now: datetime, lease_until: datetime, limit: int
+):
+    """전송 시각이 도래한 outbox 행의 next_attempt_at 을 lease_until 로 미루고(lease) 반환
+
+    SKIP LOCKED 로 다른 워커/레플리카가 처리 중인 행을 건너뛰고, lease 를 commit 하면
+    잠금 없이도 lease_until 까지 다른 워커가 같은 행을 가져가지 않습니다. 결과 반영 전에
+    프로세스가 종료되면 lease 가 끝난 뒤 다시 전송됩니다.
+    """
+    claimable = (
+        select(Webhooks.id, Webhooks.created_at)
+        .where(Webhooks.delivery_status == "pending")
+        .where(Webhooks.next_attempt_at <= now)
+        .order_by(Webhooks.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    query = (
+        update(Webhooks)
+        .where(tuple_(Webhooks.id, Webhooks.created_at).in_(claimable))
+        .values(next_attempt_at=lease_until)
+        .returning(Webhooks)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def update_webhook_deliveries(db: AsyncSession, updates: List[Dict[str, Any]]):
+    """기본 키(id, created_at)를 포함한 행별 변경값 목록으로 전송 결과를 일괄 반영 (executemany)"""
+    if not updates:
+        return
+    await db.execute(update(Webhooks), updates)
+
+
+async def get_outbox_stats(db: AsyncSession) -> Dict[str, Any]:
+    """delivery_status 별 행 수와 가장 오래된 대기 행 생성 시각"""
+    count_query = select(Webhooks.delivery_status, func.count()).group_by(
+        Webhooks.delivery_status
+    )
+    counts = dict((await db.execute(count_query)).all())
+
+    oldest_query = select(func.min(Webhooks.created_at)).where(
+        Webhooks.delivery_status == "pending"
+    )
+    oldest_pending = (await db.execute(oldest_query)).scalar_one_or_none()
+
+    return {
+        "pending": counts.get("pending", 0),
+        "delivered": counts.get("delivered", 0),
+        "failed": counts.get("failed", 0),
+        "oldest_pending_at": oldest_pending,
+    }
+
+
+def _filtered_webhooks_query(filters: WebhookFilter):
+    """조회 조건을 적용한 select (created_at 범위 조건은 파티션 pruning 에 사용됨)"""
+    query = select(Webhooks)
+    if filters.since:
+        query = query.where(Webhooks.created_at >= filters.since)
+    if filters.until:
+        query = query.where(Webhooks.created_at < filters.until)
+    if filters.alertname:
+        query = query.where(Webhooks.alertname == filters.alertname)
+    if filters.severity:
+        query = query.where(Webhooks.severity == filters.severity)
+    if filters.status:
+        query = query.where(Webhooks.status == filters.status)
+    return query.order_by(Webhooks.created_at.desc(), Webhooks.id.desc())
+
 
-    return db_webhook
+async def get_webhooks(
+    db: AsyncSession,
+    filters: WebhookFilter,
+    before: Optional[Tuple[datetime, int]] = None,
+    limit: int = 100,
+):
+    """최신순 조회, before=(created_at, id) 를 주면 그 이전 행부터 (keyset 페이지네이션)"""
+    query = _filtered_webhooks_query(filters)
+    if before is not None:
+        query = query.where(tuple_(Webhooks.created_at, Webhooks.id) < before)
+    result = await db.execute(query.limit(limit))
+    return result.scalars().all()
 
 
-async def fetch_grafana_contact_points(client):
-    return await client.get_contact_points()
+async def stream_webhooks(
+    db: AsyncSession, filters: WebhookFilter, batch_size: int
+) -> AsyncIterator[Webhooks]:
+    """서버 측 커서로 batch_size 행씩 가져오며 순회 (전체 결과를 메모리에 올리지 않음)"""
+    result = await db.stream(
+        _filtered_webhooks_query(filters).execution_options(yield_per=batch_size)
+    )
+    async for partition in result.scalars().partitions():
+        for webhook in partition:
+            yield webhook
+        # 이미 내보낸 행은 세션에서 해제
+        db.expunge_all()
@@ -1,9 +1,11 @@
 # /api/webhooks/routers.py
 # FastAPI 웹훅 라우터 정의
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from . import schemas, services
 from config.db import get_db
 
@@ -13,7 +15,7 @@ router = APIRouter()
 @router.post(
     "/webhook",
     response_model=schemas.WebhookStatusResponse,
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def handle_webhook(
     webhook: schemas.AlertManagerPayload, db: AsyncSession = Depends(get_db)
@@ -26,6 +28,66 @@ async def handle_webhook(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/webhook/outbox", response_model=schemas.OutboxStats)
+async def get_outbox_backlog(db: AsyncSession = Depends(get_db)):
+    """outbox 전송 대기(backlog) 깊이 및 상태별 행 수 조회"""
+    return await services.get_outbox_backlog(db)
+
+
+@router.get("/webhook/dedup", response_model=schemas.DedupStats)
+async def get_dedup_stats():
+    """중복 억제 카운터 (전달 vs 억제) 조회"""
+    return services.get_dedup_stats()
+
+
+@router.get("/contact-points/cache", response_model=schemas.ContactPointCacheStats)
+async def get_contact_points_cache():
+    """Grafana contact points 캐시 상태 조회"""
+    return services.get_contact_point_cache_stats()
+
+
 @router.get("/contact-points", response_model=List[schemas.ContactPoint])
-async def get_contact_points(db: AsyncSession = Depends(get_db)):
-    return await services.get_grafana_contact_points(db)
+async def get_contact_points():
+    """캐시를 거쳐 Grafana contact points 조회 (DB 세션 불필요)"""
+    return await services.get_grafana_contact_points()
+
+
+def webhook_filter(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    alertname: Optional[str] = None,
+    severity: Optional[str] = None,
+    alert_status: Optional[str] = Query(default=None, alias="status"),
+) -> schemas.WebhookFilter:
+    return schemas.WebhookFilter(
+        since=since,
+        until=until,
+        alertname=alertname,
+        severity=severity,
+        status=alert_status,
+    )
+
+
+@router.get("/webhooks", response_model=List[schemas.WebhookRecord])
+async def read_webhooks(
+    response: Response,
+    filters: schemas.WebhookFilter = Depends(webhook_filter),
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """저장된 웹훅을 최신순으로 조회, 다음 커서는 X-Next-Cursor 헤더로 반환"""
+    webhooks, next_cursor = await services.get_webhook_list(db, filters, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return webhooks
+
+
+@router.get("/webhooks/export")
+async def export_webhooks(filters: schemas.WebhookFilter = Depends(webhook_filter)):
+    """조건에 맞는 웹훅 전체를 NDJSON 으로 스트리밍"""
+    return StreamingResponse(
+        services.export_webhooks_ndjson(filters),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="webhooks.ndjson"'},
+    )
@@ -1,6 +1,7 @@
 # /api/webhooks/schemas.py
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Any, Literal, Optional
 
 
 class ContactPoint(BaseModel):
@@ -43,6 +44,81 @@ class WebhookPayload(BaseModel):
     target: str
 
 
+class AlertDeliveryResult(BaseModel):
+    webhook_id: int
+    status: Literal["delivered", "retry", "failed"]
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+
 class WebhookStatusResponse(BaseModel):
     status: str
     message: str
+    total: int = 0
+    queued: int = 0
+    suppressed: int = 0
+
+
+class DedupStats(BaseModel):
+    forwarded: int
+    suppressed: int
+    cached_keys: int
+    window_seconds: int
+
+
+class OutboxStats(BaseModel):
+    pending: int
+    delivered: int
+    failed: int
+    oldest_pending_at: Optional[datetime] = None
+
+
+class ContactPointCacheStats(BaseModel):
+    cached: bool
+    age_seconds: Optional[float] = None
+    etag: Optional[str] = None
+    hits: int
+    misses: int
+    revalidated: int
+    consecutive_failures: int = 0
+    retry_after: Optional[float] = None  # 갱신 실패 후 다음 시도까지 남은 시간(초)
+    last_error: Optional[str] = None
+
+
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """timezone 이 있는 시각을 UTC 로 변환하고 tzinfo 제거 (created_at 은 naive UTC 컬럼)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class WebhookFilter(BaseModel):
+    """저장된 웹훅 조회/내보내기 조건 (created_at 은 UTC 기준)"""
+
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    alertname: Optional[str] = None
+    severity: Optional[str] = None
+    status: Optional[str] = None
+
+    @field_validator("since", "until")
+    @classmethod
+    def _to_naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return to_naive_utc(value)
+
+
+class WebhookRecord(BaseModel):
+    id: int
+    created_at: datetime
+    alertname: Optional[str] = None
+    severity: Optional[str] = None
+    status: Optional[str] = None
+    fingerprint: Optional[str] = None
+    delivery_status: str
+    attempts: int
+    delivered_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    payload: Dict[str, Any]
+
+    class Config:
+        from_attributes = True
@@ -1,121 +1,165 @@
 # /api/webhooks/services.py
 # 웹훅 비즈니스 로직 정의
 
-from .schemas import AlertManagerPayload, WebhookStatusResponse
-from .repositories import save_webhook_data, fetch_grafana_contact_points
-from .grafana_client import GrafanaClient
+from .schemas import (
+    Alert,
+    AlertManagerPayload,
+    WebhookFilter,
+    WebhookRecord,
+    WebhookStatusResponse,
+    to_naive_utc,
+)
+from .repositories import (
+    save_webhook_batch,
+    get_outbox_stats,
+    get_webhooks,
+    stream_webhooks,
+)
+from .dedup import alert_deduplicator
+from .outbox import outbox_worker
+from .grafana_cache import contact_point_cache
+from config.db import AsyncSessionLocal, disable_statement_timeout
+from config.logging_config import logger
 from config.settings import settings
 from datetime import datetime
-import httpx
-import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 
 
-async def process_and_forward_webhook(
-    db, webhook_in: AlertManagerPayload
-) -> WebhookStatusResponse:
-
-    # 외부 API로 전송할 Payload 생성
-    alerts_summary = [
-        {
-            "alertname": alert.labels.get("alertname", ""),
+def build_bot_payload(alert: Alert) -> Dict[str, Any]:
+    """Alertmanager alert 를 외부 Bot API 로 전송할 Payload 로 변환"""
+    return {
+        "botEnv": settings.BOT_ENV,
+        "botId": settings.BOT_ID,
+        "contentsType": settings.BOT_CONTENTS_TYPE,
+        "contentsId": settings.BOT_CONTENTS_ID,
+        "targetUserId": settings.BOT_TARGET_USER_ID,
+        "contentsParams": {
+            "subject": alert.labels.get("alertname", ""),
+            "contents": alert.annotations.get("description", ""),
             "status": alert.status,
             "instance": alert.labels.get("instance", ""),
             "job": alert.labels.get("job", ""),
             "severity": alert.labels.get("severity", ""),
-            "description": alert.annotations.get("description", ""),
             "summary": alert.annotations.get("summary", ""),
             "startsAt": alert.startsAt,
             "endsAt": alert.endsAt,
             "generatorURL": alert.generatorURL,
-        }
-        for alert in webhook_in.alerts
-    ]
-
-    # 프록시 설정
-    transport = httpx.AsyncHTTPTransport(proxy=httpx.Proxy(url=settings.HTTP_PROXY))
-
-    # Webhook 데이터를 외부 API로 전송
-    async with httpx.AsyncClient(transport=transport) as client:
-        for alert in alerts_summary:
-
-            payload = {
-                "botEnv": settings.BOT_ENV,
-                "botId": settings.BOT_ID,
-                "contentsType": settings.BOT_CONTENTS_TYPE,
-                "contentsId": settings.BOT_CONTENTS_ID,
-                "targetUserId": settings.BOT_TARGET_USER_ID,
-                "contentsParams": {
-                    "subject": alert["alertname"],
-                    "contents": alert["description"],
-                    "status": alert["status"],
-                    "instance": alert["instance"],
-                    "job": alert["job"],
-                    "severity": alert["severity"],
-                    "summary": alert["summary"],
-                    "startsAt": alert["startsAt"],
-                    "endsAt": alert["endsAt"],
-                    "generatorURL": alert["generatorURL"],
-                },
-                "chatType": "general",
-                "target": "user",
-            }
-
-            try:
-                # Webhook 데이터를 DB에 저장
-                await save_webhook_data(db, payload)
-            except SQLAlchemyError as e:
-                print(f"Database error occurred: {str(e)}")
-                raise HTTPException(
-                    status_code=500, detail="Failed to save webhook data"
-                )
-            except Exception as e:
-                print(f"Unexpected error occurred: {str(e)}")
-                raise HTTPException(
-                    status_code=500, detail="An unexpected error occurred"
-                )
-
-            try:
-                response = await client.post(
-                    settings.BOT_TARGET_URL,
-                    json=payload,
-                    headers={
-                        "Accept": "application/json",
-                        "Authorization": f"Bearer {settings.BOT_AUTH_TOKEN}",
-                        "Content-Type": "application/json",
-                    },
-                )
-                response.raise_for_status()
-                print(f"Successfully sent webhook. Status code: {response.status_code}")
-
-            except httpx.HTTPStatusError as exc:
-                print(
-                    f"HTTP error occurred: {exc.response.status_code} - {exc.response.text}"
-                )
-                return WebhookStatusResponse(
-                    status="error", message="processed with an error"
-                )
-
-            except httpx.ConnectError as exc:
-                print(f"Connection error occurred: {exc}")
-                raise HTTPException(
-                    status_code=500, detail="Failed to connect to the external server"
-                )
-            except Exception as exc:
-                print(f"An unexpected error occurred: {exc}")
-                raise HTTPException(
-                    status_code=500, detail="An unexpected error occurred"
-                )
+        },
+        "chatType": "general",
+        "target": "user",
+    }
+
+
+def build_webhook_row(alert: Alert) -> Dict[str, Any]:
+    """outbox 에 저장할 행 (Bot payload 와 조회용 추출 컬럼)"""
+    return {
+        "payload": build_bot_payload(alert),
+        "alertname": alert.labels.get("alertname"),
+        "severity": alert.labels.get("severity"),
+        "status": alert.status,
+        "fingerprint": alert.fingerprint,
+    }
+
+
+async def process_and_forward_webhook(
+    db, webhook_in: AlertManagerPayload
+) -> WebhookStatusResponse:
+    """alert 들을 outbox 에 저장하고 즉시 반환 (Bot 전송은 outbox 워커가 담당)
+
+    억제 구간 내에 이미 전달된 fingerprint+status 의 alert 는 저장/전송하지 않습니다.
+    """
+
+    try:
+        # 중복 alert 제외 (키 선점과 outbox 저장은 같은 트랜잭션에서 commit)
+        alerts, claimed_keys = await alert_deduplicator.filter_new(db, webhook_in.alerts)
+
+        # 외부 API로 전송할 Payload 와 조회용 컬럼 생성
+        rows = [build_webhook_row(alert) for alert in alerts]
+
+        # 하나의 트랜잭션, 단일 multi-row INSERT 로 outbox 에 저장
+        await save_webhook_batch(db, rows)
+    except SQLAlchemyError as e:
+        logger.error(f"Database error occurred: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to save webhook data")
+    except Exception as e:
+        logger.error(f"Unexpected error occurred: {str(e)}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+    # commit 된 뒤에만 캐시 기록 및 전달/억제 건수 집계
+    alert_deduplicator.remember(
+        claimed_keys,
+        forwarded=len(alerts),
+        suppressed=len(webhook_in.alerts) - len(alerts),
+    )
+
+    # 대기 중인 outbox 워커를 깨워 바로 전송 시작
+    if rows:
+        outbox_worker.notify()
 
     return WebhookStatusResponse(
-        status="success",
-        message=f"Webhook processed successfully push alerts",
+        status="accepted",
+        message="Webhook queued for delivery",
+        total=len(webhook_in.alerts),
+        queued=len(rows),
+        suppressed=len(webhook_in.alerts) - len(rows),
     )
 
 
-async def get_grafana_contact_points(db):
-    # Grafana 클라이언트를 통해 contact points 가져오기
-    grafana_client = GrafanaClient()
-    contact_points = await fetch_grafana_contact_points(grafana_client)
-    return contact_points
+async def get_outbox_backlog(db) -> Dict[str, Any]:
+    return await get_outbox_stats(db)
+
+
+def get_dedup_stats() -> Dict[str, int]:
+    return alert_deduplicator.stats()
+
+
+async def get_grafana_contact_points():
+    # 캐시를 거쳐 Grafana contact points 가져오기 (만료 시 ETag 로 재검증)
+    return await contact_point_cache.get()
+
+
+def get_contact_point_cache_stats() -> Dict[str, Any]:
+    return contact_point_cache.stats()
+
+
+def encode_webhook_cursor(webhook) -> str:
+    return f"{webhook.created_at.isoformat()},{webhook.id}"
+
+
+def decode_webhook_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, webhook_id = cursor.rsplit(",", 1)
+        return to_naive_utc(datetime.fromisoformat(created_at)), int(webhook_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def get_webhook_list(
+    db, filters: WebhookFilter, cursor: Optional[str] = None, limit: int = 100
+) -> Tuple[List[Any], Optional[str]]:
+    """조건에 맞는 웹훅 한 페이지와 다음 페이지 커서 (마지막 페이지면 None)"""
+    before = decode_webhook_cursor(cursor) if cursor else None
+    webhooks = await get_webhooks(db, filters, before=before, limit=limit)
+    next_cursor = encode_webhook_cursor(webhooks[-1]) if len(webhooks) == limit else None
+    return webhooks, next_cursor
+
+
+async def export_webhooks_ndjson(filters: WebhookFilter) -> AsyncIterator[bytes]:
+    """조건에 맞는 웹훅 전체를 NDJSON 으로 스트리밍 (행 수와 무관하게 일정한 메모리 사용)
+
+    yield 의존성(get_db)은 응답 스트리밍 전에 종료되므로 생성기 안에서 세션을 직접 엽니다.
+    """
+    batch_size = settings.WEBHOOK_EXPORT_BATCH_SIZE
+    async with AsyncSessionLocal() as db:
+        # 커서 fetch 가 느린 대량 export 도 DB_STATEMENT_TIMEOUT_MS 로 취소되지 않도록 함
+        await disable_statement_timeout(db)
+        lines: List[str] = []
+        async for webhook in stream_webhooks(db, filters, batch_size):
+            lines.append(WebhookRecord.model_validate(webhook).model_dump_json())
+            if len(lines) >= batch_size:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
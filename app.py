@@ -1,17 +1,30 @@
 # /app.py
 # FastAPI 애플리케이션(라우터 포함) 초기화
 
-from fastapi import FastAPI, Request
+import random
+import re
+import time
+from typing import Dict
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from scheduler.tasks import start_scheduler
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from scheduler.tasks import shutdown_scheduler, start_scheduler
 
 from api.users import routers as users_routers
 from api.webhooks import routers as webhooks_routers
 from api.platform import routers as platform_routers
+from api.platform.jobs import run_job_worker
+from api.webhooks.outbox import outbox_worker
+from api.webhooks.partitions import ensure_webhook_partitions
 from api.scheduler_config import routers as scheduler_routers
-from config.db import Base, engine
+from api.run_history import routers as run_history_routers
+from api.monitoring import routers as monitoring_routers
+from api.monitoring.health import health_monitor
+from config.db import Base, engine, get_engine_config
+from config.http_clients import http_clients
 from config.logging_config import logger
+from config.metrics import HTTP_REQUEST_DURATION
+from config.settings import settings
 
 app = FastAPI()
 
@@ -33,37 +46,172 @@ async def create_tables():
 # 애플리케이션 시작 시 테이블 생성
 @app.on_event("startup")
 async def startup_event():
+    logger.info(f"Database engine configuration: {get_engine_config()}")
     await create_tables()
+    await ensure_webhook_partitions()
+    await http_clients.startup()
+    await health_monitor.start()
+    await run_job_worker.start()
+    await outbox_worker.start()
     await start_scheduler()
 
 
-# 요청 및 응답 로깅 미들웨어
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        logger.info(f"Request: {request.method} {request.url}")
-        logger.info(f"Request headers: {request.headers}")
+# 애플리케이션 종료 시 스케줄러, 백그라운드 워커 및 외부 HTTP 클라이언트 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    await shutdown_scheduler()
+    await run_job_worker.stop()
+    await outbox_worker.stop()
+    await health_monitor.stop()
+    await http_clients.shutdown()
+
+
+# 요청 및 응답 로깅 미들웨어 (순수 ASGI, 요청/응답 스트림을 감싸지 않음)
+class AccessLogMiddleware:
+    """method, path, status, 처리 시간, 요청/응답 크기를 한 줄로 기록하는 접근 로그 미들웨어
+
+    라우트별 HTTP 지연 시간 메트릭도 함께 기록하므로 접근 로그를 꺼도 항상 등록됩니다.
+
+    본문과 헤더는 샘플링된 요청 또는 에러 응답에 한해서만 크기 제한/헤더 마스킹 후 기록합니다.
+    비밀번호/토큰 등 ACCESS_LOG_REDACT_FIELDS 필드 값은 가리고, ACCESS_LOG_REDACT_PATHS
+    경로의 본문은 기록하지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.log_enabled = settings.ACCESS_LOG_ENABLED
+        self.sample_rate = settings.ACCESS_LOG_BODY_SAMPLE_RATE
+        self.body_on_error = settings.ACCESS_LOG_BODY_ON_ERROR
+        self.max_body = settings.ACCESS_LOG_MAX_BODY
+        self.redact_headers = {
+            header.strip().lower().encode("latin-1")
+            for header in settings.ACCESS_LOG_REDACT_HEADERS.split(",")
+            if header.strip()
+        }
+        self.redact_paths = tuple(
+            path.strip() for path in settings.ACCESS_LOG_REDACT_PATHS.split(",") if path.strip()
+        )
+        fields = "|".join(
+            re.escape(field.strip())
+            for field in settings.ACCESS_LOG_REDACT_FIELDS.split(",")
+            if field.strip()
+        )
+        # JSON ("password": "...") 및 form/쿼리 (password=...) 형식의 값 (잘린 본문도 처리)
+        self.redact_pattern = (
+            re.compile(
+                rf'("(?:{fields})"\s*:\s*)"(?:[^"\\]|\\.)*"?|(\b(?:{fields})=)[^&\s]*',
+                re.IGNORECASE,
+            )
+            if fields
+            else None
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        sampled = (
+            self.log_enabled
+            and self.sample_rate > 0
+            and random.random() < self.sample_rate
+        )
+        # 에러 시 본문을 남기려면 최대 max_body 만큼만 미리 버퍼링
+        buffer_bodies = sampled or (self.log_enabled and self.body_on_error)
+        state = {"status": 500, "request_bytes": 0, "response_bytes": 0}
+        request_body = bytearray()
+        response_body = bytearray()
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                state["request_bytes"] += len(body)
+                if buffer_bodies and len(request_body) < self.max_body:
+                    request_body.extend(body[: self.max_body - len(request_body)])
+            return message
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                state["response_bytes"] += len(body)
+                if buffer_bodies and len(response_body) < self.max_body:
+                    response_body.extend(body[: self.max_body - len(response_body)])
+            await send(message)
 
-        # 요청 본문 로깅
         try:
-            request_body = await request.json()
-            logger.info(f"Request body: {request_body}")
-        except Exception as e:
-            logger.error(f"Failed to log request body: {e}")
-
-        response = await call_next(request)
-        logger.info(f"Response status: {response.status_code}")
-        return response
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            duration_ms = duration * 1000
+            status_code = state["status"]
+
+            # 라우트 템플릿 기준으로 집계 (경로 파라미터별로 시계열이 늘어나지 않도록)
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                duration,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=status_code,
+            )
+
+            if self.log_enabled:
+                logger.info(
+                    "%s %s %d %.1fms req=%dB resp=%dB",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    duration_ms,
+                    state["request_bytes"],
+                    state["response_bytes"],
+                )
+                if sampled or (self.body_on_error and status_code >= 500):
+                    logger.info(
+                        "Request detail: %s %s?%s headers=%s body=%r response=%r",
+                        scope["method"],
+                        scope["path"],
+                        self._redact(scope.get("query_string", b"").decode("latin-1")),
+                        self._headers(scope),
+                        self._body(scope, request_body),
+                        self._body(scope, response_body),
+                    )
+
+    def _redact(self, value: str) -> str:
+        if self.redact_pattern is None:
+            return value
+        return self.redact_pattern.sub(
+            lambda m: f'{m.group(1)}"[REDACTED]"' if m.group(1) else f"{m.group(2)}[REDACTED]",
+            value,
+        )
+
+    def _body(self, scope: Scope, body: bytearray) -> str:
+        if scope["path"].startswith(self.redact_paths):
+            return "[REDACTED]" if body else ""
+        return self._redact(bytes(body).decode("utf-8", errors="replace"))
+
+    def _headers(self, scope: Scope) -> Dict[str, str]:
+        return {
+            name.decode("latin-1"): (
+                "[REDACTED]" if name.lower() in self.redact_headers else value.decode("latin-1")
+            )
+            for name, value in scope.get("headers", [])
+        }
 
 
 # 미들웨어 등록
-# app.add_middleware(LoggingMiddleware)
+app.add_middleware(AccessLogMiddleware)
 
 
 # 라우터 등록
 # app.include_router(users_routers.router, prefix="/api/v1")
-# app.include_router(webhooks_routers.router, prefix="/api/v1")
+app.include_router(webhooks_routers.router, prefix="/api/v1")
 app.include_router(platform_routers.router, prefix="/api/v1")
 app.include_router(scheduler_routers.router, prefix="/api/v1")
+app.include_router(run_history_routers.router, prefix="/api/v1")
+app.include_router(monitoring_routers.router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,47 +1,112 @@
-# /config/db.py
-# 데이터베이스 설정
-
-from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import (
-    create_async_engine,
-    AsyncSession,
-    async_sessionmaker,
-)
-from sqlalchemy.orm import declarative_base
-from .settings import settings
-from typing import AsyncGenerator
-
-engine = create_async_engine(
-    settings.DB_URL,
-    echo=True,
-)
-
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    autocommit=False,
-    expire_on_commit=False,
-    class_=AsyncSession,
-)
-
-naming_convention = {
-    "ix": "%(column_0_label)s_idx",
-    "uq": "%(table_name)s_%(column_0_name)s_key",
-    "ck": "%(table_name)s_%(constraint_name)s_check",
-    "fk": "%(table_name)s_%(column_0_name)s_fkey",
-    "pk": "%(table_name)s_pkey",
-}
-
-Base = declarative_base(metadata=MetaData(naming_convention=naming_convention))
-
-
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """비동기 데이터베이스 세션을 제공하는 의존성 함수"""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+# /config/db.py
+# 데이터베이스 설정
+
+from contextlib import asynccontextmanager
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+)
+from sqlalchemy.orm import declarative_base
+from .settings import settings
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Union
+
+def _build_engine_url() -> URL:
+    """asyncpg prepared statement 캐시 크기를 URL 쿼리로 적용"""
+    url = make_url(settings.DB_URL)
+    return url.update_query_dict(
+        {"prepared_statement_cache_size": str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)}
+    )
+
+
+def _build_connect_args() -> Dict[str, Any]:
+    server_settings = {"application_name": settings.PROJECT_NAME}
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    return {"server_settings": server_settings}
+
+
+engine = create_async_engine(
+    _build_engine_url(),
+    echo=settings.db_echo,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=_build_connect_args(),
+)
+
+
+def get_engine_config() -> Dict[str, Any]:
+    """적용된 엔진/커넥션 풀 설정 (시작 로그용)"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "statement_timeout_ms": settings.DB_STATEMENT_TIMEOUT_MS,
+        "echo": settings.db_echo,
+    }
+
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    autocommit=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
+naming_convention = {
+    "ix": "%(column_0_label)s_idx",
+    "uq": "%(table_name)s_%(column_0_name)s_key",
+    "ck": "%(table_name)s_%(constraint_name)s_check",
+    "fk": "%(table_name)s_%(column_0_name)s_fkey",
+    "pk": "%(table_name)s_pkey",
+}
+
+Base = declarative_base(metadata=MetaData(naming_convention=naming_convention))
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션을 제공하는 의존성 함수"""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def disable_statement_timeout(conn: Union[AsyncConnection, AsyncSession]) -> None:
+    """현재 트랜잭션에서만 statement_timeout 해제 (대량 export 등 오래 걸리는 조회용)"""
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        await conn.execute(text("SET LOCAL statement_timeout = 0"))
+
+
+@asynccontextmanager
+async def maintenance_connection() -> AsyncIterator[AsyncConnection]:
+    """statement_timeout 없이 여러 트랜잭션을 실행하는 유지보수용 커넥션
+
+    파티션 행 이동/DETACH/DROP 처럼 오래 걸릴 수 있는 작업에 사용하며, 풀에 반납하기 전에
+    접속 시 설정(DB_STATEMENT_TIMEOUT_MS)으로 되돌립니다.
+    """
+    async with engine.connect() as conn:
+        if settings.DB_STATEMENT_TIMEOUT_MS <= 0:
+            yield conn
+            return
+        await conn.execute(text("SET statement_timeout = 0"))
+        await conn.commit()
+        try:
+            yield conn
+        finally:
+            await conn.rollback()
+            await conn.execute(text("RESET statement_timeout"))
+            await conn.commit()
@@ -0,0 +1,125 @@
+# /config/http_clients.py
+# 외부 HTTP 클라이언트 레지스트리 (목적지별 장수명 커넥션 풀)
+
+import httpx
+from typing import Dict, Optional
+from .logging_config import logger
+from .settings import settings
+
+# 목적지 키
+PLATFORM = "platform"  # Node.js Platform Service
+BOT = "bot"  # 알림 Bot API
+GRAFANA = "grafana"  # Grafana API
+
+
+def _http2_available() -> bool:
+    """HTTP/2 사용에 필요한 h2 패키지 설치 여부 확인"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientRegistry:
+    """목적지별 httpx.AsyncClient 를 애플리케이션 수명 동안 보관하는 레지스트리
+
+    startup 시 생성하고 shutdown 시 닫으며, 요청마다 TCP/TLS 연결과 프록시 설정을
+    다시 만들지 않도록 커넥션 풀과 keep-alive 를 재사용합니다.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _limits(self, max_connections: int, max_keepalive: int) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+
+    def _timeout(self, read_timeout: float) -> httpx.Timeout:
+        return httpx.Timeout(read_timeout, connect=settings.HTTP_CONNECT_TIMEOUT)
+
+    def _http2(self) -> bool:
+        if settings.HTTP2_ENABLED and not _http2_available():
+            logger.warning("HTTP2_ENABLED is set but 'h2' is not installed; using HTTP/1.1")
+            return False
+        return settings.HTTP2_ENABLED
+
+    def _build(self, name: str) -> httpx.AsyncClient:
+        if name == PLATFORM:
+            # 로컬 Node.js 서비스는 프록시를 거치지 않음
+            return httpx.AsyncClient(
+                base_url=f"http://localhost:{settings.NODE_APP_PORT}",
+                limits=self._limits(
+                    settings.NODE_HTTP_MAX_CONNECTIONS, settings.NODE_HTTP_MAX_KEEPALIVE
+                ),
+                timeout=self._timeout(settings.NODE_HTTP_TIMEOUT),
+                trust_env=False,
+            )
+
+        if name == BOT:
+            headers = {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            }
+            if settings.BOT_AUTH_TOKEN:
+                headers["Authorization"] = f"Bearer {settings.BOT_AUTH_TOKEN}"
+            return httpx.AsyncClient(
+                headers=headers,
+                proxy=settings.HTTP_PROXY or None,
+                limits=self._limits(
+                    settings.BOT_HTTP_MAX_CONNECTIONS, settings.BOT_HTTP_MAX_KEEPALIVE
+                ),
+                timeout=self._timeout(settings.BOT_HTTP_TIMEOUT),
+                http2=self._http2(),
+            )
+
+        if name == GRAFANA:
+            headers = {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            }
+            if settings.GRAFANA_API_KEY:
+                headers["Authorization"] = f"Bearer {settings.GRAFANA_API_KEY}"
+            return httpx.AsyncClient(
+                base_url=settings.GRAFANA_BASE_URL or "",
+                headers=headers,
+                limits=self._limits(
+                    settings.GRAFANA_HTTP_MAX_CONNECTIONS,
+                    settings.GRAFANA_HTTP_MAX_KEEPALIVE,
+                ),
+                timeout=self._timeout(settings.GRAFANA_HTTP_TIMEOUT),
+                http2=self._http2(),
+            )
+
+        raise ValueError(f"Unknown HTTP client destination: {name}")
+
+    async def startup(self) -> None:
+        """모든 목적지의 클라이언트를 생성"""
+        for name in (PLATFORM, BOT, GRAFANA):
+            self.get(name)
+        logger.info(f"HTTP clients initialized: {', '.join(self._clients)}")
+
+    async def shutdown(self) -> None:
+        """보관 중인 클라이언트를 모두 닫음"""
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Failed to close HTTP client '{name}': {str(e)}")
+        logger.info("HTTP clients closed")
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """목적지 클라이언트 반환 (startup 이전이거나 닫힌 경우 새로 생성)"""
+        client: Optional[httpx.AsyncClient] = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._build(name)
+            self._clients[name] = client
+        return client
+
+
+# 글로벌 레지스트리 인스턴스
+http_clients = HttpClientRegistry()
@@ -1,16 +1,40 @@
+import atexit
+import copy
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import json
 
 from .settings import settings
 
+# orjson 이 설치되어 있으면 더 빠른 JSON 인코더 사용 (선택 의존성)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
 
 class JsonFormatter(logging.Formatter):
     """JSON 형태로 로그를 포맷하는 커스텀 포맷터"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 레코드마다 바뀌지 않는 필드는 한 번만 계산
+        self._static_fields = {
+            "app": settings.PROJECT_NAME,
+            "env": settings.NODE_ENV,
+        }
+
     def format(self, record):
         log_obj = {
             "timestamp": self.formatTime(record, self.datefmt),
@@ -20,13 +44,97 @@ class JsonFormatter(logging.Formatter):
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
+            **self._static_fields,
         }
 
-        # 예외 정보가 있다면 추가
-        if record.exc_info:
+        # 예외 정보가 있다면 추가 (큐 모드에서는 enqueue 시 exc_text 로 변환됨)
+        if record.exc_text:
+            log_obj["exception"] = record.exc_text
+        elif record.exc_info:
             log_obj["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_obj, ensure_ascii=False)
+        return _json_dumps(log_obj)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 레코드를 버리고 개수만 세는 QueueHandler
+
+    요청 처리 스레드(이벤트 루프)가 로깅 때문에 대기하지 않도록 put_nowait 만 사용합니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # 메시지 병합과 예외 문자열화만 수행하고 포맷은 리스너 스레드의 핸들러에 맡김
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_exception_formatter = logging.Formatter()
+
+# 큐 모드에서 사용 중인 (QueueHandler, QueueListener) 목록
+_queue_pipelines: List[
+    Tuple[DroppingQueueHandler, logging.handlers.QueueListener]
+] = []
+
+
+def _use_queue_logging() -> bool:
+    if settings.LOG_QUEUE_ENABLED is not None:
+        return settings.LOG_QUEUE_ENABLED
+    return settings.is_production
+
+
+def _install_queue_handlers(logger_names: List[str]) -> None:
+    """로거에 붙은 핸들러를 백그라운드 리스너 스레드로 옮기고 QueueHandler 로 교체
+
+    같은 핸들러 조합을 쓰는 로거끼리는 하나의 큐/리스너를 공유합니다.
+    """
+    pipelines: Dict[Tuple[int, ...], DroppingQueueHandler] = {}
+
+    for name in logger_names:
+        target = logging.getLogger(name)
+        handlers = list(target.handlers)
+        if not handlers:
+            continue
+
+        key = tuple(id(handler) for handler in handlers)
+        queue_handler = pipelines.get(key)
+        if queue_handler is None:
+            log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+            queue_handler = DroppingQueueHandler(log_queue)
+            listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            listener.start()
+            pipelines[key] = queue_handler
+            _queue_pipelines.append((queue_handler, listener))
+
+        target.handlers = [queue_handler]
+
+
+def get_dropped_log_count() -> int:
+    """큐가 가득 차 버려진 로그 레코드 수"""
+    return sum(queue_handler.dropped for queue_handler, _ in _queue_pipelines)
+
+
+def stop_logging() -> None:
+    """리스너 스레드를 중지하고 큐에 남은 레코드를 처리"""
+    while _queue_pipelines:
+        _, listener = _queue_pipelines.pop()
+        listener.stop()
 
 
 def setup_logging() -> logging.Logger:
@@ -104,11 +212,20 @@ def setup_logging() -> logging.Logger:
         logging_config["loggers"][""]["handlers"].append("file")
 
     # 로깅 설정 적용
+    stop_logging()
     logging.config.dictConfig(logging_config)
 
+    # 큐 모드: 핸들러(stdout, 파일 I/O, 로테이션)는 백그라운드 스레드에서 실행
+    queue_enabled = _use_queue_logging()
+    if queue_enabled:
+        _install_queue_handlers(list(logging_config["loggers"]))
+        atexit.register(stop_logging)
+
     logger = logging.getLogger(__name__)
     logger.info(f"Logging configured for {settings.NODE_ENV} environment")
     logger.info(f"Log level: {log_config['level']}")
+    if queue_enabled:
+        logger.info(f"Queue logging enabled (max size: {settings.LOG_QUEUE_SIZE})")
 
     return logger
 
@@ -0,0 +1,226 @@
+# /config/metrics.py
+# Prometheus 텍스트 포맷 메트릭 레지스트리
+
+import bisect
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 요청/외부 호출 지연 시간용 기본 버킷(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터
+
+    이벤트 루프 스레드에서만 갱신하므로 락 없이 dict 값을 증가시킵니다.
+    """
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for key, value in list(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+
+
+class Gauge(_Metric):
+    """현재 값 게이지, callback 을 주면 수집 시점에 값을 계산"""
+
+    type_name = "gauge"
+
+    def __init__(self, *args, callback: Optional[Callable[[], float]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def samples(self) -> Iterable[str]:
+        if self._callback is not None:
+            try:
+                value = self._callback()
+            except Exception:
+                return
+            yield f"{self.name} {value}"
+            return
+        for key, value in list(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (관측 시에는 해당 버킷 하나만 증가, 수집 시 누적 계산)"""
+
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # label 값 -> [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def samples(self) -> Iterable[str]:
+        bucket_labelnames = self.labelnames + ("le",)
+        for key, counts in list(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                yield (
+                    f"{self.name}_bucket"
+                    f"{_format_labels(bucket_labelnames, key + (le,))} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {self._sums[key]}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 Prometheus 텍스트 포맷(0.0.4) 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], float]] = None,
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, callback=callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets=buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# 글로벌 레지스트리
+registry = MetricsRegistry()
+
+# === 공용 메트릭 정의 ===
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+)
+SCHEDULER_TASK_DURATION = registry.histogram(
+    "scheduler_task_duration_seconds",
+    "Scheduled task duration by task type",
+    ["task_type"],
+)
+SCHEDULER_TASK_RUNS = registry.counter(
+    "scheduler_task_runs_total",
+    "Scheduled task runs by task type and outcome",
+    ["task_type", "outcome"],
+)
+SCHEDULER_TICKS_SKIPPED = registry.counter(
+    "scheduler_ticks_skipped_total",
+    "Scheduler ticks skipped by task type and reason",
+    ["task_type", "reason"],
+)
+SCHEDULER_INTERVAL_MULTIPLIER = registry.gauge(
+    "scheduler_interval_multiplier",
+    "Adaptive interval multiplier by task type",
+    ["task_type"],
+)
+PLATFORM_REQUEST_DURATION = registry.histogram(
+    "platform_request_duration_seconds",
+    "Node platform service call latency by operation",
+    ["operation"],
+)
+PLATFORM_REQUESTS = registry.counter(
+    "platform_requests_total",
+    "Node platform service calls by operation and status code",
+    ["operation", "status_code"],
+)
+OUTBOUND_REQUEST_DURATION = registry.histogram(
+    "outbound_request_duration_seconds",
+    "Outbound HTTP call latency by destination",
+    ["destination"],
+)
+OUTBOUND_REQUESTS = registry.counter(
+    "outbound_requests_total",
+    "Outbound HTTP calls by destination and status code",
+    ["destination", "status_code"],
+)
+ALERTS_FORWARDED = registry.counter(
+    "alerts_forwarded_total",
+    "Alerts forwarded after deduplication",
+)
+ALERTS_SUPPRESSED = registry.counter(
+    "alerts_suppressed_total",
+    "Alerts suppressed as duplicates",
+)
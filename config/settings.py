@@ -47,6 +47,16 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_URL: Optional[str] = None  # 동적으로 생성됨
 
+    # === 데이터베이스 엔진/커넥션 풀 설정 ===
+    DB_ECHO: Optional[bool] = None  # 미설정 시 개발 환경에서만 SQL 로깅
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션 대기 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재생성 주기(초)
+    DB_POOL_PRE_PING: bool = True
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statement 캐시
+    DB_STATEMENT_TIMEOUT_MS: int = 60000  # 0이면 제한 없음 (파티션 유지보수/export 는 제외)
+
     # === 애플리케이션 설정 ===
     PROJECT_NAME: str = "FastAPI PM Sync Control App"
     VERSION: str = "1.0.0"
@@ -57,12 +67,124 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_FILE: Optional[str] = None  # 파일 로깅 경로 (선택사항)
+    LOG_QUEUE_ENABLED: Optional[bool] = None  # 미설정 시 프로덕션에서만 큐 로깅 사용
+    LOG_QUEUE_SIZE: int = 10000  # 초과분은 버리고 개수만 기록
+
+    # === 접근 로그 설정 ===
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_BODY_SAMPLE_RATE: float = 0.0  # 본문/헤더까지 기록할 요청 비율 (0.0 ~ 1.0)
+    ACCESS_LOG_BODY_ON_ERROR: bool = False  # 5xx 응답은 본문/헤더 기록
+    ACCESS_LOG_MAX_BODY: int = 2048  # 기록할 본문 최대 바이트
+    ACCESS_LOG_REDACT_HEADERS: str = "authorization,cookie,set-cookie,x-api-key"
+    # 본문(JSON/form)과 쿼리 문자열에서 값을 가릴 필드
+    ACCESS_LOG_REDACT_FIELDS: str = "password,token,access_token,refresh_token,secret,authorization"
+    ACCESS_LOG_REDACT_PATHS: str = "/api/v1/users"  # 본문을 기록하지 않을 경로 prefix
 
     # === Node.js 프로젝트 설정 ===
     NODE_APP_NAME: str
     HOST_USER: str  # 호스트 머신의 사용자 이름
     HOST_WORKSPACE: str = "work"  # 작업 디렉토리 이름
     NODE_APP_PORT: int = 8090
+    NODE_PLATFORM_PARAM: str = "platform"  # 플랫폼별 실행 시 Node.js 로 전달할 쿼리 파라미터명
+    PLATFORM_RUN_CONCURRENCY: int = 4  # 플랫폼별 병렬 실행 상한
+    PLATFORM_CB_ENABLED: bool = True  # Node.js 호출 서킷 브레이커 사용 여부
+    PLATFORM_CB_WINDOW_SIZE: int = 20  # 실패율 계산에 사용할 최근 호출 수
+    PLATFORM_CB_MIN_CALLS: int = 10  # 실패율 판단 최소 호출 수
+    PLATFORM_CB_FAILURE_RATE: float = 0.5  # 이 실패율 이상이면 open
+    PLATFORM_CB_CONSECUTIVE_FAILURES: int = 5  # 연속 실패 시 open
+    PLATFORM_CB_OPEN_SECONDS: float = 30.0  # open 유지 시간(half-open probe 간격)
+
+    # === 비밀번호 해시 설정 ===
+    PASSWORD_HASH_WORKERS: int = 2  # bcrypt 전용 스레드 수
+    PASSWORD_HASH_MAX_PENDING: int = 32  # 초과 시 503 으로 즉시 거절
+
+    # === 스케줄러 설정 ===
+    SCHEDULER_RUN_MODE: str = "global"  # global: 전체 1회 호출, per_platform: 플랫폼별 병렬 호출
+    SCHEDULER_LEADER_ELECTION: bool = True  # advisory lock 으로 작업 실행 프로세스를 하나로 제한
+    SCHEDULER_LEADER_LOCK_KEY: int = 720431  # pg_advisory_lock 키
+    SCHEDULER_LEADER_CHECK_INTERVAL: float = 10.0  # 리더 확인/획득 시도 주기(초)
+    SCHEDULER_CONFIG_CACHE_TTL: int = 300  # 다른 프로세스의 설정 변경 반영 주기(초)
+    SCHEDULER_CONFIG_SYNC_INTERVAL: int = 30  # 리더가 scheduler_config 변경을 작업에 반영하는 주기(초)
+    SCHEDULER_JOBSTORE: str = "sqlalchemy"  # sqlalchemy: PostgreSQL 에 작업 저장, memory: 프로세스 메모리
+    SCHEDULER_JOBSTORE_DRIVER: str = "postgresql+psycopg2"  # job store 용 동기 드라이버
+    SCHEDULER_JOBSTORE_TABLE: str = "apscheduler_jobs"
+    SCHEDULER_MISFIRE_GRACE_TIME: int = 30  # 이 시간(초) 이상 늦은 실행은 건너뜀
+    SCHEDULER_COALESCE: bool = True  # 밀린 실행을 한 번으로 합침
+    SCHEDULER_MAX_INSTANCES: int = 1  # 작업별 동시 실행 상한
+    SCHEDULER_ADAPTIVE_ENABLED: bool = False  # 느리거나 실패가 잦으면 실행 주기를 늘림
+    SCHEDULER_ADAPTIVE_WINDOW: int = 5  # 판단에 사용할 최근 실행 수
+    SCHEDULER_ADAPTIVE_SLOW_SECONDS: float = 45.0  # 평균 실행 시간 임계값(초)
+    SCHEDULER_ADAPTIVE_FAILURE_RATE: float = 0.5  # 실패율 임계값
+    SCHEDULER_ADAPTIVE_MAX_MULTIPLIER: int = 8  # 주기 배수 상한
+
+    # === 헬스체크 설정 ===
+    HEALTH_CHECK_INTERVAL: float = 15.0  # 백그라운드 검사 주기(초)
+    HEALTH_CHECK_TIMEOUT: float = 3.0  # 검사별 제한 시간(초)
+    HEALTH_NODE_HTTP_PATH: Optional[str] = None  # 설정 시 TCP 대신 Node.js HTTP GET 으로 확인
+    HEALTH_READY_CHECKS: str = "database,node_app_dir,node_service"  # /ready 에 필요한 검사
+
+    # === 웹훅 저장소 설정 ===
+    WEBHOOK_RETENTION_MONTHS: int = 6  # 보관 기간(개월), 지난 월 파티션은 삭제 (0 이면 보관)
+    WEBHOOK_PARTITION_MONTHS_AHEAD: int = 2  # 미리 생성할 월 파티션 수
+    WEBHOOK_EXPORT_BATCH_SIZE: int = 500  # NDJSON 내보내기 시 커서에서 한 번에 가져올 행 수
+
+    # === 실행 기록 설정 ===
+    RUN_HISTORY_ENABLED: bool = True
+    RUN_HISTORY_RETENTION_DAYS: int = 30  # 보관 기간(일)
+    RUN_HISTORY_PRUNE_BATCH_SIZE: int = 5000  # 삭제 배치 크기
+    RUN_HISTORY_PRUNE_INTERVAL_MINUTES: int = 60  # 보관 기간 정리 주기(분)
+
+    # === 비동기 /run 작업 설정 ===
+    RUN_JOB_WORKERS: int = 2  # 동시에 실행할 작업 수
+    RUN_JOB_QUEUE_SIZE: int = 100  # 대기 가능한 최대 작업 수
+    RUN_JOB_HEARTBEAT_INTERVAL: int = 15  # 소유한 작업의 heartbeat 갱신 주기(초)
+    RUN_JOB_STALE_SECONDS: int = 60  # heartbeat 가 이 시간 이상 끊긴 작업은 다른 프로세스가 복구
+
+    # === 알림 Bot 설정 ===
+    BOT_TARGET_URL: Optional[str] = None
+    BOT_AUTH_TOKEN: Optional[str] = None
+    BOT_ENV: Optional[str] = None
+    BOT_ID: Optional[str] = None
+    BOT_CONTENTS_TYPE: Optional[str] = None
+    BOT_CONTENTS_ID: Optional[str] = None
+    BOT_TARGET_USER_ID: Optional[str] = None
+    BOT_DELIVERY_CONCURRENCY: int = 10  # outbox 배치 내 동시 전송 상한
+
+    # === 알림 outbox 전송 워커 설정 ===
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_POLL_INTERVAL: float = 2.0  # 대기 행이 없을 때 조회 주기(초)
+    OUTBOX_MAX_ATTEMPTS: int = 8  # 초과 시 failed 처리
+    OUTBOX_BACKOFF_BASE: float = 2.0  # 재시도 지연 = base * 2^(attempts-1) (+jitter)
+    OUTBOX_BACKOFF_MAX: float = 600.0
+    OUTBOX_LEASE_SECONDS: float = 300.0  # 꺼낸 행을 다른 워커가 다시 가져가지 않도록 미루는 시간(초)
+
+    # === 알림 중복 억제 설정 ===
+    ALERT_DEDUP_WINDOW: int = 3600  # 같은 fingerprint+status 억제 구간(초), 0이면 비활성
+    ALERT_DEDUP_CACHE_SIZE: int = 10000  # 프로세스 내 LRU 캐시 최대 키 수
+    ALERT_DEDUP_PRUNE_BATCH_SIZE: int = 5000  # 만료된 키 삭제 배치 크기
+    ALERT_DEDUP_PRUNE_INTERVAL_MINUTES: int = 60  # 만료된 키 정리 주기(분)
+
+    # === Grafana 설정 ===
+    GRAFANA_BASE_URL: Optional[str] = None
+    GRAFANA_API_KEY: Optional[str] = None
+    GRAFANA_CONTACT_POINTS_TTL: int = 300  # 캐시 유효 시간(초)
+    GRAFANA_CONTACT_POINTS_STALE_TTL: int = 3600  # 이 시간까지는 캐시 반환 후 백그라운드 재검증(초)
+    GRAFANA_CONTACT_POINTS_RETRY_BASE: float = 5.0  # 갱신 실패 후 재시도 대기 = base * 2^(연속 실패-1)
+    GRAFANA_CONTACT_POINTS_RETRY_MAX: float = 300.0  # 갱신 실패 후 재시도 대기 상한(초)
+
+    # === 외부 HTTP 클라이언트 설정 (애플리케이션 수명 동안 재사용) ===
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0  # 유휴 keep-alive 연결 유지 시간(초)
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP2_ENABLED: bool = False  # h2 패키지가 설치된 경우에만 적용
+    NODE_HTTP_MAX_CONNECTIONS: int = 10
+    NODE_HTTP_MAX_KEEPALIVE: int = 5
+    NODE_HTTP_TIMEOUT: float = 60.0
+    BOT_HTTP_MAX_CONNECTIONS: int = 20
+    BOT_HTTP_MAX_KEEPALIVE: int = 10
+    BOT_HTTP_TIMEOUT: float = 10.0
+    GRAFANA_HTTP_MAX_CONNECTIONS: int = 5
+    GRAFANA_HTTP_MAX_KEEPALIVE: int = 2
+    GRAFANA_HTTP_TIMEOUT: float = 10.0
 
     # === 환경별 편의 프로퍼티 ===
     @property
@@ -80,6 +202,13 @@ class Settings(BaseSettings):
         """테스트 환경인지 확인"""
         return self.NODE_ENV == "test"
 
+    @property
+    def db_echo(self) -> bool:
+        """SQL echo 여부 (DB_ECHO 미설정 시 개발 환경에서만 활성화)"""
+        if self.DB_ECHO is not None:
+            return self.DB_ECHO
+        return self.is_development
+
     @property
     def NODE_APP_DIR(self) -> str:
         """환경에 따라 다른 경로 반환"""
@@ -18,13 +18,21 @@ if config.config_file_name is not None:
 from config.settings import settings
 from config.db import Base
 from api.users.models import User
-from api.webhooks.models import Webhooks
-from api.platform.models import Platform
+from api.webhooks.models import Webhooks, AlertDedup
+from api.platform.models import Platform, RunJob
 from api.scheduler_config.models import SchedulerConfig
+from api.run_history.models import RunHistory
 
 target_metadata = Base.metadata
 
 
+def include_name(name, type_, parent_names) -> bool:
+    """APScheduler job store 테이블은 스케줄러가 직접 관리하므로 비교 대상에서 제외"""
+    if type_ == "table":
+        return name != settings.SCHEDULER_JOBSTORE_TABLE
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -41,6 +49,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -50,7 +59,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
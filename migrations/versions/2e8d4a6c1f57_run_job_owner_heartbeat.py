@@ -0,0 +1,50 @@
+"""run_job owner and heartbeat
+
+Revision ID: 2e8d4a6c1f57
+Revises: 7b3e5d91c2af
+Create Date: 2026-10-18 19:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2e8d4a6c1f57"
+down_revision: Union[str, None] = "7b3e5d91c2af"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return column in {c["name"] for c in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    # 신규 DB는 애플리케이션 시작 시 create_all 로 최신 스키마가 생성되고,
+    # 이미 컬럼이 있으면 적용된 것이므로 건너뜀
+    if not _has_table("run_job") or _has_column("run_job", "owner"):
+        return
+
+    # 기존 행은 heartbeat 가 없으므로 다음 복구 주기에 종료된 작업으로 처리됨
+    op.add_column("run_job", sa.Column("owner", sa.String(length=100), nullable=True))
+    op.add_column("run_job", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "run_job_status_heartbeat_idx", "run_job", ["status", "heartbeat_at"]
+    )
+
+
+def downgrade() -> None:
+    if not _has_table("run_job"):
+        return
+
+    op.drop_index("run_job_status_heartbeat_idx", table_name="run_job")
+    op.drop_column("run_job", "heartbeat_at")
+    op.drop_column("run_job", "owner")
@@ -0,0 +1,55 @@
+"""scheduler_config schedule columns
+
+Revision ID: 4c1f7b2e9a63
+Revises: 9eaefcdce02a
+Create Date: 2026-10-18 16:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1f7b2e9a63"
+down_revision: Union[str, None] = "9eaefcdce02a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return column in {c["name"] for c in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    # 신규 DB는 애플리케이션 시작 시 create_all 로 최신 스키마가 생성되고,
+    # 이미 컬럼이 있으면 적용된 것이므로 건너뜀
+    if not _has_table("scheduler_config") or _has_column("scheduler_config", "interval_seconds"):
+        return
+
+    # 기존 행은 이전의 고정 주기(1분)로 채움
+    op.add_column(
+        "scheduler_config",
+        sa.Column("interval_seconds", sa.Integer(), nullable=False, server_default="60"),
+    )
+    op.add_column(
+        "scheduler_config", sa.Column("cron_expression", sa.String(length=100), nullable=True)
+    )
+    op.add_column(
+        "scheduler_config", sa.Column("timeout_seconds", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    if not _has_table("scheduler_config"):
+        return
+
+    op.drop_column("scheduler_config", "timeout_seconds")
+    op.drop_column("scheduler_config", "cron_expression")
+    op.drop_column("scheduler_config", "interval_seconds")
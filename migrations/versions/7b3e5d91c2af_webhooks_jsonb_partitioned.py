@@ -0,0 +1,185 @@
+"""webhooks jsonb, extracted columns, monthly partitions
+
+Revision ID: 7b3e5d91c2af
+Revises: 4c1f7b2e9a63
+Create Date: 2026-10-18 17:30:00.000000
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b3e5d91c2af"
+down_revision: Union[str, None] = "4c1f7b2e9a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 미리 생성할 월 파티션 수 (이후에는 애플리케이션 유지보수 작업이 생성)
+MONTHS_AHEAD = 2
+
+OUTBOX_COLUMNS = "delivery_status, attempts, next_attempt_at, last_error, delivered_at"
+
+
+def _month_start(value: date, offset: int = 0) -> date:
+    index = value.year * 12 + value.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _is_partitioned(bind) -> bool:
+    return (
+        bind.execute(
+            sa.text(
+                "SELECT 1 FROM pg_partitioned_table p "
+                "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = 'webhooks'"
+            )
+        ).scalar()
+        is not None
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # 신규 DB는 애플리케이션 시작 시 create_all 로 파티션 테이블이 생성되므로 건너뜀
+    if not sa.inspect(bind).has_table("webhooks") or _is_partitioned(bind):
+        return
+
+    # 1. 기존 테이블과 이름이 겹치는 객체를 비켜 둠
+    op.rename_table("webhooks", "webhooks_legacy")
+    op.execute(
+        "ALTER TABLE webhooks_legacy RENAME CONSTRAINT webhooks_pkey TO webhooks_legacy_pkey"
+    )
+    op.execute("ALTER SEQUENCE webhooks_id_seq RENAME TO webhooks_legacy_id_seq")
+    op.execute("DROP INDEX IF EXISTS webhooks_outbox_pending_idx")
+    op.execute("DROP INDEX IF EXISTS ix_webhooks_id")
+
+    # 2. created_at 기준 월별 RANGE 파티션 테이블 생성
+    op.create_table(
+        "webhooks",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("alertname", sa.String(length=200), nullable=True),
+        sa.Column("severity", sa.String(length=50), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=True),
+        sa.Column("fingerprint", sa.String(length=64), nullable=True),
+        sa.Column(
+            "delivery_status", sa.String(length=20), nullable=False, server_default="pending"
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id", "created_at", name="webhooks_pkey"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("CREATE TABLE webhooks_default PARTITION OF webhooks DEFAULT")
+
+    # 기존 데이터 기간부터 MONTHS_AHEAD 개월 뒤까지 월 파티션 생성
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM webhooks_legacy")).scalar()
+    this_month = _month_start(datetime.utcnow().date())
+    month = _month_start(oldest.date()) if oldest else this_month
+    while month <= _month_start(this_month, MONTHS_AHEAD):
+        next_month = _month_start(month, 1)
+        op.execute(
+            f"CREATE TABLE webhooks_{month.year:04d}_{month.month:02d} "
+            f"PARTITION OF webhooks FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+
+    # 3. 기존 행 복사 (payload 에서 조회용 컬럼 추출, 이전 형식 payload 는 NULL)
+    #    build_bot_payload 는 label 이 없으면 "" 를 저장하므로 신규 행과 같도록 NULL 로 변환
+    op.execute(
+        f"""
+        INSERT INTO webhooks (
+            id, created_at, payload, alertname, severity, status, {OUTBOX_COLUMNS}
+        )
+        SELECT
+            id,
+            COALESCE(created_at, now() AT TIME ZONE 'utc'),
+            payload::jsonb,
+            NULLIF(payload::jsonb #>> '{{contentsParams,subject}}', ''),
+            NULLIF(payload::jsonb #>> '{{contentsParams,severity}}', ''),
+            NULLIF(payload::jsonb #>> '{{contentsParams,status}}', ''),
+            {OUTBOX_COLUMNS}
+        FROM webhooks_legacy
+        """
+    )
+    op.execute(
+        "SELECT setval('webhooks_id_seq', COALESCE((SELECT max(id) FROM webhooks), 0) + 1, false)"
+    )
+    op.drop_table("webhooks_legacy")
+
+    # 4. 인덱스 (파티션 테이블에 생성하면 모든 파티션에 적용됨)
+    op.create_index(
+        "webhooks_outbox_pending_idx",
+        "webhooks",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("delivery_status = 'pending'"),
+    )
+    op.create_index(
+        "webhooks_alertname_created_at_idx", "webhooks", ["alertname", "created_at"]
+    )
+    op.create_index(
+        "webhooks_severity_created_at_idx", "webhooks", ["severity", "created_at"]
+    )
+    op.create_index("webhooks_fingerprint_idx", "webhooks", ["fingerprint"])
+    op.create_index(
+        "webhooks_created_at_brin_idx",
+        "webhooks",
+        ["created_at"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if not _is_partitioned(bind):
+        return
+
+    # 파티션 테이블을 비켜 두고 이전 형식(JSON, 단일 테이블)으로 복사
+    op.rename_table("webhooks", "webhooks_partitioned")
+    op.execute(
+        "ALTER TABLE webhooks_partitioned RENAME CONSTRAINT webhooks_pkey "
+        "TO webhooks_partitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE webhooks_id_seq RENAME TO webhooks_partitioned_id_seq")
+    op.execute("DROP INDEX IF EXISTS webhooks_outbox_pending_idx")
+
+    op.create_table(
+        "webhooks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "delivery_status", sa.String(length=20), nullable=False, server_default="pending"
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name="webhooks_pkey"),
+    )
+    op.create_index("ix_webhooks_id", "webhooks", ["id"])
+    op.execute(
+        f"""
+        INSERT INTO webhooks (id, payload, created_at, {OUTBOX_COLUMNS})
+        SELECT id, payload::json, created_at, {OUTBOX_COLUMNS}
+        FROM webhooks_partitioned
+        """
+    )
+    op.execute(
+        "SELECT setval('webhooks_id_seq', COALESCE((SELECT max(id) FROM webhooks), 0) + 1, false)"
+    )
+    op.execute("DROP TABLE webhooks_partitioned CASCADE")
+    op.create_index(
+        "webhooks_outbox_pending_idx",
+        "webhooks",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("delivery_status = 'pending'"),
+    )
@@ -0,0 +1,44 @@
+"""platform (active, id) index
+
+Revision ID: 9eaefcdce02a
+Revises: d27ae592370b
+Create Date: 2026-10-18 15:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9eaefcdce02a"
+down_revision: Union[str, None] = "d27ae592370b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 신규 DB는 애플리케이션 시작 시 create_all 로 인덱스까지 생성되므로 건너뜀
+    if not sa.inspect(op.get_bind()).has_table("platform"):
+        return
+
+    # 운영 중 테이블 잠금을 피하기 위해 트랜잭션 밖에서 CONCURRENTLY 로 생성
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "platform_active_id_idx",
+            "platform",
+            ["active", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "platform_active_id_idx",
+            table_name="platform",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
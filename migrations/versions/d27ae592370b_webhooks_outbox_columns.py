@@ -0,0 +1,71 @@
+"""webhooks outbox columns
+
+Revision ID: d27ae592370b
+Revises: 
+Create Date: 2026-10-18 15:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d27ae592370b"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return column in {c["name"] for c in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    # 신규 DB는 애플리케이션 시작 시 create_all 로 최신 스키마가 생성되고,
+    # 이미 컬럼이 있으면 적용된 것이므로 건너뜀
+    if not _has_table("webhooks") or _has_column("webhooks", "delivery_status"):
+        return
+
+    # 기존 행은 이미 동기 방식으로 전송되었으므로 delivered 로 채운 뒤 기본값을 pending 으로 변경
+    op.add_column(
+        "webhooks",
+        sa.Column(
+            "delivery_status",
+            sa.String(length=20),
+            nullable=False,
+            server_default="delivered",
+        ),
+    )
+    op.alter_column("webhooks", "delivery_status", server_default="pending")
+    op.add_column(
+        "webhooks",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("webhooks", sa.Column("next_attempt_at", sa.DateTime(), nullable=True))
+    op.add_column("webhooks", sa.Column("last_error", sa.Text(), nullable=True))
+    op.add_column("webhooks", sa.Column("delivered_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "webhooks_outbox_pending_idx",
+        "webhooks",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("delivery_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    if not _has_table("webhooks"):
+        return
+
+    op.drop_index("webhooks_outbox_pending_idx", table_name="webhooks")
+    op.drop_column("webhooks", "delivered_at")
+    op.drop_column("webhooks", "last_error")
+    op.drop_column("webhooks", "next_attempt_at")
+    op.drop_column("webhooks", "attempts")
+    op.drop_column("webhooks", "delivery_status")
@@ -0,0 +1,61 @@
+# scheduler/jobstore.py
+# APScheduler job store 및 작업 기본 정책 구성
+
+from typing import Any, Dict
+from apscheduler.jobstores.memory import MemoryJobStore
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from config.logging_config import logger
+from config.settings import settings
+
+
+def _build_sync_url():
+    """APScheduler(3.x) job store 는 동기 엔진만 지원하므로 DB_URL 의 드라이버만 교체"""
+    return make_url(settings.DB_URL).set(drivername=settings.SCHEDULER_JOBSTORE_DRIVER)
+
+
+def build_jobstores() -> Dict[str, Any]:
+    """설정에 따라 PostgreSQL 또는 메모리 job store 를 구성
+
+    sqlalchemy 로 설정했는데 동기 드라이버를 불러올 수 없으면 메모리로 조용히 대체하지 않고
+    시작 단계에서 실패시킵니다.
+    """
+    if settings.SCHEDULER_JOBSTORE == "memory":
+        return {"default": MemoryJobStore()}
+    if settings.SCHEDULER_JOBSTORE != "sqlalchemy":
+        raise RuntimeError(
+            f"Unsupported SCHEDULER_JOBSTORE: {settings.SCHEDULER_JOBSTORE} "
+            "(expected 'sqlalchemy' or 'memory')"
+        )
+
+    try:
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+
+        jobstore_engine = create_engine(
+            _build_sync_url(),
+            pool_size=1,
+            max_overflow=1,
+            pool_pre_ping=True,
+            connect_args={"application_name": f"{settings.PROJECT_NAME} scheduler"},
+        )
+    except ImportError as e:
+        logger.error(f"Persistent scheduler job store unavailable: {str(e)}")
+        raise RuntimeError(
+            f"SCHEDULER_JOBSTORE=sqlalchemy requires the "
+            f"'{settings.SCHEDULER_JOBSTORE_DRIVER}' driver to be installed"
+        ) from e
+
+    return {
+        "default": SQLAlchemyJobStore(
+            engine=jobstore_engine, tablename=settings.SCHEDULER_JOBSTORE_TABLE
+        )
+    }
+
+
+def job_defaults() -> Dict[str, Any]:
+    """누락 실행 처리 정책: 지연된 실행은 한 번으로 합치고 동시 실행은 제한"""
+    return {
+        "misfire_grace_time": settings.SCHEDULER_MISFIRE_GRACE_TIME,
+        "coalesce": settings.SCHEDULER_COALESCE,
+        "max_instances": settings.SCHEDULER_MAX_INSTANCES,
+    }
@@ -0,0 +1,160 @@
+# scheduler/leader.py
+# PostgreSQL advisory lock 기반 스케줄러 리더 선출
+
+import asyncio
+import os
+import socket
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from config.db import AsyncSessionLocal, engine
+from config.logging_config import logger
+from config.settings import settings
+
+
+class LeaderElector:
+    """세션 수준 advisory lock 을 잡은 프로세스 하나만 리더가 되도록 관리
+
+    lock 은 전용 커넥션(풀 밖)에 묶여 있으므로 리더 프로세스가 죽거나 커넥션이 끊기면
+    PostgreSQL 이 lock 을 해제하고, 다른 프로세스가 다음 확인 주기에 리더가 됩니다.
+    """
+
+    def __init__(self):
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+        self.is_leader = False
+        self._engine: Optional[AsyncEngine] = None
+        self._conn: Optional[AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[bool], None]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SCHEDULER_LEADER_ELECTION
+
+    @property
+    def lock_key(self) -> int:
+        return settings.SCHEDULER_LEADER_LOCK_KEY
+
+    def add_listener(self, callback: Callable[[bool], None]) -> None:
+        """확인 주기마다 현재 리더 여부로 호출할 콜백 등록"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    async def start(self) -> None:
+        if not self.enabled:
+            # 리더 선출을 사용하지 않으면 모든 프로세스가 작업을 실행 (단일 프로세스 배포용)
+            self._set_leader(True)
+            return
+        if self._task is not None:
+            return
+
+        self._engine = create_async_engine(
+            engine.url,
+            poolclass=NullPool,
+            isolation_level="AUTOCOMMIT",
+            connect_args={
+                "server_settings": {
+                    "application_name": f"{settings.PROJECT_NAME} leader {self.identity}"[:63]
+                }
+            },
+        )
+        await self._check()
+        self._task = asyncio.create_task(self._run(), name="scheduler-leader-elector")
+
+    async def stop(self) -> None:
+        """확인 루프 중지 및 lock 해제 (다른 프로세스가 즉시 리더를 이어받을 수 있도록)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        if self._conn is not None and self.is_leader:
+            try:
+                await self._conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key}
+                )
+            except Exception as e:
+                logger.error(f"Failed to release scheduler leader lock: {str(e)}")
+        await self._reset_connection()
+        self._set_leader(False)
+
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.SCHEDULER_LEADER_CHECK_INTERVAL)
+            await self._check()
+
+    async def _check(self) -> None:
+        try:
+            if self._conn is None:
+                self._conn = await self._engine.connect()
+
+            if self.is_leader:
+                # lock 은 이 커넥션에 묶여 있으므로 커넥션이 살아 있는지만 확인
+                await self._conn.execute(text("SELECT 1"))
+                self._set_leader(True)
+            else:
+                result = await self._conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key}
+                )
+                self._set_leader(bool(result.scalar()))
+
+        except Exception as e:
+            logger.error(f"Scheduler leader check failed: {str(e)}")
+            await self._reset_connection()
+            self._set_leader(False)
+
+    async def _reset_connection(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+    def _set_leader(self, is_leader: bool) -> None:
+        if is_leader != self.is_leader:
+            logger.info(
+                f"Scheduler leadership {'acquired' if is_leader else 'lost'}: {self.identity}"
+            )
+        self.is_leader = is_leader
+        for callback in self._listeners:
+            try:
+                callback(is_leader)
+            except Exception as e:
+                logger.error(f"Scheduler leader listener failed: {str(e)}")
+
+    async def current_leader(self) -> Optional[Dict[str, Any]]:
+        """lock 을 보유한 백엔드 세션 정보 (application_name 에 리더 식별자 포함)"""
+        if not self.enabled:
+            return {"application_name": self.identity, "client_addr": None, "since": None}
+
+        query = text(
+            """
+            SELECT a.application_name, host(a.client_addr) AS client_addr,
+                   a.backend_start AS since
+            FROM pg_locks l
+            JOIN pg_stat_activity a ON a.pid = l.pid
+            WHERE l.locktype = 'advisory'
+              AND l.granted
+              AND l.classid::bigint = :classid
+              AND l.objid::bigint = :objid
+              AND l.objsubid = 1
+            """
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                query,
+                {"classid": self.lock_key >> 32, "objid": self.lock_key & 0xFFFFFFFF},
+            )
+            row = result.mappings().first()
+        return dict(row) if row else None
+
+
+# 글로벌 리더 선출 인스턴스
+leader_elector = LeaderElector()
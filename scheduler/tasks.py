@@ -1,15 +1,196 @@
 from fastapi import HTTPException
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-import httpx
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, JobSubmissionEvent
+from apscheduler.job import Job
+from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 import asyncio
-from typing import Dict, List, Any
+import time
+from typing import Any, Dict, List, Optional
 from config.logging_config import logger
 from config.settings import settings
+from config.metrics import (
+    SCHEDULER_INTERVAL_MULTIPLIER,
+    SCHEDULER_TASK_DURATION,
+    SCHEDULER_TASK_RUNS,
+    SCHEDULER_TICKS_SKIPPED,
+)
 from config.db import AsyncSessionLocal  # AsyncSessionLocal import 추가
 from api.scheduler_config import services, repositories  # repositories import 추가
+from api.scheduler_config.cache import scheduler_config_cache
+from api.platform import services as platform_services
+from api.platform.schemas import RunRequest
+from api.run_history.services import prune_run_history
+from api.webhooks.dedup import prune_alert_dedup
+from api.webhooks.partitions import maintain_webhook_partitions
+from .jobstore import build_jobstores, job_defaults
+from .leader import leader_elector
+from .throttle import task_throttle
+from .triggers import build_trigger
+
+# 작업 id 접두사 (task_type 별 작업 1개), 이전 버전의 단일 작업 id
+JOB_ID_PREFIX = "task:"
+LEGACY_JOB_ID = "platform_sync"
+RUN_HISTORY_PRUNE_JOB_ID = "maintenance:run_history_prune"
+WEBHOOK_PARTITIONS_JOB_ID = "maintenance:webhook_partitions"
+CONFIG_SYNC_JOB_ID = "maintenance:scheduler_config_sync"
+ALERT_DEDUP_PRUNE_JOB_ID = "maintenance:alert_dedup_prune"
 
 # 전역 변수로 스케줄러 객체 선언
 scheduler = AsyncIOScheduler()
+_sync_task: Optional[asyncio.Task] = None
+
+
+def _job_id(task_type: str) -> str:
+    return f"{JOB_ID_PREFIX}{task_type}"
+
+
+def _on_leadership_change(is_leader: bool) -> None:
+    """리더만 job store 의 작업을 처리하고, 나머지 프로세스는 스케줄러를 일시 중지 상태로 유지"""
+    global _sync_task
+    if is_leader:
+        if scheduler.state == STATE_PAUSED:
+            scheduler.resume()
+            # 비리더였던 동안의 설정 변경을 작업에 반영
+            _sync_task = asyncio.get_running_loop().create_task(sync_jobs())
+        elif scheduler.state == STATE_RUNNING:
+            # 다른 프로세스가 공유 job store 에서 변경한 작업(일시 중지/재개)을 반영
+            scheduler.wakeup()
+    elif scheduler.state == STATE_RUNNING:
+        scheduler.pause()
+
+
+def _on_max_instances(event: JobSubmissionEvent) -> None:
+    """APScheduler 가 max_instances 로 실행을 건너뛴 경우도 overlap 으로 집계"""
+    if event.job_id.startswith(JOB_ID_PREFIX):
+        task_type = event.job_id[len(JOB_ID_PREFIX):]
+        SCHEDULER_TICKS_SKIPPED.inc(task_type=task_type, reason="overlap")
+        logger.warning(f"Skipping {task_type} task - previous run is still in progress")
+
+
+def _schedule_job(config) -> None:
+    """task_type 작업을 등록하거나, 저장된 작업의 trigger 가 설정과 다를 때만 재등록
+
+    trigger 가 같으면 다음 실행 시각과 일시 중지 상태를 그대로 유지합니다.
+    """
+    job_id = _job_id(config.task_type)
+    trigger = build_trigger(config.cron_expression, config.interval_seconds)
+    job = scheduler.get_job(job_id)
+
+    if job is None:
+        scheduler.add_job(
+            execute_scheduled_task,
+            trigger,
+            args=[config.task_type],
+            id=job_id,
+            name=f"platform {config.task_type}",
+            replace_existing=True,
+            **job_defaults(),
+        )
+        logger.info(f"Scheduled {config.task_type} task: {trigger}")
+        return
+
+    job.modify(**job_defaults())
+    if str(job.trigger) == str(trigger):
+        return
+    if job.next_run_time is None:
+        # 일시 중지된 작업은 trigger 만 교체 (재개 시 새 주기로 계산)
+        job.modify(trigger=trigger)
+    else:
+        scheduler.reschedule_job(job_id, trigger=trigger)
+    logger.info(f"Rescheduled {config.task_type} task: {trigger}")
+
+
+async def sync_jobs() -> None:
+    """scheduler_config 전체를 읽어 task_type 별 작업을 생성/갱신/삭제"""
+    if not scheduler.running:
+        return
+
+    try:
+        async with AsyncSessionLocal() as db:
+            configs = await repositories.get_scheduler_configs(db)
+    except Exception as e:
+        logger.error(f"Failed to load scheduler configs: {str(e)}")
+        return
+
+    # 읽은 설정으로 캐시도 갱신 (execute_scheduled_task 가 다시 조회하지 않도록)
+    scheduler_config_cache.replace(configs)
+
+    task_types = set()
+    for config in configs:
+        try:
+            _schedule_job(config)
+            task_types.add(config.task_type)
+        except ValueError as e:
+            logger.error(f"Invalid schedule for {config.task_type} task: {str(e)}")
+
+    for job in scheduler.get_jobs():
+        if job.id == LEGACY_JOB_ID or (
+            job.id.startswith(JOB_ID_PREFIX) and job.args[0] not in task_types
+        ):
+            scheduler.remove_job(job.id)
+            logger.info(f"Removed scheduler job {job.id}")
+
+
+async def sync_jobs_from_config() -> None:
+    """리더에서 주기적으로 실행: 다른 프로세스가 변경한 설정을 캐시와 작업에 반영"""
+    await sync_jobs()
+
+
+def _ensure_maintenance_job(func, trigger, job_id: str, name: str) -> None:
+    """공유 job store 에 없을 때만 등록하고, 주기 설정이 바뀐 경우에만 재등록
+
+    프로세스 시작(--reload 포함)마다 다음 실행 시각이 뒤로 밀리지 않도록
+    기존 작업은 그대로 둡니다.
+    """
+    job = scheduler.get_job(job_id)
+    if job is None:
+        scheduler.add_job(
+            func, trigger, id=job_id, name=name, replace_existing=True, **job_defaults()
+        )
+        return
+    if str(job.trigger) != str(trigger):
+        scheduler.reschedule_job(job_id, trigger=trigger)
+        logger.info(f"Rescheduled {name} job: {trigger}")
+
+
+def _schedule_maintenance_jobs() -> None:
+    """설정 동기화/실행 기록/웹훅 파티션/알림 중복 키 정리 작업 등록 (실행은 리더에서만)"""
+    _ensure_maintenance_job(
+        sync_jobs_from_config,
+        IntervalTrigger(seconds=settings.SCHEDULER_CONFIG_SYNC_INTERVAL),
+        CONFIG_SYNC_JOB_ID,
+        "scheduler config sync",
+    )
+    _ensure_maintenance_job(
+        maintain_webhook_partitions,
+        CronTrigger(hour=3),
+        WEBHOOK_PARTITIONS_JOB_ID,
+        "webhooks partition maintenance",
+    )
+    _ensure_maintenance_job(
+        prune_run_history,
+        IntervalTrigger(minutes=settings.RUN_HISTORY_PRUNE_INTERVAL_MINUTES),
+        RUN_HISTORY_PRUNE_JOB_ID,
+        "run history retention",
+    )
+    _ensure_maintenance_job(
+        prune_alert_dedup,
+        IntervalTrigger(minutes=settings.ALERT_DEDUP_PRUNE_INTERVAL_MINUTES),
+        ALERT_DEDUP_PRUNE_JOB_ID,
+        "alert dedup retention",
+    )
+
+
+async def sync_task_job(config) -> None:
+    """설정 생성/변경 직후 해당 task 작업에 반영
+
+    리더 프로세스에서는 즉시 반영하고, 다른 프로세스의 변경은 리더의 설정 동기화 작업
+    (SCHEDULER_CONFIG_SYNC_INTERVAL 주기)이 반영합니다.
+    """
+    if scheduler.running and leader_elector.is_leader:
+        _schedule_job(config)
 
 
 async def start_scheduler():
@@ -19,11 +200,17 @@ async def start_scheduler():
     # 기존 스케줄러가 실행 중이면 중지
     if scheduler.running:
         scheduler.shutdown()
-        scheduler = AsyncIOScheduler()
+    scheduler = AsyncIOScheduler(jobstores=build_jobstores(), job_defaults=job_defaults())
+
+    # 일시 중지 상태로 시작하고 리더가 되었을 때만 작업을 처리
+    scheduler.add_listener(_on_max_instances, EVENT_JOB_MAX_INSTANCES)
+    scheduler.start(paused=True)
+    await sync_jobs()
+    _schedule_maintenance_jobs()
 
-    scheduler.add_job(execute_scheduled_task, "interval", minutes=1, id="platform_sync")
-    scheduler.start()
-    logger.info("Scheduler started - Platform sync task scheduled for every minute")
+    leader_elector.add_listener(_on_leadership_change)
+    await leader_elector.start()
+    logger.info(f"Scheduler started - {len(_get_task_jobs(None))} task jobs scheduled")
 
 
 async def stop_scheduler():
@@ -37,90 +224,196 @@ async def stop_scheduler():
         logger.info("Scheduler is not running")
 
 
-async def pause_scheduler():
-    """스케줄러 일시 중지 (기존 작업은 유지)"""
+async def shutdown_scheduler():
+    """애플리케이션 종료 시 스케줄러 중지 및 리더 lock 반납"""
+    await stop_scheduler()
+    await leader_elector.stop()
+
+
+async def get_leader_status() -> Dict[str, Any]:
+    """이 프로세스의 리더 여부와 현재 리더 정보"""
+    return {
+        "identity": leader_elector.identity,
+        "is_leader": leader_elector.is_leader,
+        "election_enabled": leader_elector.enabled,
+        "leader": await leader_elector.current_leader(),
+    }
+
+
+def _get_task_jobs(task_type: Optional[str]) -> List[Job]:
+    """task_type 이 없으면 모든 task 작업, 있으면 해당 작업 (없으면 404)"""
+    if task_type is None:
+        return [job for job in scheduler.get_jobs() if job.id.startswith(JOB_ID_PREFIX)]
+    job = scheduler.get_job(_job_id(task_type))
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job for {task_type} not found")
+    return [job]
+
+
+async def get_jobs() -> List[Dict[str, Any]]:
+    """등록된 task 작업 목록과 다음 실행 시각"""
+    if not scheduler.running:
+        return []
+    return [
+        {
+            "id": job.id,
+            "task_type": job.args[0],
+            "trigger": str(job.trigger),
+            "next_run_time": job.next_run_time,
+            "paused": job.next_run_time is None,
+            **task_throttle.stats(job.args[0]),
+        }
+        for job in _get_task_jobs(None)
+    ]
+
+
+async def pause_scheduler(task_type: Optional[str] = None):
+    """스케줄러 작업 일시 중지 (task_type 을 주면 해당 작업만, 작업 설정은 유지)"""
     global scheduler
     if scheduler.running:
-        scheduler.pause_job("platform_sync")
-        logger.info("Scheduler paused - Task will resume when unpaused")
+        for job in _get_task_jobs(task_type):
+            job.pause()
+        logger.info(
+            f"Scheduler paused ({task_type or 'all tasks'}) - Task will resume when unpaused"
+        )
     else:
         logger.info("Scheduler is not running")
 
 
-async def resume_scheduler():
-    """스케줄러 재개"""
+async def resume_scheduler(task_type: Optional[str] = None):
+    """스케줄러 작업 재개 (task_type 을 주면 해당 작업만)"""
     global scheduler
     if scheduler.running:
-        scheduler.resume_job("platform_sync")
-        logger.info("Scheduler resumed - Task will continue as scheduled")
+        for job in _get_task_jobs(task_type):
+            job.resume()
+        logger.info(
+            f"Scheduler resumed ({task_type or 'all tasks'}) - Task will continue as scheduled"
+        )
     else:
         logger.info("Scheduler is not running")
 
 
 async def call_platform_api(
-    client: httpx.AsyncClient, operation: str
+    operation: str, timeout: Optional[float] = None
 ) -> Dict[str, Any]:
-    """플랫폼 API를 호출하는 재사용 가능한 함수"""
-    base_url = f"http://localhost:{settings.PORT}/api/v1"
+    """플랫폼 작업을 in-process 디스패처로 실행하는 재사용 가능한 함수
+
+    /api/v1/run 으로의 HTTP loopback 없이 라우터와 같은 디스패처를 직접 호출합니다.
+    timeout(초)을 넘기면 진행 중인 호출을 취소하고 timeout 으로 기록합니다.
+    """
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(_dispatch(operation), timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"Platform {operation} task timed out after {timeout}s")
+        result = {
+            "status": "timeout",
+            "error": f"Timed out after {timeout}s",
+            "operation": operation,
+        }
+    SCHEDULER_TASK_DURATION.observe(time.perf_counter() - started, task_type=operation)
+    SCHEDULER_TASK_RUNS.inc(task_type=operation, outcome=result["status"])
+    return result
+
+
+async def _dispatch(operation: str) -> Dict[str, Any]:
+    if settings.SCHEDULER_RUN_MODE == "per_platform":
+        return await _dispatch_per_platform(operation)
+
     try:
-        response = await client.post(f"{base_url}/run/{operation}")
+        data = await platform_services.dispatch_platform_operation(
+            operation, trigger="scheduled"
+        )
+        logger.info(f"Platform {operation} task executed successfully")
+        logger.debug("Response: %s", data)
+        return {
+            "status": "success",
+            "data": data,
+            "operation": operation,
+        }
+    except HTTPException as e:
+        error_msg = f"Failed to execute {operation} task. Status: {e.status_code}"
+        logger.error(error_msg)
+        logger.error(f"Error: {e.detail}")
+        return {
+            "status": "error",
+            "error": e.detail,
+            "status_code": e.status_code,
+            "operation": operation,
+        }
+    except Exception as e:
+        error_msg = f"Error in {operation} task call: {str(e)}"
+        logger.error(error_msg)
+        return {"status": "error", "error": str(e), "operation": operation}
+
 
-        if response.status_code == 200:
-            logger.info(f"Platform {operation} task executed successfully")
-            logger.info(f"Response: {response.json()}")
+async def _dispatch_per_platform(operation: str) -> Dict[str, Any]:
+    """활성 플랫폼별로 병렬 실행 (하나라도 실패하면 error)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            response = await platform_services.dispatch_platform_fanout(
+                db, RunRequest(type=operation), trigger="scheduled"
+            )
+        data = response.model_dump()
+        if response.failed:
+            logger.error(
+                f"Platform {operation} task failed for {response.failed} platforms"
+            )
             return {
-                "status": "success",
-                "data": response.json(),
+                "status": "error",
+                "error": f"{response.failed} of {response.total} platforms failed",
+                "data": data,
                 "operation": operation,
             }
-        else:
-            error_msg = (
-                f"Failed to execute {operation} task. Status: {response.status_code}"
-            )
-            logger.error(error_msg)
-            logger.error(f"Error: {response.text}")
-            return {"status": "error", "error": response.text, "operation": operation}
-
+        logger.info(f"Platform {operation} task executed successfully")
+        return {"status": "success", "data": data, "operation": operation}
     except Exception as e:
-        error_msg = f"Error in {operation} API call: {str(e)}"
-        logger.error(error_msg)
+        logger.error(f"Error in {operation} task call: {str(e)}")
         return {"status": "error", "error": str(e), "operation": operation}
 
 
-async def execute_scheduled_task():
-    """스케줄러에 의해 실행되는 작업"""
+async def execute_scheduled_task(task_type: str):
+    """스케줄러에 의해 task_type 별로 실행되는 작업"""
+    if not leader_elector.is_leader:
+        SCHEDULER_TICKS_SKIPPED.inc(task_type=task_type, reason="not_leader")
+        logger.debug("Skipping scheduled task - this process is not the scheduler leader")
+        return {"status": "skipped", "reason": "not_leader"}
+
     try:
+        # 캐시된 설정 사용 (정상 상태에서는 설정 조회 쿼리 없음)
+        # 캐시 miss 로 시작된 트랜잭션이 Node 호출 동안 idle 로 남지 않도록 세션을 먼저 닫음
+        async with AsyncSessionLocal() as db:
+            config = await services.get_cached_config(db, task_type)
+        if not config or not config.is_active:
+            logger.info(f"{task_type} task is disabled")
+            return {"status": "disabled"}
+
+        # 이전 실행이 진행 중이거나 적응형 backoff 대상 tick 이면 건너뜀
+        skip_reason = task_throttle.try_acquire(task_type)
+        if skip_reason:
+            SCHEDULER_TICKS_SKIPPED.inc(task_type=task_type, reason=skip_reason)
+            logger.warning(f"Skipping {task_type} task ({skip_reason})")
+            return {"status": "skipped", "reason": skip_reason}
+
+        started = time.perf_counter()
+        result = {"status": "error", "operation": task_type}
+        try:
+            result = await call_platform_api(task_type, config.timeout_seconds)
+        finally:
+            task_throttle.release(
+                task_type,
+                time.perf_counter() - started,
+                ok=result["status"] == "success",
+            )
+            SCHEDULER_INTERVAL_MULTIPLIER.set(
+                task_throttle.multiplier(task_type), task_type=task_type
+            )
+
         async with AsyncSessionLocal() as db:
-            valid_enabled = await services.is_task_enabled(db, "valid")
-            sync_enabled = await services.is_task_enabled(db, "sync")
-
-            tasks = []
-            async with httpx.AsyncClient() as client:
-                if valid_enabled:
-                    tasks.append(call_platform_api(client, "valid"))
-                if sync_enabled:
-                    tasks.append(call_platform_api(client, "sync"))
-
-                if not tasks:
-                    logger.info("All scheduled tasks are disabled")
-                    return
-
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # 결과 처리 및 last_run 업데이트
-                for i, result in enumerate(results):
-                    task_type = "valid" if i == 0 and valid_enabled else "sync"
-                    if isinstance(result, Exception):
-                        logger.error(f"Task execution failed: {str(result)}")
-                    else:
-                        await repositories.update_last_run(db, task_type)
-                        logger.info(f"{task_type} task completed successfully")
-
-                return {
-                    "valid": results[0] if valid_enabled else {"status": "disabled"},
-                    "sync": results[-1] if sync_enabled else {"status": "disabled"},
-                }
+            await repositories.update_last_run(db, task_type)
+        logger.info(f"{task_type} task completed with status {result['status']}")
+        return result
 
     except Exception as e:
-        logger.error(f"Error in scheduled task execution: {str(e)}")
+        logger.error(f"Error in scheduled {task_type} task execution: {str(e)}")
         return {"error": str(e)}
@@ -0,0 +1,91 @@
+# scheduler/throttle.py
+# 스케줄러 작업 중복 실행 방지 및 적응형 주기 조절
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from config.logging_config import logger
+from config.settings import settings
+
+
+class TaskThrottle:
+    """task_type 별 실행 중 여부와 최근 실행 결과로 tick 실행 여부를 결정
+
+    - 이전 실행이 끝나지 않았으면 tick 을 건너뜀 (overlap)
+    - 적응형 모드에서는 최근 평균 실행 시간이나 실패율이 임계값을 넘으면 배수를 두 배로 늘려
+      배수만큼의 tick 중 하나만 실행하고(backoff), 정상으로 돌아오면 배수를 절반씩 줄입니다.
+      tick 단위로 조절하므로 interval/cron trigger 모두에 적용됩니다.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, float] = {}
+        self._history: Dict[str, Deque[Tuple[float, bool]]] = {}
+        self._multiplier: Dict[str, int] = {}
+        self._skipped: Dict[str, int] = {}
+
+    def multiplier(self, task_type: str) -> int:
+        return self._multiplier.get(task_type, 1)
+
+    def is_running(self, task_type: str) -> bool:
+        return task_type in self._in_flight
+
+    def try_acquire(self, task_type: str) -> Optional[str]:
+        """실행 가능하면 실행 중으로 표시하고 None, 아니면 건너뛴 이유를 반환"""
+        if task_type in self._in_flight:
+            return "overlap"
+
+        if settings.SCHEDULER_ADAPTIVE_ENABLED:
+            skipped = self._skipped.get(task_type, 0)
+            if skipped + 1 < self.multiplier(task_type):
+                self._skipped[task_type] = skipped + 1
+                return "backoff"
+
+        self._skipped[task_type] = 0
+        self._in_flight[task_type] = time.monotonic()
+        return None
+
+    def release(self, task_type: str, duration: float, ok: bool) -> None:
+        """실행 종료 기록 및 적응형 배수 갱신"""
+        self._in_flight.pop(task_type, None)
+
+        history = self._history.get(task_type)
+        if history is None:
+            history = self._history[task_type] = deque(
+                maxlen=settings.SCHEDULER_ADAPTIVE_WINDOW
+            )
+        history.append((duration, ok))
+
+        if settings.SCHEDULER_ADAPTIVE_ENABLED:
+            self._adjust(task_type, history)
+
+    def _adjust(self, task_type: str, history: Deque[Tuple[float, bool]]) -> None:
+        avg_duration = sum(duration for duration, _ in history) / len(history)
+        failure_rate = sum(1 for _, ok in history if not ok) / len(history)
+        current = self.multiplier(task_type)
+
+        if (
+            avg_duration > settings.SCHEDULER_ADAPTIVE_SLOW_SECONDS
+            or failure_rate > settings.SCHEDULER_ADAPTIVE_FAILURE_RATE
+        ):
+            new = min(current * 2, settings.SCHEDULER_ADAPTIVE_MAX_MULTIPLIER)
+        else:
+            new = max(current // 2, 1)
+
+        if new != current:
+            self._multiplier[task_type] = new
+            logger.warning(
+                f"Adaptive interval for {task_type} task changed x{current} -> x{new} "
+                f"(avg {avg_duration:.1f}s, failure rate {failure_rate:.0%})"
+            )
+
+    def stats(self, task_type: str) -> Dict[str, Any]:
+        started = self._in_flight.get(task_type)
+        return {
+            "running": started is not None,
+            "running_seconds": (time.monotonic() - started) if started else None,
+            "interval_multiplier": self.multiplier(task_type),
+        }
+
+
+# 글로벌 인스턴스
+task_throttle = TaskThrottle()
@@ -0,0 +1,17 @@
+# scheduler/triggers.py
+# scheduler_config 행으로부터 APScheduler trigger 생성
+
+from typing import Optional
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+
+def build_trigger(cron_expression: Optional[str], interval_seconds: int) -> BaseTrigger:
+    """cron_expression 이 있으면 crontab 형식, 없으면 interval_seconds 주기 (잘못된 값은 ValueError)"""
+    if cron_expression:
+        return CronTrigger.from_crontab(cron_expression)
+    if not interval_seconds or interval_seconds < 1:
+        raise ValueError("interval_seconds must be at least 1")
+    return IntervalTrigger(seconds=interval_seconds)
+
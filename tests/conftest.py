@@ -0,0 +1,43 @@
+# tests/conftest.py
+# 단위 테스트 공통 설정: 필수 환경 변수 기본값 (DB/Node.js 에는 연결하지 않음)
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("NODE_ENV", "test")
+for name in (
+    "DB_USER",
+    "DB_PASSWORD",
+    "DB_HOST",
+    "DB_NAME",
+    "PYTHONPATH",
+    "NODE_APP_NAME",
+    "HOST_USER",
+):
+    os.environ.setdefault(name, "test")
+
+
+class FakeClock:
+    """time 모듈 대신 주입하는 수동 시계"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
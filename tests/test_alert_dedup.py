@@ -0,0 +1,74 @@
+# tests/test_alert_dedup.py
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from api.webhooks import dedup
+from api.webhooks.dedup import AlertDeduplicator
+from config.settings import settings
+
+
+def _alert(fingerprint: str, status: str = "firing"):
+    return SimpleNamespace(fingerprint=fingerprint, status=status)
+
+
+@pytest.fixture
+def db(monkeypatch, clock):
+    """claimed 에 없는 키는 다른 레플리카가 seen_ago 초 전에 선점한 것으로 처리"""
+    state = SimpleNamespace(claimed=set(), seen_ago=0, queries=0)
+
+    async def claim_alert_keys(db, keys, now, cutoff):
+        if keys:
+            state.queries += 1
+        state.now = now
+        return {key for key in keys if key in state.claimed}
+
+    async def get_alert_keys_last_seen(db, keys):
+        if keys:
+            state.queries += 1
+        return {key: state.now - timedelta(seconds=state.seen_ago) for key in keys}
+
+    monkeypatch.setattr(dedup, "time", clock)
+    monkeypatch.setattr(dedup, "claim_alert_keys", claim_alert_keys)
+    monkeypatch.setattr(dedup, "get_alert_keys_last_seen", get_alert_keys_last_seen)
+    monkeypatch.setattr(settings, "ALERT_DEDUP_WINDOW", 3600)
+    monkeypatch.setattr(settings, "ALERT_DEDUP_CACHE_SIZE", 100)
+    return state
+
+
+def test_counts_only_when_remembered(db):
+    deduplicator = AlertDeduplicator()
+    db.claimed = {("a", "firing")}
+
+    alerts, claimed = asyncio.run(
+        deduplicator.filter_new(None, [_alert("a"), _alert("a")])
+    )
+
+    assert [alert.fingerprint for alert in alerts] == ["a"]
+    assert deduplicator.stats()["forwarded"] == 0
+
+    deduplicator.remember(claimed, forwarded=1, suppressed=1)
+    stats = deduplicator.stats()
+    assert (stats["forwarded"], stats["suppressed"]) == (1, 1)
+
+
+def test_lost_claims_are_cached_until_the_window_ends(db, clock):
+    deduplicator = AlertDeduplicator()
+    db.seen_ago = 3000
+
+    alerts, _ = asyncio.run(deduplicator.filter_new(None, [_alert("b")]))
+    assert alerts == []
+    assert db.queries == 2
+
+    # 남은 억제 구간(600초) 동안은 DB 를 다시 조회하지 않음
+    clock.advance(599)
+    asyncio.run(deduplicator.filter_new(None, [_alert("b")]))
+    assert db.queries == 2
+
+    clock.advance(2)
+    db.claimed = {("b", "firing")}
+    alerts, _ = asyncio.run(deduplicator.filter_new(None, [_alert("b")]))
+    assert [alert.fingerprint for alert in alerts] == ["b"]
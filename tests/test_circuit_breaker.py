@@ -0,0 +1,122 @@
+# tests/test_circuit_breaker.py
+
+import pytest
+
+from api.platform import circuit_breaker
+from api.platform.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from config.settings import settings
+
+
+@pytest.fixture
+def breaker(monkeypatch, clock):
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    monkeypatch.setattr(settings, "PLATFORM_CB_ENABLED", True)
+    monkeypatch.setattr(settings, "PLATFORM_CB_WINDOW_SIZE", 10)
+    monkeypatch.setattr(settings, "PLATFORM_CB_MIN_CALLS", 4)
+    monkeypatch.setattr(settings, "PLATFORM_CB_FAILURE_RATE", 0.5)
+    monkeypatch.setattr(settings, "PLATFORM_CB_CONSECUTIVE_FAILURES", 3)
+    monkeypatch.setattr(settings, "PLATFORM_CB_OPEN_SECONDS", 30.0)
+    return CircuitBreaker("test")
+
+
+def _open(breaker):
+    for _ in range(settings.PLATFORM_CB_CONSECUTIVE_FAILURES):
+        breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_consecutive_failures_open_the_circuit(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as exc:
+        breaker.before_call()
+    assert exc.value.retry_after == pytest.approx(30.0)
+    assert breaker.rejected == 1
+
+
+def test_success_resets_consecutive_failures(breaker, monkeypatch):
+    monkeypatch.setattr(settings, "PLATFORM_CB_MIN_CALLS", 100)
+    for outcome in (False, False, True, False, False):
+        breaker.record_success() if outcome else breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_failure_rate_opens_after_min_calls(breaker, monkeypatch):
+    monkeypatch.setattr(settings, "PLATFORM_CB_CONSECUTIVE_FAILURES", 100)
+
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+    # 4번째 호출에서 최소 호출 수를 채우고 실패율 0.5 도달
+    breaker.record_failure()
+    assert breaker.failure_rate() == pytest.approx(0.5)
+    assert breaker.state == OPEN
+
+
+def test_half_open_allows_a_single_probe(breaker, clock):
+    _open(breaker)
+    clock.advance(30.0)
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_the_circuit(breaker, clock):
+    _open(breaker)
+    clock.advance(30.0)
+    breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_stale_probe_is_replaced(breaker, clock):
+    _open(breaker)
+    clock.advance(30.0)
+    breaker.before_call()
+
+    # probe 결과가 기록되지 않은 채(취소 등) probe 간격이 지나면 새 probe 를 허용
+    clock.advance(10.0)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.advance(20.0)
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_reset_closes_the_circuit(breaker):
+    _open(breaker)
+    breaker.reset()
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate() == 0.0
+    breaker.before_call()
+
+
+def test_disabled_breaker_never_opens(breaker, monkeypatch):
+    monkeypatch.setattr(settings, "PLATFORM_CB_ENABLED", False)
+    for _ in range(10):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.before_call()
@@ -0,0 +1,88 @@
+# tests/test_grafana_cache.py
+
+import asyncio
+
+import pytest
+
+from api.webhooks import grafana_cache
+from api.webhooks.grafana_cache import ContactPointCache
+from config.settings import settings
+
+
+class FakeGrafanaClient:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    async def get_contact_points_if_changed(self, etag=None):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("grafana down")
+        return [{"uid": "a"}], '"v1"'
+
+
+@pytest.fixture
+def cache(monkeypatch, clock):
+    monkeypatch.setattr(grafana_cache, "time", clock)
+    monkeypatch.setattr(settings, "GRAFANA_CONTACT_POINTS_TTL", 60)
+    monkeypatch.setattr(settings, "GRAFANA_CONTACT_POINTS_STALE_TTL", 600)
+    monkeypatch.setattr(settings, "GRAFANA_CONTACT_POINTS_RETRY_BASE", 5.0)
+    monkeypatch.setattr(settings, "GRAFANA_CONTACT_POINTS_RETRY_MAX", 20.0)
+    cache = ContactPointCache()
+    cache._client = FakeGrafanaClient()
+    return cache
+
+
+async def _get(cache):
+    data = await cache.get()
+    # 백그라운드 갱신이 있으면 끝날 때까지 대기
+    if cache._refresh is not None:
+        await asyncio.gather(cache._refresh, return_exceptions=True)
+    return data
+
+
+def test_failed_refresh_backs_off(cache, clock):
+    async def scenario():
+        client = cache._client
+        assert await _get(cache) == [{"uid": "a"}]
+
+        # TTL 경과 후 백그라운드 갱신 실패
+        client.fail = True
+        clock.advance(61)
+        assert await _get(cache) == [{"uid": "a"}]
+        assert client.calls == 2
+
+        # 대기 시간(5초) 동안은 Grafana 를 다시 호출하지 않고 stale 캐시 반환
+        for _ in range(3):
+            assert await _get(cache) == [{"uid": "a"}]
+        assert client.calls == 2
+        assert cache.stats()["consecutive_failures"] == 1
+
+        # 대기 후 재시도, 다시 실패하면 대기 시간이 두 배(10초)
+        clock.advance(5)
+        await _get(cache)
+        assert client.calls == 3
+        clock.advance(5)
+        await _get(cache)
+        assert client.calls == 3
+
+        # 복구되면 실패 상태 초기화
+        client.fail = False
+        clock.advance(5)
+        await _get(cache)
+        assert client.calls == 4
+        assert cache.stats()["consecutive_failures"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_backoff_without_cached_data_raises(cache):
+    async def scenario():
+        cache._client.fail = True
+        with pytest.raises(ConnectionError):
+            await cache.get()
+        with pytest.raises(RuntimeError, match="grafana down"):
+            await cache.get()
+        assert cache._client.calls == 1
+
+    asyncio.run(scenario())
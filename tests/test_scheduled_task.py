@@ -0,0 +1,73 @@
+# tests/test_scheduled_task.py
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from scheduler import tasks
+
+
+class FakeSession:
+    def __init__(self, events):
+        self.events = events
+
+    async def __aenter__(self):
+        self.events.append("open")
+        return self
+
+    async def __aexit__(self, *exc):
+        self.events.append("close")
+
+
+@pytest.fixture
+def events(monkeypatch):
+    events = []
+
+    async def get_cached_config(db, task_type):
+        events.append("config")
+        return SimpleNamespace(is_active=True, timeout_seconds=5)
+
+    async def call_platform_api(task_type, timeout):
+        events.append("call")
+        return {"status": "success", "operation": task_type}
+
+    async def update_last_run(db, task_type):
+        events.append("last_run")
+
+    monkeypatch.setattr(tasks, "AsyncSessionLocal", lambda: FakeSession(events))
+    monkeypatch.setattr(tasks.leader_elector, "is_leader", True)
+    monkeypatch.setattr(tasks.services, "get_cached_config", get_cached_config)
+    monkeypatch.setattr(tasks, "call_platform_api", call_platform_api)
+    monkeypatch.setattr(tasks.repositories, "update_last_run", update_last_run)
+    return events
+
+
+def test_no_session_is_held_during_the_platform_call(events):
+    result = asyncio.run(tasks.execute_scheduled_task("sync"))
+
+    assert result["status"] == "success"
+    assert events == ["open", "config", "close", "call", "open", "last_run", "close"]
+
+
+def test_maintenance_jobs_keep_their_next_run_time_across_restarts(monkeypatch):
+    async def scenario():
+        scheduler = tasks.AsyncIOScheduler()
+        monkeypatch.setattr(tasks, "scheduler", scheduler)
+        scheduler.start(paused=True)
+        try:
+            tasks._schedule_maintenance_jobs()
+            first = {job.id: job.next_run_time for job in scheduler.get_jobs()}
+
+            await asyncio.sleep(0.01)
+            tasks._schedule_maintenance_jobs()
+            assert {job.id: job.next_run_time for job in scheduler.get_jobs()} == first
+
+            monkeypatch.setattr(tasks.settings, "SCHEDULER_CONFIG_SYNC_INTERVAL", 45)
+            tasks._schedule_maintenance_jobs()
+            job = scheduler.get_job(tasks.CONFIG_SYNC_JOB_ID)
+            assert str(job.trigger) == "interval[0:00:45]"
+        finally:
+            scheduler.shutdown(wait=False)
+
+    asyncio.run(scenario())
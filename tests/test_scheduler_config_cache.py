@@ -0,0 +1,69 @@
+# tests/test_scheduler_config_cache.py
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from api.scheduler_config import cache as config_cache
+from api.scheduler_config.cache import SchedulerConfigCache
+from config.settings import settings
+
+
+def _config(task_type: str, is_active: bool = True):
+    now = datetime(2026, 1, 1)
+    return SimpleNamespace(
+        id=1,
+        task_type=task_type,
+        is_active=is_active,
+        interval_seconds=60,
+        cron_expression=None,
+        timeout_seconds=None,
+        last_run=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def queries(monkeypatch, clock):
+    calls = []
+
+    async def get_scheduler_configs(db):
+        calls.append(db)
+        return [_config("sync")]
+
+    monkeypatch.setattr(config_cache, "time", clock)
+    monkeypatch.setattr(settings, "SCHEDULER_CONFIG_CACHE_TTL", 300)
+    monkeypatch.setattr(
+        config_cache.repositories, "get_scheduler_configs", get_scheduler_configs
+    )
+    return calls
+
+
+def test_replace_serves_reads_without_querying(queries, clock):
+    cache = SchedulerConfigCache()
+    cache.replace([_config("sync"), _config("valid", is_active=False)])
+
+    clock.advance(299)
+    configs = asyncio.run(cache.get_all(None))
+
+    assert sorted(configs) == ["sync", "valid"]
+    assert asyncio.run(cache.get_enabled_task_types(None)) == ["sync"]
+    assert queries == []
+
+
+def test_replace_restarts_ttl(queries, clock):
+    cache = SchedulerConfigCache()
+    cache.replace([_config("sync")])
+    clock.advance(200)
+    cache.replace([_config("sync"), _config("valid")])
+
+    clock.advance(200)
+    asyncio.run(cache.get_all(None))
+    assert queries == []
+
+    clock.advance(100)
+    assert sorted(asyncio.run(cache.get_all(None))) == ["sync"]
+    assert len(queries) == 1
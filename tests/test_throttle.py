@@ -0,0 +1,67 @@
+# tests/test_throttle.py
+
+import pytest
+
+from config.settings import settings
+from scheduler import throttle
+from scheduler.throttle import TaskThrottle
+
+
+@pytest.fixture
+def task_throttle(monkeypatch, clock):
+    monkeypatch.setattr(throttle, "time", clock)
+    monkeypatch.setattr(settings, "SCHEDULER_ADAPTIVE_ENABLED", True)
+    monkeypatch.setattr(settings, "SCHEDULER_ADAPTIVE_WINDOW", 1)
+    monkeypatch.setattr(settings, "SCHEDULER_ADAPTIVE_SLOW_SECONDS", 10.0)
+    monkeypatch.setattr(settings, "SCHEDULER_ADAPTIVE_FAILURE_RATE", 0.5)
+    monkeypatch.setattr(settings, "SCHEDULER_ADAPTIVE_MAX_MULTIPLIER", 4)
+    return TaskThrottle()
+
+
+def test_overlapping_tick_is_skipped(task_throttle):
+    assert task_throttle.try_acquire("sync") is None
+    assert task_throttle.is_running("sync")
+    assert task_throttle.try_acquire("sync") == "overlap"
+    # 다른 task_type 은 영향 없음
+    assert task_throttle.try_acquire("valid") is None
+
+    task_throttle.release("sync", 1.0, ok=True)
+    assert not task_throttle.is_running("sync")
+    assert task_throttle.try_acquire("sync") is None
+
+
+def test_slow_runs_back_off_and_recover(task_throttle):
+    task_throttle.try_acquire("sync")
+    task_throttle.release("sync", 20.0, ok=True)
+    assert task_throttle.multiplier("sync") == 2
+
+    # 배수 2: 두 tick 중 하나만 실행
+    assert task_throttle.try_acquire("sync") == "backoff"
+    assert task_throttle.try_acquire("sync") is None
+
+    task_throttle.release("sync", 1.0, ok=True)
+    assert task_throttle.multiplier("sync") == 1
+    assert task_throttle.try_acquire("sync") is None
+
+
+def test_failures_back_off_up_to_the_cap(task_throttle):
+    for _ in range(5):
+        task_throttle.release("sync", 1.0, ok=False)
+    assert task_throttle.multiplier("sync") == 4
+
+
+def test_adaptive_disabled_keeps_every_tick(task_throttle, monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULER_ADAPTIVE_ENABLED", False)
+    task_throttle.try_acquire("sync")
+    task_throttle.release("sync", 20.0, ok=False)
+    assert task_throttle.multiplier("sync") == 1
+    assert task_throttle.try_acquire("sync") is None
+
+
+def test_stats_reports_running_time(task_throttle, clock):
+    task_throttle.try_acquire("sync")
+    clock.advance(3.0)
+    stats = task_throttle.stats("sync")
+    assert stats["running"] is True
+    assert stats["running_seconds"] == pytest.approx(3.0)
+    assert stats["interval_multiplier"] == 1
@@ -0,0 +1,29 @@
+# tests/test_webhook_cursor.py
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from api.webhooks.services import decode_webhook_cursor, encode_webhook_cursor
+
+
+def test_cursor_round_trip():
+    webhook = SimpleNamespace(created_at=datetime(2026, 10, 18, 12, 30, 5, 123456), id=42)
+    cursor = encode_webhook_cursor(webhook)
+    assert decode_webhook_cursor(cursor) == (webhook.created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "42", "not-a-date,42", "2026-10-18T00:00:00,abc"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_webhook_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_cursor_with_timezone_is_converted_to_naive_utc():
+    assert decode_webhook_cursor("2026-10-18T09:00:00+09:00,7") == (
+        datetime(2026, 10, 18, 0, 0, 0),
+        7,
+    )
@@ -0,0 +1,18 @@
+# tests/test_webhook_filter.py
+
+from datetime import datetime
+
+from api.webhooks.schemas import WebhookFilter
+
+
+def test_aware_bounds_are_converted_to_naive_utc():
+    filters = WebhookFilter(since="2026-10-01T00:00:00Z", until="2026-10-02T09:00:00+09:00")
+    assert filters.since == datetime(2026, 10, 1, 0, 0, 0)
+    assert filters.until == datetime(2026, 10, 2, 0, 0, 0)
+    assert filters.since.tzinfo is None and filters.until.tzinfo is None
+
+
+def test_naive_bounds_are_kept_as_utc():
+    filters = WebhookFilter(since=datetime(2026, 10, 1, 12, 0))
+    assert filters.since == datetime(2026, 10, 1, 12, 0)
+    assert filters.until is None
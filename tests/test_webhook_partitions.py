@@ -0,0 +1,35 @@
+# tests/test_webhook_partitions.py
+
+from datetime import date
+
+import pytest
+
+from api.webhooks.partitions import _PARTITION_NAME, month_start, partition_name
+
+
+@pytest.mark.parametrize(
+    "value, offset, expected",
+    [
+        (date(2026, 10, 18), 0, date(2026, 10, 1)),
+        (date(2026, 10, 18), 1, date(2026, 11, 1)),
+        (date(2026, 12, 31), 1, date(2027, 1, 1)),
+        (date(2026, 1, 31), -1, date(2025, 12, 1)),
+        (date(2026, 3, 1), -14, date(2025, 1, 1)),
+        (date(2026, 3, 1), 24, date(2028, 3, 1)),
+    ],
+)
+def test_month_start(value, offset, expected):
+    assert month_start(value, offset) == expected
+
+
+def test_partition_name_round_trips():
+    name = partition_name(date(2026, 3, 1))
+    assert name == "webhooks_2026_03"
+
+    match = _PARTITION_NAME.match(name)
+    assert match is not None
+    assert date(int(match.group(1)), int(match.group(2)), 1) == date(2026, 3, 1)
+
+
+def test_default_partition_is_not_a_month_partition():
+    assert _PARTITION_NAME.match("webhooks_default") is None